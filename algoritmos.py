@@ -5,9 +5,16 @@ Incluye algoritmos de búsqueda Minimax y Minimax con poda Alfa-Beta.
 """
 import math
 import random
+import time
 from configuracion import *
-from tablero import Tablero
+from tablero import Tablero, EstadoNodo
 from jugador import Jugador
+from transposicion import TablaTransposicion, EXACTA, COTA_INFERIOR, COTA_SUPERIOR
+from zobrist import clave_con_turno
+from ordenamiento import OrdenadorMovimientos
+from libro_aperturas import LibroAperturas
+from tablas_finales import TablasFinales
+from evaluacion_lotes import NUMPY_DISPONIBLE, EvaluadorLotes, codificar_hijos
 
 
 class ConfiguracionIA:
@@ -25,8 +32,13 @@ class ConfiguracionIA:
     def obtener_nivel_actual(self):
         return NIVELES_DIFICULTAD[self.nivel_actual]
     
-    def obtener_profundidad(self):
-        return NIVELES_DIFICULTAD[self.nivel_actual]["profundidad"]
+    def obtener_profundidad(self, quiescencia=False):
+        """Profundidad del nivel; con quiescencia, la de su entrada profundidad_quiescencia."""
+        nivel = NIVELES_DIFICULTAD[self.nivel_actual]
+        return nivel.get("profundidad_quiescencia", nivel["profundidad"]) if quiescencia else nivel["profundidad"]
+    
+    def obtener_tiempo_ms(self):
+        return NIVELES_DIFICULTAD[self.nivel_actual]["tiempo_ms"]
     
     def debe_cometer_error(self):
         probabilidad_error = NIVELES_DIFICULTAD[self.nivel_actual]["error_probabilidad"]
@@ -37,45 +49,33 @@ class EvaluadorTablero:
     """Evalúa la utilidad de un estado del tablero."""
     
     @staticmethod
-    def calcular_utilidad(tablero, jugador_para_evaluar):
+    def calcular_utilidad(tablero, jugador_para_evaluar, estado=None):
         """
         Calcula la utilidad heurística del tablero.
         Valor positivo significa ventaja para BLANCO, negativo para NEGRO.
+        estado es el EstadoNodo ya calculado por la búsqueda, si lo hay.
         """
-        ganador = tablero.determinar_ganador(jugador_para_evaluar)
+        if estado is None:
+            estado = tablero.analizar_nodo(jugador_para_evaluar)
+        
+        ganador = estado.ganador
         if ganador == JUGADOR_BLANCO:
             return VALOR_GANADOR
         elif ganador == JUGADOR_NEGRO:
             return -VALOR_GANADOR
         
-        score_blanco = 0
-        score_negro = 0
-        
-        for fila in range(TABLERO_DIM):
-            for columna in range(TABLERO_DIM):
-                pieza = tablero.obtener_pieza(fila, columna)
-                
-                if pieza == JUGADOR_BLANCO:
-                    score_blanco += VALOR_PEON
-                    score_blanco += (TABLERO_DIM - 1 - fila) * VALOR_AVANCE
-                    
-                elif pieza == DAMA_BLANCA:
-                    score_blanco += VALOR_DAMA
-                    centro_dist = abs(fila - TABLERO_DIM//2) + abs(columna - TABLERO_DIM//2)
-                    score_blanco += (TABLERO_DIM - centro_dist) * VALOR_CENTRO
-                    
-                elif pieza == JUGADOR_NEGRO:
-                    score_negro += VALOR_PEON
-                    score_negro += fila * VALOR_AVANCE
-                    
-                elif pieza == DAMA_NEGRA:
-                    score_negro += VALOR_DAMA
-                    centro_dist = abs(fila - TABLERO_DIM//2) + abs(columna - TABLERO_DIM//2)
-                    score_negro += (TABLERO_DIM - centro_dist) * VALOR_CENTRO
+        # Material, avance y centralidad: el tablero los mantiene al aplicar movimientos
+        score_blanco, score_negro = tablero.obtener_puntajes()
         
         try:
-            movimientos_blanco = len(tablero.movimientos_disponibles(JUGADOR_BLANCO))
-            movimientos_negro = len(tablero.movimientos_disponibles(JUGADOR_NEGRO))
+            oponente = tablero.obtener_jugador_oponente(jugador_para_evaluar)
+            movimientos_propios = len(estado.movimientos)
+            movimientos_oponente = len(tablero.movimientos_disponibles(oponente))
+            
+            if jugador_para_evaluar == JUGADOR_BLANCO:
+                movimientos_blanco, movimientos_negro = movimientos_propios, movimientos_oponente
+            else:
+                movimientos_blanco, movimientos_negro = movimientos_oponente, movimientos_propios
             
             score_blanco += movimientos_blanco * VALOR_MOVILIDAD
             score_negro += movimientos_negro * VALOR_MOVILIDAD
@@ -86,24 +86,283 @@ class EvaluadorTablero:
         return score_blanco - score_negro
 
 
-class AlgoritmoMinimax:
-    """Implementa el algoritmo Minimax básico."""
+class BusquedaInterrumpida(Exception):
+    """Se lanza dentro de la búsqueda cuando se agota el tiempo asignado."""
+
+
+class EstadisticasBusqueda:
+    """
+    Contadores de la búsqueda de un movimiento.
+    iteraciones es una lista de (profundidad, segundos, nodos acumulados),
+    una por búsqueda completa (varias con profundización iterativa).
+    nodos_quiescencia cuenta aparte los nodos de la búsqueda de quiescencia;
+    profundidad_maxima incluye los plies que esta añade al horizonte.
+    """
+    
+    def __init__(self, nodos=0, evaluaciones=0, cortes=0, profundidad_maxima=0, iteraciones=(),
+                 nodos_quiescencia=0):
+        self.nodos = nodos
+        self.evaluaciones = evaluaciones
+        self.cortes = cortes
+        self.profundidad_maxima = profundidad_maxima
+        self.iteraciones = list(iteraciones)
+        self.nodos_quiescencia = nodos_quiescencia
+    
+    @property
+    def segundos(self):
+        return sum(segundos for _, segundos, _ in self.iteraciones)
+    
+    @property
+    def nodos_por_segundo(self):
+        return self.nodos / self.segundos if self.segundos > 0 else 0.0
+    
+    @property
+    def factor_ramificacion(self):
+        """Factor de ramificación efectivo: nodos ** (1 / profundidad máxima)."""
+        if self.profundidad_maxima == 0 or self.nodos <= 1:
+            return 0.0
+        return self.nodos ** (1 / self.profundidad_maxima)
+    
+    def como_diccionario(self):
+        """Retorna las estadísticas como diccionario serializable (JSON, pickle)."""
+        return {
+            "nodos": self.nodos,
+            "evaluaciones": self.evaluaciones,
+            "cortes": self.cortes,
+            "profundidad_maxima": self.profundidad_maxima,
+            "factor_ramificacion": self.factor_ramificacion,
+            "segundos": self.segundos,
+            "nodos_por_segundo": self.nodos_por_segundo,
+            "iteraciones": [list(iteracion) for iteracion in self.iteraciones],
+            "nodos_quiescencia": self.nodos_quiescencia,
+        }
+
+
+class AlgoritmoBusqueda:
+    """
+    Base común de los algoritmos de búsqueda.
+    Con hacer_deshacer=True la búsqueda modifica un único tablero con
+    hacer_movimiento/deshacer_movimiento en lugar de crear uno por nodo.
+    limite_tiempo y senal_parada permiten abortarla desde fuera.
+    Con quiescencia=True las hojas con capturas pendientes no se evalúan
+    hasta resolverlas (ver _quiescencia). Con evaluacion_lotes=True (requiere
+    NumPy) los hijos de los nodos a profundidad 1 se evalúan juntos con un
+    EvaluadorLotes.
+    Cuenta nodos, evaluaciones de hojas, cortes y profundidad alcanzada
+    de cada movimiento; obtener_estadisticas() los reúne.
+    """
     
-    def __init__(self, configuracion_ia):
+    def __init__(self, configuracion_ia, hacer_deshacer=False, quiescencia=False, evaluacion_lotes=False):
         self.config = configuracion_ia
         self.evaluador = EvaluadorTablero()
+        self.hacer_deshacer = hacer_deshacer
+        self.quiescencia = quiescencia
+        self.evaluador_lotes = None
+        if evaluacion_lotes:
+            if NUMPY_DISPONIBLE:
+                self.evaluador_lotes = EvaluadorLotes()
+            else:
+                print("Advertencia: NumPy no está instalado; se evalúa hoja a hoja.")
+        self.limite_tiempo = None  # Instante (time.perf_counter) en que se aborta la búsqueda
+        self.senal_parada = None  # Objeto con .value que, distinto de cero, aborta la búsqueda
+        self.tablas_finales = None  # TablasFinales consultadas en los nodos internos, si las hay
+        self._profundidad_raiz = 0
+        self.reiniciar_busqueda()
+    
+    def reiniciar_busqueda(self):
+        """Reinicia los contadores antes de buscar un nuevo movimiento."""
+        self.nodos_visitados = 0
+        self.evaluaciones = 0
+        self.cortes = 0
+        self.profundidad_maxima = 0
+        self.iteraciones = []
+        self.nodos_quiescencia = 0
     
     def obtener_mejor_movimiento(self, tablero, jugador_actual):
         if tablero.es_final(jugador_actual):
             return None
         
-        profundidad_maxima = self.config.obtener_profundidad()
+        self.reiniciar_busqueda()
+        profundidad = self.config.obtener_profundidad(self.quiescencia)
+        inicio = time.perf_counter()
+        _, mejor_movimiento = self.buscar(tablero, jugador_actual, profundidad)
+        self.iteraciones.append((profundidad, time.perf_counter() - inicio, self.nodos_visitados))
+        return self._aplicar_error(tablero, jugador_actual, mejor_movimiento)
+    
+    def obtener_estadisticas(self):
+        """Retorna las EstadisticasBusqueda del último movimiento buscado."""
+        return EstadisticasBusqueda(self.nodos_visitados, self.evaluaciones, self.cortes,
+                                    self.profundidad_maxima, self.iteraciones, self.nodos_quiescencia)
+    
+    def _contadores(self):
+        """Contadores que un proceso trabajador devuelve al algoritmo principal."""
+        return (self.nodos_visitados, self.evaluaciones, self.cortes, self.profundidad_maxima,
+                self.nodos_quiescencia)
+    
+    def _sumar_contadores(self, contadores, ply=0):
+        """Acumula los contadores de una búsqueda hecha en otro proceso desde el ply indicado."""
+        nodos, evaluaciones, cortes, profundidad_maxima, nodos_quiescencia = contadores
+        self.nodos_visitados += nodos
+        self.evaluaciones += evaluaciones
+        self.cortes += cortes
+        self.profundidad_maxima = max(self.profundidad_maxima, profundidad_maxima + ply)
+        self.nodos_quiescencia += nodos_quiescencia
+    
+    def _evaluar_hoja(self, tablero, jugador_turno, estado, profundidad, alfa=-math.inf, beta=math.inf):
+        """
+        Evalúa un nodo terminal u hoja y lo cuenta en las estadísticas.
+        Con quiescencia, si el jugador con el turno tiene capturas las resuelve
+        antes; el valor es entonces fail-soft respecto a (alfa, beta).
+        """
+        if (self.quiescencia and estado.ganador is None and profundidad <= 0
+                and -profundidad < QUIESCENCIA_PROFUNDIDAD_MAXIMA
+                and self.nodos_quiescencia < QUIESCENCIA_MAX_NODOS
+                and tablero.es_captura(next(iter(estado.movimientos)))):
+            return self._quiescencia(tablero, alfa, beta, jugador_turno, estado, profundidad)
         
-        if jugador_actual == JUGADOR_BLANCO:
-            _, mejor_movimiento = self._max_valor(tablero, profundidad_maxima, JUGADOR_BLANCO)
+        self.evaluaciones += 1
+        self.profundidad_maxima = max(self.profundidad_maxima, self._profundidad_raiz - profundidad)
+        return self.evaluador.calcular_utilidad(tablero, jugador_turno, estado)
+    
+    def _quiescencia(self, tablero, alfa, beta, jugador_turno, estado, profundidad):
+        """
+        Búsqueda de quiescencia: sigue las capturas pendientes más allá del
+        horizonte hasta una posición tranquila. Como capturar es obligatorio,
+        no hay opción de quedarse con la evaluación estática: se prueban todas
+        las capturas con poda Alfa-Beta. La profundidad sigue bajando por
+        debajo de 0; el recorrido termina a QUIESCENCIA_PROFUNDIDAD_MAXIMA
+        plies del horizonte o al gastar QUIESCENCIA_MAX_NODOS en la búsqueda.
+        """
+        self._verificar_tiempo()
+        maximizando = jugador_turno == JUGADOR_BLANCO
+        oponente = tablero.obtener_jugador_oponente(jugador_turno)
+        mejor_valor = -math.inf if maximizando else math.inf
+        
+        for movimiento in estado.movimientos:
+            self.nodos_quiescencia += 1
+            nuevo_tablero = self._aplicar(tablero, movimiento)
+            valor = self._evaluar_hoja(nuevo_tablero, oponente, nuevo_tablero.analizar_nodo(oponente),
+                                       profundidad - 1, alfa, beta)
+            self._revertir(tablero)
+            
+            if maximizando:
+                mejor_valor = max(mejor_valor, valor)
+                alfa = max(alfa, mejor_valor)
+            else:
+                mejor_valor = min(mejor_valor, valor)
+                beta = min(beta, mejor_valor)
+            if beta <= alfa:
+                break
+        
+        return mejor_valor
+    
+    def _consultar_tablas_finales(self, tablero, jugador_turno, profundidad):
+        """
+        Retorna el valor exacto del nodo según las tablas de finales, o None
+        si la posición no está en ellas. Las victorias más cortas valen más.
+        La raíz no se consulta: tiene que elegir un movimiento.
+        """
+        if profundidad == self._profundidad_raiz or not self.tablas_finales.disponible():
+            return None
+        piezas_blancas, piezas_negras = tablero.contar_piezas()
+        if piezas_blancas + piezas_negras > self.tablas_finales.max_piezas:
+            return None
+        
+        resultado = self.tablas_finales.consultar(tablero, jugador_turno)
+        if resultado is None:
+            return None
+        self.evaluaciones += 1
+        self.profundidad_maxima = max(self.profundidad_maxima, self._profundidad_raiz - profundidad)
+        gana, distancia = resultado
+        valor = gana * (VALOR_GANADOR - distancia)
+        return valor if jugador_turno == JUGADOR_BLANCO else -valor
+    
+    def _frontera_por_lotes(self, tablero, profundidad):
+        """
+        Indica si los hijos del nodo se evalúan por lotes: el nodo está a
+        profundidad 1 y ninguno de sus hijos puede estar en las tablas de finales.
+        """
+        if self.evaluador_lotes is None or profundidad != 1:
+            return False
+        if self.tablas_finales is not None and self.tablas_finales.disponible():
+            # Una captura quita una pieza: los hijos pueden tener una menos
+            return sum(tablero.contar_piezas()) > self.tablas_finales.max_piezas + 1
+        return True
+    
+    def _valor_frontera(self, tablero, alfa, beta, jugador_turno, estado):
+        """
+        Valor de un nodo a profundidad 1 con movimientos: todos sus hijos son
+        hojas, así que se evalúan con una sola llamada al EvaluadorLotes en
+        lugar de visitarlos uno a uno. Las hojas con capturas pendientes pasan
+        después por la quiescencia, si está activa, con poda Alfa-Beta entre
+        ellas; el valor es fail-soft respecto a (alfa, beta).
+        Retorna (valor, mejor_movimiento, indice del mejor movimiento).
+        """
+        movimientos = list(estado.movimientos)
+        oponente = tablero.obtener_jugador_oponente(jugador_turno)
+        signo = 1 if jugador_turno == JUGADOR_BLANCO else -1
+        self.nodos_visitados += len(movimientos)
+        if len(movimientos) < EVALUACION_LOTES_MINIMO:
+            # Con tan pocas hojas el coste fijo de NumPy supera al de evaluarlas una a una
+            pendientes = range(len(movimientos))
+            valores = [-signo * math.inf] * len(movimientos)
         else:
-            _, mejor_movimiento = self._min_valor(tablero, profundidad_maxima, JUGADOR_NEGRO)
+            codigos = codificar_hijos(tablero.serializar(), movimientos)
+            valores, capturas = self.evaluador_lotes.evaluar(codigos, oponente, con_capturas=True)
+            valores = valores.tolist()
+            self.evaluaciones += len(movimientos)
+            self.profundidad_maxima = max(self.profundidad_maxima, self._profundidad_raiz)
+            pendientes = capturas.nonzero()[0].tolist() if self.quiescencia else []
+            if pendientes:
+                # Estas hojas se resuelven con quiescencia, con la ventana ya estrechada por las demás
+                self.evaluaciones -= len(pendientes)
+                tranquilas = [valor for valor, captura in zip(valores, capturas.tolist()) if not captura]
+                for indice in pendientes:
+                    valores[indice] = -signo * math.inf
+                if tranquilas:
+                    if signo > 0:
+                        alfa = max(alfa, max(tranquilas))
+                    else:
+                        beta = min(beta, min(tranquilas))
         
+        for indice in pendientes:
+            if beta <= alfa:
+                break  # Corte: las hojas restantes no pueden cambiar el resultado
+            nuevo_tablero = self._aplicar(tablero, movimientos[indice])
+            valores[indice] = self._evaluar_hoja(nuevo_tablero, oponente, nuevo_tablero.analizar_nodo(oponente),
+                                                 0, alfa, beta)
+            self._revertir(tablero)
+            if signo > 0:
+                alfa = max(alfa, valores[indice])
+            else:
+                beta = min(beta, valores[indice])
+        
+        indice = max(range(len(valores)), key=lambda i: signo * valores[i])
+        return valores[indice], movimientos[indice], indice
+    
+    def _verificar_tiempo(self):
+        """Lanza BusquedaInterrumpida si se superó limite_tiempo o se activó senal_parada."""
+        if self.limite_tiempo is not None and time.perf_counter() >= self.limite_tiempo:
+            raise BusquedaInterrumpida()
+        if self.senal_parada is not None and self.senal_parada.value:
+            raise BusquedaInterrumpida()
+    
+    def _preparar_tablero(self, tablero):
+        """Retorna el tablero sobre el que se busca (una copia en modo hacer/deshacer)."""
+        return tablero.copiar() if self.hacer_deshacer else tablero
+    
+    def _aplicar(self, tablero, movimiento):
+        if self.hacer_deshacer:
+            tablero.hacer_movimiento(movimiento)
+            return tablero
+        return tablero.aplicar_movimiento(movimiento)
+    
+    def _revertir(self, tablero):
+        if self.hacer_deshacer:
+            tablero.deshacer_movimiento()
+    
+    def _aplicar_error(self, tablero, jugador_actual, mejor_movimiento):
+        """Sustituye el mejor movimiento por otro al azar según el nivel de error."""
         if self.config.debe_cometer_error() and mejor_movimiento:
             movimientos_disponibles = list(tablero.movimientos_disponibles(jugador_actual))
             if len(movimientos_disponibles) > 1:
@@ -111,18 +370,37 @@ class AlgoritmoMinimax:
                 mejor_movimiento = random.choice(movimientos_disponibles)
         
         return mejor_movimiento
+
+
+class AlgoritmoMinimax(AlgoritmoBusqueda):
+    """Implementa el algoritmo Minimax básico."""
+    
+    def buscar(self, tablero, jugador_actual, profundidad):
+        """Retorna (valor, mejor_movimiento) buscando a la profundidad indicada."""
+        tablero_busqueda = self._preparar_tablero(tablero)
+        self._profundidad_raiz = profundidad
+        
+        if jugador_actual == JUGADOR_BLANCO:
+            return self._max_valor(tablero_busqueda, profundidad, JUGADOR_BLANCO)
+        return self._min_valor(tablero_busqueda, profundidad, JUGADOR_NEGRO)
     
     def _max_valor(self, tablero, profundidad, jugador_turno):
-        if tablero.es_final(jugador_turno) or profundidad == 0:
-            return self.evaluador.calcular_utilidad(tablero, jugador_turno), None
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        estado = tablero.analizar_nodo(jugador_turno)
+        if estado.ganador is not None or profundidad == 0:
+            return self._evaluar_hoja(tablero, jugador_turno, estado, profundidad), None
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._valor_frontera(tablero, -math.inf, math.inf, jugador_turno, estado)[:2]
         
         mejor_valor = -math.inf
         mejor_movimiento = None
         
-        for movimiento in tablero.movimientos_disponibles(jugador_turno):
-            nuevo_tablero = tablero.aplicar_movimiento(movimiento)
+        for movimiento in estado.movimientos:
+            nuevo_tablero = self._aplicar(tablero, movimiento)
             oponente = tablero.obtener_jugador_oponente(jugador_turno)
             valor, _ = self._min_valor(nuevo_tablero, profundidad - 1, oponente)
+            self._revertir(tablero)
             
             if valor > mejor_valor:
                 mejor_valor = valor
@@ -131,16 +409,22 @@ class AlgoritmoMinimax:
         return mejor_valor, mejor_movimiento
     
     def _min_valor(self, tablero, profundidad, jugador_turno):
-        if tablero.es_final(jugador_turno) or profundidad == 0:
-            return self.evaluador.calcular_utilidad(tablero, jugador_turno), None
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        estado = tablero.analizar_nodo(jugador_turno)
+        if estado.ganador is not None or profundidad == 0:
+            return self._evaluar_hoja(tablero, jugador_turno, estado, profundidad), None
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._valor_frontera(tablero, -math.inf, math.inf, jugador_turno, estado)[:2]
         
         mejor_valor = math.inf
         mejor_movimiento = None
         
-        for movimiento in tablero.movimientos_disponibles(jugador_turno):
-            nuevo_tablero = tablero.aplicar_movimiento(movimiento)
+        for movimiento in estado.movimientos:
+            nuevo_tablero = self._aplicar(tablero, movimiento)
             oponente = tablero.obtener_jugador_oponente(jugador_turno)
             valor, _ = self._max_valor(nuevo_tablero, profundidad - 1, oponente)
+            self._revertir(tablero)
             
             if valor < mejor_valor:
                 mejor_valor = valor
@@ -149,47 +433,170 @@ class AlgoritmoMinimax:
         return mejor_valor, mejor_movimiento
 
 
-class AlgoritmoMinimaxAlfaBeta:
-    """Implementa el algoritmo Minimax con poda Alfa-Beta."""
+class AlgoritmoMinimaxAlfaBeta(AlgoritmoBusqueda):
+    """
+    Implementa el algoritmo Minimax con poda Alfa-Beta.
+    Si recibe una TablaTransposicion, reutiliza los resultados de posiciones
+    ya buscadas; con un OrdenadorMovimientos explora primero los movimientos
+    más prometedores. Sin ellos se comporta como la poda Alfa-Beta clásica.
+    Con unas TablasFinales, los finales resueltos terminan la rama al instante.
+    """
     
-    def __init__(self, configuracion_ia):
-        self.config = configuracion_ia
-        self.evaluador = EvaluadorTablero()
+    def __init__(self, configuracion_ia, hacer_deshacer=False, tabla_transposicion=None,
+                 ordenador=None, tablas_finales=None, quiescencia=False, evaluacion_lotes=False):
+        self.tabla_transposicion = tabla_transposicion
+        self.ordenador = ordenador
+        # Reinicia también el ordenador
+        super().__init__(configuracion_ia, hacer_deshacer, quiescencia, evaluacion_lotes)
+        self.tablas_finales = tablas_finales
     
-    def obtener_mejor_movimiento(self, tablero, jugador_actual):
-        if tablero.es_final(jugador_actual):
-            return None
-        
-        profundidad_maxima = self.config.obtener_profundidad()
+    def reiniciar_busqueda(self):
+        super().reiniciar_busqueda()
+        if self.ordenador is not None:
+            self.ordenador.nueva_busqueda()
+    
+    def buscar(self, tablero, jugador_actual, profundidad, alfa=-math.inf, beta=math.inf):
+        """
+        Retorna (valor, mejor_movimiento) buscando a la profundidad indicada
+        dentro de la ventana (alfa, beta). Si el valor cae fuera de la ventana
+        es solo una cota (fail-soft).
+        Lanza BusquedaInterrumpida si se supera limite_tiempo o se activa senal_parada.
+        """
+        tablero_busqueda = self._preparar_tablero(tablero)
+        self._profundidad_raiz = profundidad
         
         if jugador_actual == JUGADOR_BLANCO:
-            _, mejor_movimiento = self._max_valor(
-                tablero, -math.inf, math.inf, profundidad_maxima, JUGADOR_BLANCO
-            )
-        else:
-            _, mejor_movimiento = self._min_valor(
-                tablero, -math.inf, math.inf, profundidad_maxima, JUGADOR_NEGRO
-            )
+            return self._max_valor(tablero_busqueda, alfa, beta, profundidad, JUGADOR_BLANCO)
+        return self._min_valor(tablero_busqueda, alfa, beta, profundidad, JUGADOR_NEGRO)
+    
+    def _consultar_tabla(self, tablero, alfa, beta, profundidad, jugador_turno):
+        """
+        Busca la posición en la tabla de transposición.
+        Retorna (clave, movimiento_tabla, resultado): movimiento_tabla es el mejor
+        movimiento guardado (para ordenar) y resultado es (valor, movimiento) si
+        la entrada basta para terminar el nodo, o None en otro caso.
+        """
+        clave = clave_con_turno(tablero.clave, jugador_turno)
+        entrada = self.tabla_transposicion.consultar(clave)
+        if entrada is None:
+            return clave, None, None
         
-        if self.config.debe_cometer_error() and mejor_movimiento:
-            movimientos_disponibles = list(tablero.movimientos_disponibles(jugador_actual))
-            if len(movimientos_disponibles) > 1:
-                movimientos_disponibles.remove(mejor_movimiento)
-                mejor_movimiento = random.choice(movimientos_disponibles)
+        if entrada.profundidad >= profundidad:
+            if (entrada.tipo == EXACTA or
+                (entrada.tipo == COTA_INFERIOR and entrada.valor >= beta) or
+                (entrada.tipo == COTA_SUPERIOR and entrada.valor <= alfa)):
+                self.tabla_transposicion.registrar_corte()
+                return clave, entrada.mejor_movimiento, (entrada.valor, entrada.mejor_movimiento)
         
-        return mejor_movimiento
+        return clave, entrada.mejor_movimiento, None
+    
+    def _movimientos_nodo(self, tablero, profundidad, jugador_turno, movimiento_tabla):
+        """
+        Retorna (estado, movimientos) del nodo; movimientos es None si es una
+        hoja o un nodo terminal. Sin ordenador, los nodos internos iteran
+        tablero.generar_movimientos y estado es None: las capturas salen
+        primero y tras un corte el resto no se genera.
+        """
+        if self.ordenador is None and profundidad > 0 and all(tablero.contar_piezas()):
+            return None, tablero.generar_movimientos(jugador_turno)
+        
+        estado = tablero.analizar_nodo(jugador_turno)
+        if estado.ganador is not None or profundidad == 0:
+            return estado, None
+        return estado, self._movimientos_ordenados(
+            tablero, estado.movimientos, profundidad, jugador_turno, movimiento_tabla
+        )
+    
+    def _evaluar_terminal(self, tablero, jugador_turno, estado, profundidad, clave,
+                          alfa=-math.inf, beta=math.inf):
+        """
+        Evalúa una hoja o un nodo terminal y la guarda en la tabla, si la hay.
+        Sin estado, el generador no produjo movimientos: pierde el jugador con el turno.
+        Con quiescencia el valor de una hoja depende de la ventana y se guarda
+        como cota cuando cae fuera de ella.
+        """
+        if estado is None:
+            piezas_blancas, piezas_negras = tablero.contar_piezas()
+            estado = EstadoNodo((), piezas_blancas, piezas_negras,
+                                tablero.obtener_jugador_oponente(jugador_turno))
+        valor = self._evaluar_hoja(tablero, jugador_turno, estado, profundidad, alfa, beta)
+        if clave is not None:
+            if self.quiescencia:
+                self._guardar_en_tabla(clave, alfa, beta, profundidad, valor, None)
+            else:
+                self.tabla_transposicion.almacenar(clave, profundidad, EXACTA, valor, None)
+        return valor, None
+    
+    def _nodo_frontera(self, tablero, alfa, beta, jugador_turno, clave):
+        """Nodo a profundidad 1 con evaluación por lotes (ver _valor_frontera)."""
+        estado = tablero.analizar_nodo(jugador_turno)
+        if estado.ganador is not None:
+            return self._evaluar_terminal(tablero, jugador_turno, estado, 1, clave)
+        
+        valor, movimiento, indice = self._valor_frontera(tablero, alfa, beta, jugador_turno, estado)
+        if (valor >= beta) if jugador_turno == JUGADOR_BLANCO else (valor <= alfa):
+            self._registrar_corte(movimiento, jugador_turno, 1, indice)
+        if clave is not None:
+            self._guardar_en_tabla(clave, alfa, beta, 1, valor, movimiento)
+        return valor, movimiento
+    
+    def _movimientos_ordenados(self, tablero, movimientos, profundidad, jugador_turno, movimiento_tabla):
+        """Retorna los movimientos del nodo, ordenados si hay un ordenador."""
+        if self.ordenador is None:
+            return movimientos
+        ply = self._profundidad_raiz - profundidad
+        return self.ordenador.ordenar(tablero, movimientos, jugador_turno, ply, movimiento_tabla)
+    
+    def _registrar_corte(self, movimiento, jugador_turno, profundidad, indice):
+        self.cortes += 1
+        if self.ordenador is not None:
+            ply = self._profundidad_raiz - profundidad
+            self.ordenador.registrar_corte(movimiento, jugador_turno, ply, profundidad, indice)
+    
+    def _guardar_en_tabla(self, clave, alfa, beta, profundidad, valor, movimiento):
+        """Guarda el resultado del nodo según la ventana (alfa, beta) con la que se buscó."""
+        if valor <= alfa:
+            tipo = COTA_SUPERIOR
+        elif valor >= beta:
+            tipo = COTA_INFERIOR
+        else:
+            tipo = EXACTA
+        self.tabla_transposicion.almacenar(clave, profundidad, tipo, valor, movimiento)
     
     def _max_valor(self, tablero, alfa, beta, profundidad, jugador_turno):
-        if tablero.es_final(jugador_turno) or profundidad == 0:
-            return self.evaluador.calcular_utilidad(tablero, jugador_turno), None
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        
+        clave = None
+        movimiento_tabla = None
+        if self.tabla_transposicion is not None:
+            clave, movimiento_tabla, resultado = self._consultar_tabla(
+                tablero, alfa, beta, profundidad, jugador_turno
+            )
+            if resultado is not None:
+                return resultado
         
+        if self.tablas_finales is not None:
+            valor = self._consultar_tablas_finales(tablero, jugador_turno, profundidad)
+            if valor is not None:
+                return valor, None
+        
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._nodo_frontera(tablero, alfa, beta, jugador_turno, clave)
+        
+        estado, movimientos = self._movimientos_nodo(tablero, profundidad, jugador_turno, movimiento_tabla)
+        if movimientos is None:
+            return self._evaluar_terminal(tablero, jugador_turno, estado, profundidad, clave, alfa, beta)
+        
+        alfa_original = alfa
         mejor_valor = -math.inf
         mejor_movimiento = None
         
-        for movimiento in tablero.movimientos_disponibles(jugador_turno):
-            nuevo_tablero = tablero.aplicar_movimiento(movimiento)
+        for indice, movimiento in enumerate(movimientos):
+            nuevo_tablero = self._aplicar(tablero, movimiento)
             oponente = tablero.obtener_jugador_oponente(jugador_turno)
             valor, _ = self._min_valor(nuevo_tablero, alfa, beta, profundidad - 1, oponente)
+            self._revertir(tablero)
             
             if valor > mejor_valor:
                 mejor_valor = valor
@@ -197,21 +604,251 @@ class AlgoritmoMinimaxAlfaBeta:
             
             alfa = max(alfa, mejor_valor)
             if beta <= alfa:
+                self._registrar_corte(movimiento, jugador_turno, profundidad, indice)
                 break
         
+        if mejor_movimiento is None:
+            return self._evaluar_terminal(tablero, jugador_turno, None, profundidad, clave)
+        
+        if clave is not None:
+            self._guardar_en_tabla(clave, alfa_original, beta, profundidad, mejor_valor, mejor_movimiento)
+        
         return mejor_valor, mejor_movimiento
     
     def _min_valor(self, tablero, alfa, beta, profundidad, jugador_turno):
-        if tablero.es_final(jugador_turno) or profundidad == 0:
-            return self.evaluador.calcular_utilidad(tablero, jugador_turno), None
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        
+        clave = None
+        movimiento_tabla = None
+        if self.tabla_transposicion is not None:
+            clave, movimiento_tabla, resultado = self._consultar_tabla(
+                tablero, alfa, beta, profundidad, jugador_turno
+            )
+            if resultado is not None:
+                return resultado
         
+        if self.tablas_finales is not None:
+            valor = self._consultar_tablas_finales(tablero, jugador_turno, profundidad)
+            if valor is not None:
+                return valor, None
+        
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._nodo_frontera(tablero, alfa, beta, jugador_turno, clave)
+        
+        estado, movimientos = self._movimientos_nodo(tablero, profundidad, jugador_turno, movimiento_tabla)
+        if movimientos is None:
+            return self._evaluar_terminal(tablero, jugador_turno, estado, profundidad, clave, alfa, beta)
+        
+        beta_original = beta
         mejor_valor = math.inf
         mejor_movimiento = None
         
-        for movimiento in tablero.movimientos_disponibles(jugador_turno):
-            nuevo_tablero = tablero.aplicar_movimiento(movimiento)
+        for indice, movimiento in enumerate(movimientos):
+            nuevo_tablero = self._aplicar(tablero, movimiento)
             oponente = tablero.obtener_jugador_oponente(jugador_turno)
             valor, _ = self._max_valor(nuevo_tablero, alfa, beta, profundidad - 1, oponente)
+            self._revertir(tablero)
+            
+            if valor < mejor_valor:
+                mejor_valor = valor
+                mejor_movimiento = movimiento
+            
+            beta = min(beta, mejor_valor)
+            if beta <= alfa:
+                self._registrar_corte(movimiento, jugador_turno, profundidad, indice)
+                break
+        
+        if mejor_movimiento is None:
+            return self._evaluar_terminal(tablero, jugador_turno, None, profundidad, clave)
+        
+        if clave is not None:
+            self._guardar_en_tabla(clave, alfa, beta_original, profundidad, mejor_valor, mejor_movimiento)
+        
+        return mejor_valor, mejor_movimiento
+
+
+class AlgoritmoPVS(AlgoritmoMinimaxAlfaBeta):
+    """
+    Búsqueda de variante principal (PVS) sobre AlgoritmoMinimaxAlfaBeta.
+    En cada nodo el primer movimiento se busca con la ventana completa y el
+    resto con una ventana nula, que solo comprueba si mejora al mejor; si lo
+    hace, se repite con la ventana completa. Los movimientos tardíos sin
+    captura se prueban además con una jugada menos de profundidad (LMR).
+    obtener_mejor_movimiento profundiza de 1 en 1 hasta la profundidad del
+    nivel, cada iteración con una ventana de aspiración alrededor del valor
+    de la anterior.
+    Depende del orden de los movimientos: sin tabla de transposición ni
+    ordenador crea los suyos.
+    """
+    
+    def __init__(self, configuracion_ia, hacer_deshacer=False, tabla_transposicion=None,
+                 ordenador=None, tablas_finales=None, quiescencia=False, evaluacion_lotes=False):
+        super().__init__(configuracion_ia, hacer_deshacer,
+                         tabla_transposicion if tabla_transposicion is not None else TablaTransposicion(),
+                         ordenador if ordenador is not None else OrdenadorMovimientos(),
+                         tablas_finales, quiescencia, evaluacion_lotes)
+    
+    def obtener_mejor_movimiento(self, tablero, jugador_actual):
+        if tablero.es_final(jugador_actual):
+            return None
+        
+        self.reiniciar_busqueda()
+        _, mejor_movimiento = self.buscar_iterativa(tablero, jugador_actual,
+                                                   self.config.obtener_profundidad(self.quiescencia))
+        return self._aplicar_error(tablero, jugador_actual, mejor_movimiento)
+    
+    def buscar_iterativa(self, tablero, jugador_actual, profundidad):
+        """
+        Retorna (valor, mejor_movimiento) profundizando de 1 a profundidad;
+        cada iteración deja en la tabla el orden de la siguiente.
+        """
+        resultado = None
+        for actual in range(1, profundidad + 1):
+            inicio = time.perf_counter()
+            valor_previo = resultado[0] if resultado is not None else None
+            resultado = self.buscar_con_aspiracion(tablero, jugador_actual, actual, valor_previo)
+            self.iteraciones.append((actual, time.perf_counter() - inicio, self.nodos_visitados))
+        return resultado
+    
+    def buscar_con_aspiracion(self, tablero, jugador_actual, profundidad, valor_previo=None):
+        """
+        Busca con la ventana (valor_previo - d, valor_previo + d). Si el valor
+        cae fuera, la ventana se ensancha por 4 y se repite; sin valor previo,
+        o con un valor de fin de partida, usa la ventana completa.
+        """
+        if valor_previo is None or abs(valor_previo) >= VALOR_GANADOR / 2:
+            return self.buscar(tablero, jugador_actual, profundidad)
+        
+        semiancho = PVS_VENTANA_ASPIRACION
+        while semiancho < VALOR_GANADOR:
+            alfa, beta = valor_previo - semiancho, valor_previo + semiancho
+            valor, movimiento = self.buscar(tablero, jugador_actual, profundidad, alfa, beta)
+            if alfa < valor < beta:
+                return valor, movimiento
+            semiancho *= 4
+        return self.buscar(tablero, jugador_actual, profundidad)
+    
+    def _buscar_hijo(self, hijo, indice, alfa, beta, profundidad, oponente, es_captura):
+        """
+        Valor del hijo indice de un nodo. Tras el primero, busca con ventana
+        nula (y reducido si es tardío y sin captura) y solo repite la
+        búsqueda cuando el hijo puede mejorar la ventana.
+        """
+        maximizando = oponente == JUGADOR_NEGRO
+        buscar = self._min_valor if maximizando else self._max_valor
+        if indice == 0:
+            return buscar(hijo, alfa, beta, profundidad - 1, oponente)[0]
+        
+        if maximizando:
+            nula_alfa, nula_beta = alfa, alfa + PVS_VENTANA_NULA
+        else:
+            nula_alfa, nula_beta = beta - PVS_VENTANA_NULA, beta
+        
+        reduccion = 0
+        if (not es_captura and indice >= PVS_MOVIMIENTOS_SIN_REDUCIR and
+                profundidad >= PVS_PROFUNDIDAD_MINIMA_REDUCCION):
+            reduccion = 1
+        
+        valor = buscar(hijo, nula_alfa, nula_beta, profundidad - 1 - reduccion, oponente)[0]
+        mejora = valor > alfa if maximizando else valor < beta
+        if mejora and reduccion:
+            valor = buscar(hijo, nula_alfa, nula_beta, profundidad - 1, oponente)[0]
+            mejora = valor > alfa if maximizando else valor < beta
+        if mejora and alfa < valor < beta:
+            valor = buscar(hijo, alfa, beta, profundidad - 1, oponente)[0]
+        return valor
+    
+    def _max_valor(self, tablero, alfa, beta, profundidad, jugador_turno):
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        
+        clave = None
+        movimiento_tabla = None
+        if self.tabla_transposicion is not None:
+            clave, movimiento_tabla, resultado = self._consultar_tabla(
+                tablero, alfa, beta, profundidad, jugador_turno
+            )
+            if resultado is not None:
+                return resultado
+        
+        if self.tablas_finales is not None:
+            valor = self._consultar_tablas_finales(tablero, jugador_turno, profundidad)
+            if valor is not None:
+                return valor, None
+        
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._nodo_frontera(tablero, alfa, beta, jugador_turno, clave)
+        
+        estado, movimientos = self._movimientos_nodo(tablero, profundidad, jugador_turno, movimiento_tabla)
+        if movimientos is None:
+            return self._evaluar_terminal(tablero, jugador_turno, estado, profundidad, clave, alfa, beta)
+        
+        alfa_original = alfa
+        mejor_valor = -math.inf
+        mejor_movimiento = None
+        piezas = sum(tablero.contar_piezas())
+        oponente = tablero.obtener_jugador_oponente(jugador_turno)
+        
+        for indice, movimiento in enumerate(movimientos):
+            nuevo_tablero = self._aplicar(tablero, movimiento)
+            es_captura = sum(nuevo_tablero.contar_piezas()) < piezas
+            valor = self._buscar_hijo(nuevo_tablero, indice, alfa, beta, profundidad, oponente, es_captura)
+            self._revertir(tablero)
+            
+            if valor > mejor_valor:
+                mejor_valor = valor
+                mejor_movimiento = movimiento
+            
+            alfa = max(alfa, mejor_valor)
+            if beta <= alfa:
+                self._registrar_corte(movimiento, jugador_turno, profundidad, indice)
+                break
+        
+        if mejor_movimiento is None:
+            return self._evaluar_terminal(tablero, jugador_turno, None, profundidad, clave)
+        
+        if clave is not None:
+            self._guardar_en_tabla(clave, alfa_original, beta, profundidad, mejor_valor, mejor_movimiento)
+        
+        return mejor_valor, mejor_movimiento
+    
+    def _min_valor(self, tablero, alfa, beta, profundidad, jugador_turno):
+        self._verificar_tiempo()
+        self.nodos_visitados += 1
+        
+        clave = None
+        movimiento_tabla = None
+        if self.tabla_transposicion is not None:
+            clave, movimiento_tabla, resultado = self._consultar_tabla(
+                tablero, alfa, beta, profundidad, jugador_turno
+            )
+            if resultado is not None:
+                return resultado
+        
+        if self.tablas_finales is not None:
+            valor = self._consultar_tablas_finales(tablero, jugador_turno, profundidad)
+            if valor is not None:
+                return valor, None
+        
+        if self._frontera_por_lotes(tablero, profundidad):
+            return self._nodo_frontera(tablero, alfa, beta, jugador_turno, clave)
+        
+        estado, movimientos = self._movimientos_nodo(tablero, profundidad, jugador_turno, movimiento_tabla)
+        if movimientos is None:
+            return self._evaluar_terminal(tablero, jugador_turno, estado, profundidad, clave, alfa, beta)
+        
+        beta_original = beta
+        mejor_valor = math.inf
+        mejor_movimiento = None
+        piezas = sum(tablero.contar_piezas())
+        oponente = tablero.obtener_jugador_oponente(jugador_turno)
+        
+        for indice, movimiento in enumerate(movimientos):
+            nuevo_tablero = self._aplicar(tablero, movimiento)
+            es_captura = sum(nuevo_tablero.contar_piezas()) < piezas
+            valor = self._buscar_hijo(nuevo_tablero, indice, alfa, beta, profundidad, oponente, es_captura)
+            self._revertir(tablero)
             
             if valor < mejor_valor:
                 mejor_valor = valor
@@ -219,22 +856,172 @@ class AlgoritmoMinimaxAlfaBeta:
             
             beta = min(beta, mejor_valor)
             if beta <= alfa:
+                self._registrar_corte(movimiento, jugador_turno, profundidad, indice)
                 break
         
+        if mejor_movimiento is None:
+            return self._evaluar_terminal(tablero, jugador_turno, None, profundidad, clave)
+        
+        if clave is not None:
+            self._guardar_en_tabla(clave, alfa, beta_original, profundidad, mejor_valor, mejor_movimiento)
+        
         return mejor_valor, mejor_movimiento
 
 
+class AlgoritmoProfundizacionIterativa(AlgoritmoBusqueda):
+    """
+    Profundización iterativa sobre AlgoritmoMinimaxAlfaBeta.
+    Busca a profundidad 1, 2, 3... hasta agotar el tiempo del nivel (tiempo_ms)
+    y retorna el mejor movimiento de la última iteración completada.
+    """
+    
+    def __init__(self, configuracion_ia, algoritmo=None):
+        super().__init__(configuracion_ia)
+        self.algoritmo = algoritmo or AlgoritmoMinimaxAlfaBeta(configuracion_ia)
+        self.profundidad_completada = 0
+    
+    def obtener_mejor_movimiento(self, tablero, jugador_actual):
+        if tablero.es_final(jugador_actual):
+            return None
+        
+        movimientos = tablero.movimientos_disponibles(jugador_actual)
+        self.reiniciar_busqueda()
+        self.algoritmo.reiniciar_busqueda()
+        if len(movimientos) == 1:
+            self.profundidad_completada = 0
+            return next(iter(movimientos))
+        
+        _, mejor_movimiento = self.buscar(tablero, jugador_actual, self.config.obtener_tiempo_ms())
+        return self._aplicar_error(tablero, jugador_actual, mejor_movimiento)
+    
+    def buscar(self, tablero, jugador_actual, tiempo_ms):
+        """
+        Retorna (valor, mejor_movimiento) de la última iteración completada.
+        La primera iteración siempre se completa para tener un movimiento.
+        Si se activa senal_parada lanza BusquedaInterrumpida.
+        """
+        inicio = time.perf_counter()
+        limite = inicio + tiempo_ms / 1000
+        self.algoritmo.senal_parada = self.senal_parada
+        resultado = self.algoritmo.buscar(tablero, jugador_actual, 1)
+        inicio = self._registrar_iteracion(1, inicio)
+        
+        self.algoritmo.limite_tiempo = limite
+        try:
+            for profundidad in range(2, PROFUNDIDAD_MAXIMA_ITERATIVA + 1):
+                if time.perf_counter() >= limite:
+                    break
+                if isinstance(self.algoritmo, AlgoritmoPVS):
+                    resultado = self.algoritmo.buscar_con_aspiracion(tablero, jugador_actual, profundidad,
+                                                                    resultado[0])
+                else:
+                    resultado = self.algoritmo.buscar(tablero, jugador_actual, profundidad)
+                inicio = self._registrar_iteracion(profundidad, inicio)
+        except BusquedaInterrumpida:
+            if self.senal_parada is not None and self.senal_parada.value:
+                raise  # Cancelada desde fuera: el resultado parcial no sirve
+        finally:
+            self.algoritmo.limite_tiempo = None
+        
+        return resultado
+    
+    def _registrar_iteracion(self, profundidad, inicio):
+        """Anota una iteración completada y retorna el instante en que empieza la siguiente."""
+        fin = time.perf_counter()
+        self.profundidad_completada = profundidad
+        self.iteraciones.append((profundidad, fin - inicio, self.algoritmo.nodos_visitados))
+        return fin
+    
+    def obtener_estadisticas(self):
+        """Contadores del algoritmo interno con el tiempo de cada iteración."""
+        estadisticas = self.algoritmo.obtener_estadisticas()
+        estadisticas.iteraciones = list(self.iteraciones)
+        return estadisticas
+
+
 class JugadorIA(Jugador):
     
-    def __init__(self, color, nivel=3, usar_alfa_beta=True):
+    def __init__(self, color, nivel=3, usar_alfa_beta=True, hacer_deshacer=False,
+                 usar_transposicion=False, profundizacion_iterativa=False,
+                 ordenar_movimientos=False, usar_paralelo=False, usar_lazy_smp=False,
+                 procesos=PROCESOS_PARALELOS, meditar=False, usar_libro=False,
+                 usar_tablas_finales=False, usar_pvs=False, usar_quiescencia=False,
+                 usar_evaluacion_lotes=False):
         super().__init__(color)
         self.config = ConfiguracionIA(nivel)
         self.usar_alfa_beta = usar_alfa_beta
+        self.hacer_deshacer = hacer_deshacer
+        self.usar_transposicion = usar_transposicion
+        # Meditar guarda su trabajo en la tabla de transposición, así que la necesita
+        self.tabla_transposicion = TablaTransposicion() if usar_transposicion or meditar else None
+        self.profundizacion_iterativa = profundizacion_iterativa
+        self.ordenador = OrdenadorMovimientos() if ordenar_movimientos else None
+        self.usar_paralelo = usar_paralelo
+        self.usar_lazy_smp = usar_lazy_smp
+        self.usar_pvs = usar_pvs
+        self.usar_quiescencia = usar_quiescencia
+        self.usar_evaluacion_lotes = usar_evaluacion_lotes
+        self.procesos = procesos
+        self.senal_parada = None
+        self.meditar_activo = meditar
+        self.respuestas_meditadas = {}  # Tablero serializado tras la jugada rival -> (respuesta, estadísticas)
+        self.libro = LibroAperturas() if usar_libro else None
+        self.tablas_finales = TablasFinales() if usar_tablas_finales else None
+        self.algoritmo = self._crear_algoritmo()
+    
+    def _crear_algoritmo(self):
+        if self.usar_lazy_smp and not self.usar_alfa_beta:
+            raise ValueError("Lazy SMP necesita Alfa-Beta (usar_alfa_beta=True)")
+        if self.usar_lazy_smp and self.usar_paralelo:
+            raise ValueError("usar_lazy_smp y usar_paralelo son excluyentes")
         
-        if usar_alfa_beta:
-            self.algoritmo = AlgoritmoMinimaxAlfaBeta(self.config)
+        if self.usar_paralelo:
+            # Cada trabajador busca su subárbol a profundidad fija con Minimax o Alfa-Beta simples
+            incompatibles = [nombre for nombre, activa in (
+                ("profundizacion_iterativa", self.profundizacion_iterativa),
+                ("usar_transposicion", self.usar_transposicion),
+                ("ordenar_movimientos", self.ordenador is not None),
+                ("usar_pvs", self.usar_pvs),
+                ("usar_quiescencia", self.usar_quiescencia),
+                ("usar_tablas_finales", self.tablas_finales is not None),
+                ("usar_evaluacion_lotes", self.usar_evaluacion_lotes),
+            ) if activa]
+            if incompatibles:
+                raise ValueError(f"usar_paralelo no admite {', '.join(incompatibles)}")
+            from paralelo import AlgoritmoParaleloRaiz  # paralelo importa este módulo
+            return AlgoritmoParaleloRaiz(self.config, self.usar_alfa_beta, self.hacer_deshacer,
+                                         self.procesos)
+        
+        if not self.usar_alfa_beta:
+            return AlgoritmoMinimax(self.config, self.hacer_deshacer, self.usar_quiescencia,
+                                    self.usar_evaluacion_lotes)
+        
+        if self.usar_lazy_smp:
+            from paralelo import AlgoritmoLazySMP
+            # Los trabajadores buscan sobre la tabla compartida, no sobre self.tabla_transposicion
+            algoritmo = AlgoritmoLazySMP(self.config, self.hacer_deshacer, self.ordenador is not None,
+                                         self.procesos, usar_pvs=self.usar_pvs,
+                                         usar_tablas_finales=self.tablas_finales is not None,
+                                         quiescencia=self.usar_quiescencia,
+                                         evaluacion_lotes=self.usar_evaluacion_lotes)
+        elif self.usar_pvs:
+            algoritmo = AlgoritmoPVS(
+                self.config, self.hacer_deshacer, self.tabla_transposicion, self.ordenador,
+                self.tablas_finales, self.usar_quiescencia, self.usar_evaluacion_lotes
+            )
         else:
-            self.algoritmo = AlgoritmoMinimax(self.config)
+            algoritmo = AlgoritmoMinimaxAlfaBeta(
+                self.config, self.hacer_deshacer, self.tabla_transposicion, self.ordenador,
+                self.tablas_finales, self.usar_quiescencia, self.usar_evaluacion_lotes
+            )
+        if self.profundizacion_iterativa:
+            return AlgoritmoProfundizacionIterativa(self.config, algoritmo)
+        return algoritmo
+    
+    def establecer_senal_parada(self, senal):
+        """Hace que la búsqueda en curso se aborte cuando senal.value sea distinto de cero."""
+        self.senal_parada = senal
+        self.algoritmo.senal_parada = senal
     
     def establecer_nivel(self, nivel):
         return self.config.establecer_nivel(nivel)
@@ -243,11 +1030,75 @@ class JugadorIA(Jugador):
         return self.config.obtener_nivel_actual()
     
     def obtener_movimiento(self, tablero):
-        return self.algoritmo.obtener_mejor_movimiento(tablero, self.color)
+        movimiento, _ = self.obtener_movimiento_con_estadisticas(tablero)
+        return movimiento
+    
+    def obtener_movimiento_con_estadisticas(self, tablero):
+        """
+        Retorna (movimiento, estadisticas) con las EstadisticasBusqueda de la
+        búsqueda; si la respuesta ya estaba meditada, las de esa búsqueda.
+        Las posiciones del libro de aperturas se responden sin buscar.
+        """
+        if self.libro is not None:
+            movimiento = self.libro.elegir(tablero, self.color)
+            if movimiento is not None:
+                return self.algoritmo._aplicar_error(tablero, self.color, movimiento), EstadisticasBusqueda()
+        
+        if self.respuestas_meditadas:
+            respuestas, self.respuestas_meditadas = self.respuestas_meditadas, {}
+            clave = tablero.serializar()
+            if clave in respuestas:
+                return respuestas[clave]
+        movimiento = self.algoritmo.obtener_mejor_movimiento(tablero, self.color)
+        return movimiento, self.algoritmo.obtener_estadisticas()
+    
+    def meditar(self, tablero):
+        """
+        Aprovecha el turno del rival: busca la respuesta a cada una de sus
+        jugadas, las más probables primero, y la guarda para que
+        obtener_movimiento la devuelva al instante. Las búsquedas dejan
+        además sus entradas en la tabla de transposición.
+        Termina al agotar las jugadas o al activarse senal_parada; lo ya
+        buscado se conserva.
+        """
+        self.respuestas_meditadas = {}
+        for jugada in self._jugadas_probables(tablero):
+            siguiente = tablero.aplicar_movimiento(jugada)
+            if siguiente.es_final(self.color):
+                continue
+            if self.libro is not None and self.libro.elegir(siguiente, self.color) is not None:
+                continue  # La respuesta saldrá del libro
+            try:
+                respuesta = self.algoritmo.obtener_mejor_movimiento(siguiente, self.color)
+            except BusquedaInterrumpida:
+                return
+            self.respuestas_meditadas[siguiente.serializar()] = (respuesta,
+                                                                 self.algoritmo.obtener_estadisticas())
+    
+    def _jugadas_probables(self, tablero):
+        """
+        Ordena las jugadas del rival: primero la que la tabla de transposición
+        guarda como su mejor jugada, luego por evaluación estática a su favor.
+        """
+        rival = tablero.obtener_jugador_oponente(self.color)
+        jugadas = list(tablero.movimientos_disponibles(rival))
+        signo = 1 if rival == JUGADOR_BLANCO else -1
+        
+        esperada = None
+        if self.tabla_transposicion is not None:
+            entrada = self.tabla_transposicion.consultar(clave_con_turno(tablero.clave, rival))
+            if entrada is not None:
+                esperada = entrada.mejor_movimiento
+        
+        def prioridad(jugada):
+            if jugada == esperada:
+                return -math.inf
+            siguiente = tablero.aplicar_movimiento(jugada)
+            return -signo * EvaluadorTablero.calcular_utilidad(siguiente, self.color)
+        
+        return sorted(jugadas, key=prioridad)
     
     def cambiar_algoritmo(self, usar_alfa_beta=True):
         self.usar_alfa_beta = usar_alfa_beta
-        if usar_alfa_beta:
-            self.algoritmo = AlgoritmoMinimaxAlfaBeta(self.config)
-        else:
-            self.algoritmo = AlgoritmoMinimax(self.config)
+        self.algoritmo = self._crear_algoritmo()
+        self.algoritmo.senal_parada = self.senal_parada
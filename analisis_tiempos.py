@@ -0,0 +1,293 @@
+# analisis_tiempos.py
+"""
+Análisis de los registros de tiempos de LogTime/.
+Lee tanto los logs de texto antiguos (logtime_*.txt) como los JSON Lines
+de registro_tiempos (logtime_*.jsonl), comprimidos o no, y los reúne en una
+sola tabla de movimientos de la IA. A partir de ella informa:
+
+- latencias: p50/p90/p99/máximo por algoritmo × nivel × color de la IA × opciones
+- aceleracion: cociente Minimax / Alfa-Beta por nivel y color
+- tendencias: latencia de cada configuración sesión a sesión
+
+Uso:
+    python analisis_tiempos.py
+    python analisis_tiempos.py LogTime/ otro_log.jsonl --formato json --salida informe.json
+    python analisis_tiempos.py --formato csv --tabla movimientos --salida movimientos.csv
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import os
+import re
+import sys
+from configuracion import *
+from autojuego import percentil
+
+
+PATRON_SESION = re.compile(r"Inicio de sesión: (.+)")
+PATRON_CONFIGURACION = re.compile(r"Configuración: (.+?) \| Nivel (\d+) \| IA juega con (\w+)")
+PATRON_MOVIMIENTO = re.compile(r"Movimiento (\d+): ([\d.]+) segundos(.*)")
+PATRON_NODOS = re.compile(r"\| nodos (\d+)")
+
+ALGORITMOS_TEXTO = {"Alfa-Beta": "alfa_beta", "Minimax": "minimax"}
+COLORES_TEXTO = {"Blancas": JUGADOR_BLANCO, "Negras": JUGADOR_NEGRO}
+
+CAMPOS_MOVIMIENTO = ["sesion", "inicio_sesion", "partida", "movimiento", "algoritmo",
+                     "nivel", "color_ia", "opciones", "segundos", "nodos"]
+CAMPOS_LATENCIAS = ["algoritmo", "nivel", "color_ia", "opciones", "movimientos", "media",
+                    "p50", "p90", "p99", "maximo"]
+CAMPOS_ACELERACION = ["nivel", "color_ia", "opciones", "minimax_p50", "alfa_beta_p50",
+                      "aceleracion_p50", "aceleracion_media"]
+CAMPOS_TENDENCIAS = ["inicio_sesion", "sesion", "algoritmo", "nivel", "color_ia", "opciones",
+                     "movimientos", "media", "p50", "p90"]
+
+# Campos de la configuración que ya son columnas propias
+CAMPOS_CONFIGURACION = ("algoritmo", "nivel", "color_ia", "usar_alfa_beta")
+
+
+def abrir_log(ruta):
+    """Abre un log como texto, descomprimiéndolo si termina en .gz."""
+    if ruta.endswith(".gz"):
+        return io.TextIOWrapper(gzip.open(ruta, "rb"), encoding="utf-8")
+    return open(ruta, encoding="utf-8")
+
+
+def resumir_opciones(configuracion):
+    """
+    Resume el resto de la configuración de la IA en un texto estable: los
+    nombres de las opciones activas y nombre=valor de las que no son booleanas.
+    Así las partidas con opciones distintas no caen en el mismo grupo.
+    """
+    partes = []
+    for nombre, valor in sorted(configuracion.items()):
+        if nombre in CAMPOS_CONFIGURACION or valor is False or valor is None:
+            continue
+        partes.append(nombre if valor is True else f"{nombre}={valor}")
+    return ",".join(partes)
+
+
+def leer_texto(lineas, sesion):
+    """
+    Extrae los movimientos de un log de texto antiguo. Cada "Configuración:"
+    abre una partida nueva; las líneas de movimiento pueden traer además
+    las estadísticas de búsqueda, de las que se toma el número de nodos.
+    """
+    inicio_sesion = ""
+    configuracion = None
+    partida = 0
+    for linea in lineas:
+        coincidencia = PATRON_SESION.match(linea)
+        if coincidencia:
+            inicio_sesion = coincidencia.group(1).strip()
+            continue
+        
+        coincidencia = PATRON_CONFIGURACION.match(linea)
+        if coincidencia:
+            partida += 1
+            algoritmo, nivel, color = coincidencia.groups()
+            configuracion = (ALGORITMOS_TEXTO.get(algoritmo, algoritmo), int(nivel),
+                             COLORES_TEXTO.get(color, color))
+            continue
+        
+        coincidencia = PATRON_MOVIMIENTO.match(linea)
+        if coincidencia and configuracion is not None:
+            nodos = PATRON_NODOS.search(coincidencia.group(3))
+            yield {
+                "sesion": sesion,
+                "inicio_sesion": inicio_sesion,
+                "partida": partida,
+                "movimiento": int(coincidencia.group(1)),
+                "algoritmo": configuracion[0],
+                "nivel": configuracion[1],
+                "color_ia": configuracion[2],
+                "opciones": "",
+                "segundos": float(coincidencia.group(2)),
+                "nodos": int(nodos.group(1)) if nodos else None,
+            }
+
+
+def leer_jsonl(lineas):
+    """Extrae los movimientos de un log JSON Lines; ignora las líneas ilegibles."""
+    inicios = {}
+    for linea in lineas:
+        try:
+            registro = json.loads(linea)
+        except ValueError:
+            continue  # Línea truncada si el juego terminó a mitad de escritura
+        
+        if registro.get("tipo") == "sesion":
+            inicios[registro["sesion"]] = registro.get("inicio", "")
+        elif registro.get("tipo") == "movimiento":
+            configuracion = registro.get("configuracion", {})
+            yield {
+                "sesion": registro["sesion"],
+                "inicio_sesion": inicios.get(registro["sesion"], ""),
+                "partida": registro["partida"],
+                "movimiento": registro["movimiento"],
+                "algoritmo": configuracion.get("algoritmo"),
+                "nivel": configuracion.get("nivel"),
+                "color_ia": configuracion.get("color_ia"),
+                "opciones": resumir_opciones(configuracion),
+                "segundos": registro["duracion_ns"] / 1e9,
+                "nodos": registro.get("estadisticas", {}).get("nodos"),
+            }
+
+
+def archivos_log(rutas):
+    """Expande directorios a sus logtime_* y retorna la lista de archivos ordenada."""
+    archivos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            archivos.extend(os.path.join(ruta, nombre) for nombre in os.listdir(ruta)
+                            if nombre.startswith("logtime_"))
+        else:
+            archivos.append(ruta)
+    return sorted(archivos)
+
+
+def cargar(rutas):
+    """Lee todos los logs indicados y retorna la lista de movimientos de la IA."""
+    movimientos = []
+    for ruta in archivos_log(rutas):
+        nombre = os.path.basename(ruta)
+        with abrir_log(ruta) as archivo:
+            if ".jsonl" in nombre:
+                movimientos.extend(leer_jsonl(archivo))
+            else:
+                sesion = nombre.split(".")[0].replace("logtime_", "")
+                movimientos.extend(leer_texto(archivo, sesion))
+    return movimientos
+
+
+def _agrupar(movimientos, campos):
+    """Agrupa los tiempos de los movimientos por los campos indicados."""
+    grupos = {}
+    for movimiento in movimientos:
+        clave = tuple(movimiento[campo] for campo in campos)
+        grupos.setdefault(clave, []).append(movimiento["segundos"])
+    for tiempos in grupos.values():
+        tiempos.sort()
+    return grupos
+
+
+def _clave_orden(clave):
+    return tuple("" if valor is None else str(valor) for valor in clave)
+
+
+def latencias(movimientos):
+    """Percentiles de la latencia por algoritmo × nivel × color de la IA × opciones."""
+    filas = []
+    grupos = _agrupar(movimientos, ("algoritmo", "nivel", "color_ia", "opciones"))
+    for clave in sorted(grupos, key=_clave_orden):
+        tiempos = grupos[clave]
+        filas.append(dict(zip(CAMPOS_LATENCIAS, clave + (
+            len(tiempos),
+            sum(tiempos) / len(tiempos),
+            percentil(tiempos, 50),
+            percentil(tiempos, 90),
+            percentil(tiempos, 99),
+            tiempos[-1],
+        ))))
+    return filas
+
+
+def aceleracion(movimientos):
+    """Cuántas veces más rápido es Alfa-Beta que Minimax en cada nivel, color y opciones."""
+    grupos = _agrupar(movimientos, ("algoritmo", "nivel", "color_ia", "opciones"))
+    filas = []
+    for algoritmo, nivel, color, opciones in sorted(grupos, key=_clave_orden):
+        if algoritmo != "minimax" or ("alfa_beta", nivel, color, opciones) not in grupos:
+            continue
+        minimax = grupos[(algoritmo, nivel, color, opciones)]
+        alfa_beta = grupos[("alfa_beta", nivel, color, opciones)]
+        p50_minimax, p50_alfa_beta = percentil(minimax, 50), percentil(alfa_beta, 50)
+        media_minimax = sum(minimax) / len(minimax)
+        media_alfa_beta = sum(alfa_beta) / len(alfa_beta)
+        filas.append(dict(zip(CAMPOS_ACELERACION, (
+            nivel, color, opciones, p50_minimax, p50_alfa_beta,
+            p50_minimax / p50_alfa_beta if p50_alfa_beta > 0 else None,
+            media_minimax / media_alfa_beta if media_alfa_beta > 0 else None,
+        ))))
+    return filas
+
+
+def tendencias(movimientos):
+    """Latencia de cada configuración en cada sesión, en orden cronológico."""
+    grupos = _agrupar(movimientos, ("inicio_sesion", "sesion", "algoritmo", "nivel", "color_ia", "opciones"))
+    filas = []
+    for clave in sorted(grupos, key=_clave_orden):
+        tiempos = grupos[clave]
+        filas.append(dict(zip(CAMPOS_TENDENCIAS, clave + (
+            len(tiempos),
+            sum(tiempos) / len(tiempos),
+            percentil(tiempos, 50),
+            percentil(tiempos, 90),
+        ))))
+    return filas
+
+
+TABLAS = {
+    "latencias": (latencias, CAMPOS_LATENCIAS),
+    "aceleracion": (aceleracion, CAMPOS_ACELERACION),
+    "tendencias": (tendencias, CAMPOS_TENDENCIAS),
+    "movimientos": (list, CAMPOS_MOVIMIENTO),
+}
+
+
+def _formatear(valor):
+    if isinstance(valor, float):
+        return f"{valor:.6f}"
+    return "-" if valor is None else str(valor)
+
+
+def escribir_texto(informe, salida):
+    """Escribe las tablas del informe alineadas en columnas."""
+    for nombre, filas in informe.items():
+        campos = TABLAS[nombre][1]
+        salida.write(f"=== {nombre} ===\n")
+        celdas = [campos] + [[_formatear(fila[campo]) for campo in campos] for fila in filas]
+        anchos = [max(len(celda[indice]) for celda in celdas) for indice in range(len(campos))]
+        for celda in celdas:
+            salida.write("  ".join(valor.rjust(ancho) for valor, ancho in zip(celda, anchos)) + "\n")
+        salida.write("\n")
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Informe de latencias de la IA a partir de LogTime/.")
+    parser.add_argument("rutas", nargs="*", default=[DIRECTORIO_LOG_TIEMPOS],
+                        help="Archivos o directorios de logs (por defecto, LogTime/)")
+    parser.add_argument("--formato", choices=["texto", "csv", "json"], default="texto")
+    parser.add_argument("--tabla", choices=list(TABLAS), action="append",
+                        help="Tablas del informe (por defecto, todas menos movimientos); "
+                             "en CSV se escribe solo la primera")
+    parser.add_argument("--salida", help="Archivo de salida (por defecto, la consola)")
+    args = parser.parse_args(argumentos)
+    
+    movimientos = cargar(args.rutas)
+    if not movimientos:
+        parser.error("No se encontraron movimientos de la IA en los logs indicados")
+    
+    nombres = args.tabla or ["latencias", "aceleracion", "tendencias"]
+    informe = {nombre: TABLAS[nombre][0](movimientos) for nombre in nombres}
+    
+    salida = open(args.salida, "w", encoding="utf-8", newline="") if args.salida else sys.stdout
+    try:
+        if args.formato == "json":
+            json.dump(informe, salida, indent=2, ensure_ascii=False)
+            salida.write("\n")
+        elif args.formato == "csv":
+            escritor = csv.DictWriter(salida, fieldnames=TABLAS[nombres[0]][1])
+            escritor.writeheader()
+            escritor.writerows(informe[nombres[0]])
+        else:
+            escribir_texto(informe, salida)
+    finally:
+        if args.salida:
+            salida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
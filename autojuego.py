@@ -0,0 +1,182 @@
+# autojuego.py
+"""
+Partidas IA contra IA sin interfaz gráfica, repartidas en un pool de procesos.
+Sirve para validar cambios del motor jugando muchas partidas entre dos
+configuraciones de JugadorIA.
+
+Uso:
+    python autojuego.py --partidas 1000 --a nivel=3 --b nivel=3,usar_alfa_beta=False
+    python autojuego.py --a nivel=2,ordenar_movimientos=True --b nivel=2 --procesos 8
+
+Cada apertura aleatoria se juega dos veces, una con cada configuración
+llevando las blancas.
+"""
+import argparse
+import ast
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from configuracion import *
+from tablero import crear_tablero
+from algoritmos import JugadorIA
+
+
+def leer_opciones(texto):
+    """
+    Convierte "nivel=3,usar_alfa_beta=False" en un diccionario de argumentos
+    para JugadorIA. Los valores se leen como literales de Python.
+    """
+    opciones = {}
+    for par in filter(None, texto.split(",")):
+        nombre, separador, valor = par.partition("=")
+        if not separador:
+            raise argparse.ArgumentTypeError(f"Se esperaba nombre=valor: {par}")
+        try:
+            opciones[nombre.strip()] = ast.literal_eval(valor.strip())
+        except (ValueError, SyntaxError):
+            raise argparse.ArgumentTypeError(f"Valor no válido para {nombre}: {valor}")
+    return opciones
+
+
+def percentil(valores_ordenados, porcentaje):
+    """Percentil por rango más cercano de una lista ya ordenada."""
+    if not valores_ordenados:
+        return 0.0
+    indice = max(0, int(round(porcentaje / 100 * len(valores_ordenados))) - 1)
+    return valores_ordenados[min(indice, len(valores_ordenados) - 1)]
+
+
+def jugar_partida(opciones_blancas, opciones_negras, semilla, jugadas_apertura, max_jugadas):
+    """
+    Juega una partida completa. Las primeras jugadas_apertura jugadas son
+    aleatorias; si se alcanza max_jugadas la partida es tablas.
+    Retorna (ganador, jugadas, estadisticas) con estadisticas por color:
+    lista de (segundos, nodos) de cada movimiento de la IA.
+    """
+    random.seed(semilla)
+    tablero = crear_tablero()
+    jugadores = {
+        JUGADOR_BLANCO: JugadorIA(JUGADOR_BLANCO, **opciones_blancas),
+        JUGADOR_NEGRO: JugadorIA(JUGADOR_NEGRO, **opciones_negras),
+    }
+    estadisticas = {JUGADOR_BLANCO: [], JUGADOR_NEGRO: []}
+    jugador_activo = JUGADOR_BLANCO
+    
+    for jugada in range(max_jugadas):
+        if tablero.es_final(jugador_activo):
+            return tablero.determinar_ganador(jugador_activo), jugada, estadisticas
+        
+        if jugada < jugadas_apertura:
+            movimiento = random.choice(sorted(tablero.movimientos_disponibles(jugador_activo)))
+        else:
+            jugador = jugadores[jugador_activo]
+            inicio = time.perf_counter()
+            movimiento, estadisticas_busqueda = jugador.obtener_movimiento_con_estadisticas(tablero)
+            segundos = time.perf_counter() - inicio
+            estadisticas[jugador_activo].append((segundos, estadisticas_busqueda.nodos))
+        
+        tablero = tablero.aplicar_movimiento(movimiento)
+        jugador_activo = tablero.obtener_jugador_oponente(jugador_activo)
+    
+    return None, max_jugadas, estadisticas
+
+
+class ResumenAutojuego:
+    """Acumula resultados y tiempos desde el punto de vista de cada configuración."""
+    
+    def __init__(self):
+        self.partidas = 0
+        self.victorias = {"A": 0, "B": 0}
+        self.tablas = 0
+        self.tiempos = {"A": [], "B": []}
+        self.nodos = {"A": 0, "B": 0}
+    
+    def agregar(self, a_juega_blancas, ganador, estadisticas):
+        colores = {"A": JUGADOR_BLANCO, "B": JUGADOR_NEGRO}
+        if not a_juega_blancas:
+            colores = {"A": JUGADOR_NEGRO, "B": JUGADOR_BLANCO}
+        
+        self.partidas += 1
+        if ganador is None:
+            self.tablas += 1
+        for nombre, color in colores.items():
+            if ganador == color:
+                self.victorias[nombre] += 1
+            for segundos, nodos in estadisticas[color]:
+                self.tiempos[nombre].append(segundos)
+                self.nodos[nombre] += nodos
+    
+    def linea_configuracion(self, nombre):
+        tiempos = sorted(self.tiempos[nombre])
+        total = sum(tiempos)
+        media = total / len(tiempos) if tiempos else 0.0
+        nodos_por_segundo = self.nodos[nombre] / total if total > 0 else 0.0
+        return (f"{nombre}: media {media:.4f}s | p50 {percentil(tiempos, 50):.4f}s | "
+                f"p90 {percentil(tiempos, 90):.4f}s | p99 {percentil(tiempos, 99):.4f}s | "
+                f"{nodos_por_segundo:,.0f} nodos/s")
+    
+    def informe(self, total):
+        return "\n".join([
+            f"Partidas {self.partidas}/{total} | A gana {self.victorias['A']} | "
+            f"tablas {self.tablas} | B gana {self.victorias['B']}",
+            self.linea_configuracion("A"),
+            self.linea_configuracion("B"),
+        ])
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Partidas IA contra IA sin interfaz gráfica.")
+    parser.add_argument("--partidas", type=int, default=100,
+                        help="Número de partidas (se redondea a un número par)")
+    parser.add_argument("--a", type=leer_opciones, default={}, metavar="OPCIONES",
+                        help="Argumentos de JugadorIA de la configuración A, p. ej. nivel=3,usar_alfa_beta=True")
+    parser.add_argument("--b", type=leer_opciones, default={}, metavar="OPCIONES",
+                        help="Argumentos de JugadorIA de la configuración B")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool (por defecto, todos los núcleos)")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla de las aperturas")
+    parser.add_argument("--apertura", type=int, default=AUTOJUEGO_JUGADAS_APERTURA,
+                        help="Jugadas aleatorias al comienzo de cada partida")
+    parser.add_argument("--max-jugadas", type=int, default=AUTOJUEGO_MAX_JUGADAS,
+                        help="Jugadas tras las que la partida se declara tablas")
+    parser.add_argument("--cada", type=int, default=10, help="Mostrar el resumen cada N partidas")
+    args = parser.parse_args(argumentos)
+    
+    # Comprueba las opciones antes de lanzar los procesos
+    for opciones in (args.a, args.b):
+        if opciones.get("nivel", 3) not in NIVELES_DIFICULTAD:
+            parser.error(f"Nivel desconocido: {opciones['nivel']}")
+        try:
+            JugadorIA(JUGADOR_BLANCO, **opciones)
+        except (TypeError, ValueError) as e:  # Argumento desconocido o combinación no admitida
+            parser.error(str(e))
+    
+    total = args.partidas + args.partidas % 2
+    generador = random.Random(args.semilla)
+    semillas = [generador.getrandbits(32) for _ in range(total // 2)]  # Una apertura por pareja
+    resumen = ResumenAutojuego()
+    inicio = time.perf_counter()
+    
+    with ProcessPoolExecutor(max_workers=args.procesos or os.cpu_count() or 1) as pool:
+        tareas = {}
+        for indice in range(total):
+            a_juega_blancas = indice % 2 == 0
+            blancas, negras = (args.a, args.b) if a_juega_blancas else (args.b, args.a)
+            tarea = pool.submit(jugar_partida, blancas, negras, semillas[indice // 2],
+                                args.apertura, args.max_jugadas)
+            tareas[tarea] = a_juega_blancas
+        
+        for tarea in as_completed(tareas):
+            ganador, _, estadisticas = tarea.result()
+            resumen.agregar(tareas[tarea], ganador, estadisticas)
+            if resumen.partidas % args.cada == 0 or resumen.partidas == total:
+                print(resumen.informe(total), flush=True)
+                print("-" * 50, flush=True)
+    
+    print(f"Tiempo total: {time.perf_counter() - inicio:.2f} segundos")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# benchmark.py
+"""
+Benchmark de la búsqueda: ejecuta AlgoritmoMinimax, AlgoritmoMinimaxAlfaBeta
+y AlgoritmoPVS sobre posiciones y profundidades fijas, con el generador aleatorio sembrado
+para que debe_cometer_error sea determinista. Guarda nodos, tiempo, nodos/s
+y movimiento elegido en una línea base JSON y compara ejecuciones nuevas
+contra ella. Al final resume los nodos que ahorra PVS frente a Alfa-Beta
+en las mismas posiciones y profundidades.
+
+Uso:
+    python benchmark.py --guardar linea_base.json
+    python benchmark.py --comparar linea_base.json --umbral-tiempo 0.15
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from configuracion import *
+from algoritmos import AlgoritmoMinimax, AlgoritmoMinimaxAlfaBeta, AlgoritmoPVS, ConfiguracionIA
+from posiciones import POSICIONES, crear_posicion
+
+
+ALGORITMOS = {
+    "minimax": AlgoritmoMinimax,
+    "alfa_beta": AlgoritmoMinimaxAlfaBeta,
+    "pvs": AlgoritmoPVS,
+}
+
+# Profundidades fijas por algoritmo; cada una se mide en todas las posiciones
+PROFUNDIDADES = {
+    "minimax": (3, 4),
+    "alfa_beta": (5, 6),
+    "pvs": (5, 6),
+}
+
+SEMILLA = 12345
+
+
+def casos():
+    """Retorna la lista de casos (algoritmo, posicion, profundidad) en orden estable."""
+    return [(algoritmo, posicion, profundidad)
+            for algoritmo, profundidades in PROFUNDIDADES.items()
+            for posicion in POSICIONES
+            for profundidad in profundidades]
+
+
+def nombre_caso(algoritmo, posicion, profundidad):
+    return f"{algoritmo}/{posicion}/p{profundidad}"
+
+
+def medir_caso(algoritmo, posicion, profundidad, nivel, repeticiones):
+    """
+    Ejecuta el caso varias veces y retorna sus métricas. El tiempo es el
+    mínimo de las repeticiones, la medida menos afectada por el ruido.
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        random.seed(SEMILLA)
+        tablero, jugador = crear_posicion(posicion)
+        busqueda = ALGORITMOS[algoritmo](ConfiguracionIA(nivel))
+        busqueda.reiniciar_busqueda()
+        
+        inicio = time.perf_counter_ns()
+        if isinstance(busqueda, AlgoritmoPVS):
+            # Como en juego: profundización con ventanas de aspiración hasta la profundidad
+            valor, movimiento = busqueda.buscar_iterativa(tablero, jugador, profundidad)
+        else:
+            valor, movimiento = busqueda.buscar(tablero, jugador, profundidad)
+        movimiento = busqueda._aplicar_error(tablero, jugador, movimiento)
+        tiempos.append(time.perf_counter_ns() - inicio)
+    
+    segundos = min(tiempos) / 1e9
+    estadisticas = busqueda.obtener_estadisticas()
+    return {
+        "nodos": estadisticas.nodos,
+        "evaluaciones": estadisticas.evaluaciones,
+        "cortes": estadisticas.cortes,
+        "factor_ramificacion": estadisticas.factor_ramificacion,
+        "segundos": segundos,
+        "nodos_por_segundo": estadisticas.nodos / segundos if segundos > 0 else 0.0,
+        "valor": valor,
+        "movimiento": [list(casilla) for casilla in movimiento] if movimiento else None,
+    }
+
+
+def ejecutar(nivel, repeticiones):
+    """Ejecuta todos los casos mostrando el progreso y retorna el informe completo."""
+    resultados = {}
+    for algoritmo, posicion, profundidad in casos():
+        nombre = nombre_caso(algoritmo, posicion, profundidad)
+        resultados[nombre] = medir_caso(algoritmo, posicion, profundidad, nivel, repeticiones)
+        metricas = resultados[nombre]
+        print(f"{nombre:<28} {metricas['nodos']:>10,} nodos | {metricas['segundos']:.4f} s | "
+              f"{metricas['nodos_por_segundo']:>10,.0f} nodos/s | {metricas['movimiento']}")
+    
+    return {
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "maquina": platform.machine(),
+        "motor_tablero": MOTOR_TABLERO,
+        "nivel": nivel,
+        "semilla": SEMILLA,
+        "repeticiones": repeticiones,
+        "resultados": resultados,
+    }
+
+
+def ahorro_nodos(informe, algoritmo="pvs", referencia="alfa_beta"):
+    """
+    Compara los nodos de algoritmo con los de referencia en los casos que
+    comparten posición y profundidad. Retorna [(caso, nodos_referencia, nodos)].
+    """
+    filas = []
+    resultados = informe["resultados"]
+    for nombre_algoritmo, posicion, profundidad in casos():
+        base = resultados.get(nombre_caso(referencia, posicion, profundidad))
+        if nombre_algoritmo == algoritmo and base is not None:
+            metricas = resultados[nombre_caso(algoritmo, posicion, profundidad)]
+            filas.append((f"{posicion}/p{profundidad}", base["nodos"], metricas["nodos"]))
+    return filas
+
+
+def mostrar_ahorro(informe, algoritmo="pvs", referencia="alfa_beta"):
+    """Imprime cuántos nodos ahorra algoritmo frente a referencia, caso a caso y en total."""
+    filas = ahorro_nodos(informe, algoritmo, referencia)
+    if not filas:
+        return
+    print(f"Nodos de {algoritmo} frente a {referencia}:")
+    for caso, nodos_referencia, nodos in filas:
+        print(f"  {caso:<24} {nodos_referencia:>10,} -> {nodos:>10,} (ahorro {1 - nodos / nodos_referencia:.1%})")
+    total_referencia = sum(fila[1] for fila in filas)
+    total = sum(fila[2] for fila in filas)
+    print(f"  {'total':<24} {total_referencia:>10,} -> {total:>10,} (ahorro {1 - total / total_referencia:.1%})")
+
+
+def comparar(base, actual, umbral_tiempo, umbral_nodos):
+    """
+    Compara dos informes caso a caso. Es regresión que el tiempo o los nodos
+    crezcan más que su umbral (fracción de la línea base) o que cambie el
+    movimiento elegido. Retorna la lista de descripciones de regresiones.
+    """
+    regresiones = []
+    for campo in ("nivel", "semilla", "motor_tablero"):
+        if base.get(campo) != actual[campo]:
+            print(f"Advertencia: la línea base usa {campo}={base.get(campo)}, esta ejecución {actual[campo]}")
+    
+    for nombre, metricas in actual["resultados"].items():
+        anterior = base["resultados"].get(nombre)
+        if anterior is None:
+            print(f"{nombre:<28} sin línea base")
+            continue
+        
+        cambio_tiempo = metricas["segundos"] / anterior["segundos"] - 1 if anterior["segundos"] else 0.0
+        cambio_nodos = metricas["nodos"] / anterior["nodos"] - 1 if anterior["nodos"] else 0.0
+        print(f"{nombre:<28} tiempo {cambio_tiempo:+7.1%} | nodos {cambio_nodos:+7.1%}")
+        
+        if cambio_tiempo > umbral_tiempo:
+            regresiones.append(f"{nombre}: tiempo {cambio_tiempo:+.1%} (umbral {umbral_tiempo:.0%})")
+        if cambio_nodos > umbral_nodos:
+            regresiones.append(f"{nombre}: nodos {cambio_nodos:+.1%} (umbral {umbral_nodos:.0%})")
+        if metricas["movimiento"] != anterior["movimiento"]:
+            regresiones.append(f"{nombre}: movimiento {anterior['movimiento']} -> {metricas['movimiento']}")
+    return regresiones
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de los algoritmos de búsqueda.")
+    parser.add_argument("--guardar", metavar="ARCHIVO", help="Guardar el informe como línea base JSON")
+    parser.add_argument("--comparar", metavar="ARCHIVO", help="Comparar con una línea base JSON")
+    parser.add_argument("--nivel", type=int, choices=sorted(NIVELES_DIFICULTAD), default=3,
+                        help="Nivel cuya probabilidad de error se aplica")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--umbral-tiempo", type=float, default=0.10,
+                        help="Aumento de tiempo tolerado, como fracción (0.10 = 10%%)")
+    parser.add_argument("--umbral-nodos", type=float, default=0.0,
+                        help="Aumento de nodos tolerado, como fracción")
+    args = parser.parse_args(argumentos)
+    
+    if TABLERO_DIM != 8:
+        parser.error("Las posiciones de referencia están escritas para un tablero de 8x8")
+    
+    informe = ejecutar(args.nivel, args.repeticiones)
+    mostrar_ahorro(informe)
+    
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2)
+        print(f"Línea base guardada en {args.guardar}")
+    
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(base, informe, args.umbral_tiempo, args.umbral_nodos)
+        if regresiones:
+            print(f"{len(regresiones)} regresiones:")
+            for regresion in regresiones:
+                print(f"  - {regresion}")
+            return 1
+        print("Sin regresiones")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,10 @@ Configuraciones y constantes del juego de damas.
 # --- Configuración del Juego de Damas ---
 TABLERO_DIM = 8  # Dimensión del tablero (8 para estándar, 10 para internacional)
 
+# Motor del tablero: "listas" (matriz de celdas), "bits" (bitboards) o
+# "compacto" (bytearray de códigos de pieza y movimientos empaquetados)
+MOTOR_TABLERO = "listas"
+
 # Representación de jugadores y piezas
 JUGADOR_BLANCO = "B"
 JUGADOR_NEGRO = "N"
@@ -20,23 +24,32 @@ NIVELES_DIFICULTAD = {
     1: {
         "nombre": "Principiante",
         "profundidad": 1,
+        "profundidad_quiescencia": 1,  # Con búsqueda de quiescencia basta menos profundidad
+        "tiempo_ms": 100,  # Presupuesto por movimiento con profundización iterativa
         "error_probabilidad": 0.3,  # 30% de probabilidad de hacer un movimiento subóptimo
         "descripcion": "IA muy básica, comete errores frecuentes"
     },
     2: {
         "nombre": "Intermedio",
         "profundidad": 3,
+        "profundidad_quiescencia": 2,
+        "tiempo_ms": 500,
         "error_probabilidad": 0.1,  # 10% de probabilidad de error
         "descripcion": "IA competente, pocos errores"
     },
     3: {
         "nombre": "Experto",
         "profundidad": 5,
+        "profundidad_quiescencia": 4,
+        "tiempo_ms": 2000,
         "error_probabilidad": 0.0,  # Sin errores intencionales
         "descripcion": "IA máxima, juego perfecto"
     }
 }
 
+# Límite de seguridad para la profundización iterativa
+PROFUNDIDAD_MAXIMA_ITERATIVA = 30
+
 # Valores para la función de evaluación
 VALOR_PEON = 10
 VALOR_DAMA = 80
@@ -44,3 +57,50 @@ VALOR_GANADOR = 1000
 VALOR_MOVILIDAD = 0.5
 VALOR_AVANCE = 1.0
 VALOR_CENTRO = 2.0
+
+# --- Tabla de transposición ---
+TRANSPOSICION_MAX_ENTRADAS = 1 << 18  # Número máximo de posiciones almacenadas
+TRANSPOSICION_POLITICA = "profundidad"  # "profundidad" o "siempre"
+
+# --- Meditación (pondering) ---
+MEDITAR_EN_TURNO_RIVAL = True  # La IA busca sus respuestas mientras piensa el humano
+
+# --- Partidas sin interfaz (autojuego.py) ---
+AUTOJUEGO_JUGADAS_APERTURA = 4  # Jugadas aleatorias al comienzo de cada partida
+AUTOJUEGO_MAX_JUGADAS = 200  # Límite de jugadas; al alcanzarlo la partida es tablas
+
+# --- Búsqueda paralela ---
+PROCESOS_PARALELOS = None  # Procesos del pool; None usa todos los núcleos
+INTERVALO_ESPERA_PARALELA = 0.01  # Segundos entre comprobaciones de tiempo y parada al esperar al pool
+
+# --- Registro de tiempos (registro_tiempos.py) ---
+DIRECTORIO_LOG_TIEMPOS = "LogTime"
+LOG_ARCHIVOS_SIN_COMPRIMIR = 10  # Sesiones recientes que se dejan sin comprimir
+LOG_MAX_ARCHIVOS = 200  # Sesiones conservadas; las más antiguas se eliminan
+
+# --- Libro de aperturas (libro_aperturas.py) ---
+USAR_LIBRO_APERTURAS = True  # La IA de la interfaz juega las aperturas desde el libro
+LIBRO_APERTURAS_RUTA = "libro_aperturas.bin"
+LIBRO_APERTURAS_PLIES = 4  # Jugadas desde la posición inicial cubiertas por el libro
+LIBRO_APERTURAS_PROFUNDIDAD = 6  # Profundidad de búsqueda al construirlo
+LIBRO_APERTURAS_MOVIMIENTOS = 3  # Movimientos guardados por posición
+
+# --- Tablas de finales (tablas_finales.py) ---
+USAR_TABLAS_FINALES = True  # La IA de la interfaz consulta las tablas en los finales de damas
+TABLAS_FINALES_RUTA = "tablas_finales.bin"
+TABLAS_FINALES_MAX_PIEZAS = 4  # Piezas máximas de los finales resueltos
+
+# --- Búsqueda de variante principal (AlgoritmoPVS) ---
+PVS_VENTANA_NULA = 0.01  # Ancho de las ventanas nulas: menor que la resolución de la evaluación (0.5)
+PVS_VENTANA_ASPIRACION = 2.0  # Semiancho inicial de la ventana alrededor del valor de la iteración anterior
+PVS_MOVIMIENTOS_SIN_REDUCIR = 3  # Movimientos de cada nodo que nunca se reducen
+PVS_PROFUNDIDAD_MINIMA_REDUCCION = 3  # Profundidad restante a partir de la que se reduce
+
+# --- Búsqueda de quiescencia ---
+USAR_QUIESCENCIA = True  # La IA de la interfaz resuelve las capturas pendientes en el horizonte
+QUIESCENCIA_PROFUNDIDAD_MAXIMA = 8  # Plies de capturas como mucho más allá del horizonte
+QUIESCENCIA_MAX_NODOS = 20000  # Nodos de quiescencia por búsqueda; agotados, las hojas se evalúan tal cual
+
+# --- Evaluación por lotes (NumPy, opcional) ---
+USAR_EVALUACION_LOTES = False  # Compensa en Minimax y en Alfa-Beta sin quiescencia; con quiescencia no
+EVALUACION_LOTES_MINIMO = 4  # Hojas mínimas para usar el lote; con menos se evalúan una a una
@@ -0,0 +1,177 @@
+# evaluacion_lotes.py
+"""
+Evaluación por lotes con NumPy.
+EvaluadorLotes puntúa de una vez N tableros codificados como un arreglo
+int8 de forma (N, casillas oscuras), con los códigos de pieza de
+Tablero.serializar(). Calcula lo mismo que EvaluadorTablero.calcular_utilidad:
+material, avance y centralidad con vectores de pesos por casilla
+precalculados, más la movilidad de ambos bandos y la detección de fin de
+partida, todo en una sola pasada vectorizada.
+
+NumPy es opcional: sin él NUMPY_DISPONIBLE es False y la búsqueda sigue
+evaluando hoja a hoja.
+"""
+from configuracion import *
+from geometria import CASILLAS_OSCURAS, DIRECCIONES_DAMA, DIRECCIONES_PEON, RAYOS
+from tablero import CODIGOS_PIEZA, PIEZAS_POR_CODIGO, valor_posicional
+
+try:
+    import numpy as np
+except ImportError:  # Dependencia opcional
+    np = None
+
+NUMPY_DISPONIBLE = np is not None
+
+N_CASILLAS = len(CASILLAS_OSCURAS)
+CENTINELA = len(PIEZAS_POR_CODIGO)  # Código de las casillas fuera del tablero: ocupadas y sin dueño
+LONGITUD_RAYO = TABLERO_DIM  # El rayo más largo tiene TABLERO_DIM - 1 casillas; siempre queda un centinela
+
+
+def _tablas():
+    """Construye las tablas precalculadas de índices y pesos."""
+    indices = {casilla: indice for indice, casilla in enumerate(CASILLAS_OSCURAS)}
+    
+    # RAYOS_INDICES[casilla, direccion, paso]: índice de la casilla del rayo, o N_CASILLAS (centinela)
+    rayos = np.full((N_CASILLAS, len(DIRECCIONES_DAMA), LONGITUD_RAYO), N_CASILLAS, dtype=np.intp)
+    for casilla, indice in indices.items():
+        for numero, direccion in enumerate(DIRECCIONES_DAMA):
+            for paso, destino in enumerate(RAYOS[casilla][direccion]):
+                rayos[indice, numero, paso] = indices[destino]
+    
+    # PESOS[codigo, casilla]: material y posición de la pieza, positivo para las blancas
+    pesos = np.zeros((CENTINELA + 1, N_CASILLAS))
+    for codigo, pieza in enumerate(PIEZAS_POR_CODIGO):
+        if pieza != CELDA_VACIA:
+            signo = 1 if pieza in (JUGADOR_BLANCO, DAMA_BLANCA) else -1
+            pesos[codigo] = [signo * valor_posicional(pieza, fila, columna) for fila, columna in CASILLAS_OSCURAS]
+    
+    # Por código: dueño (0 ninguno, 1 blancas, 2 negras; dos piezas son rivales si suman 3),
+    # si es dama y, para los peones de cada color, sus direcciones de avance
+    duenos = np.zeros(CENTINELA + 1, dtype=np.int8)
+    damas = np.zeros(CENTINELA + 1, dtype=bool)
+    avances = np.zeros((2, CENTINELA + 1, len(DIRECCIONES_DAMA)), dtype=bool)
+    for color, (jugador, dama) in enumerate(((JUGADOR_BLANCO, DAMA_BLANCA), (JUGADOR_NEGRO, DAMA_NEGRA))):
+        duenos[[CODIGOS_PIEZA[jugador], CODIGOS_PIEZA[dama]]] = color + 1
+        damas[CODIGOS_PIEZA[dama]] = True
+        for direccion in DIRECCIONES_PEON[jugador]:
+            avances[color, CODIGOS_PIEZA[jugador], DIRECCIONES_DAMA.index(direccion)] = True
+    return rayos, pesos, duenos, damas, avances
+
+
+if NUMPY_DISPONIBLE:
+    RAYOS_INDICES, PESOS, DUENOS, ES_DAMA, AVANCES_PEON = _tablas()
+    VECINOS_INDICES = RAYOS_INDICES[:, :, 0]
+    SALTOS_INDICES = RAYOS_INDICES[:, :, 1]
+
+
+def _caminos():
+    """
+    CAMINOS[(origen, destino)] para cada par de casillas de una misma diagonal:
+    (índice de origen, índices de las casillas intermedias, índice de destino, fila de destino).
+    """
+    indices = {casilla: indice for indice, casilla in enumerate(CASILLAS_OSCURAS)}
+    caminos = {}
+    for casilla, rayos in RAYOS.items():
+        for rayo in rayos.values():
+            for paso, destino in enumerate(rayo):
+                caminos[(casilla, destino)] = (indices[casilla], [indices[intermedia] for intermedia in rayo[:paso]],
+                                               indices[destino], destino[0])
+    return caminos
+
+
+CAMINOS = _caminos()
+
+# Código de la pieza que llega a cada fila: los peones coronan en la fila del fondo rival
+CORONACIONES = {
+    (CODIGOS_PIEZA[JUGADOR_BLANCO], 0): CODIGOS_PIEZA[DAMA_BLANCA],
+    (CODIGOS_PIEZA[JUGADOR_NEGRO], TABLERO_DIM - 1): CODIGOS_PIEZA[DAMA_NEGRA],
+}
+
+
+def codificar(serializados):
+    """Convierte una lista de Tablero.serializar() en el arreglo int8 (N, casillas)."""
+    return np.frombuffer(b"".join(serializados), dtype=np.int8).reshape(-1, N_CASILLAS)
+
+
+def codificar_hijos(datos, movimientos):
+    """
+    Arreglo int8 (N, casillas) de los tableros que resultan de aplicar cada
+    movimiento legal al tablero serializado en datos, sin construirlos: la
+    pieza cambia de casilla, las casillas que salta quedan vacías (solo
+    puede saltar piezas rivales) y el peón que llega al fondo corona.
+    """
+    lote = bytearray(datos * len(movimientos))
+    for fila, movimiento in enumerate(movimientos):
+        base = fila * N_CASILLAS
+        origen, intermedias, destino, fila_destino = CAMINOS[movimiento]
+        codigo = lote[base + origen]
+        lote[base + origen] = 0
+        for intermedia in intermedias:
+            lote[base + intermedia] = 0
+        lote[base + destino] = CORONACIONES.get((codigo, fila_destino), codigo)
+    return np.frombuffer(lote, dtype=np.int8).reshape(-1, N_CASILLAS)
+
+
+class EvaluadorLotes:
+    """
+    Evaluador vectorizado de lotes de tableros.
+    evaluar() da, para cada fila, el mismo valor que
+    EvaluadorTablero.calcular_utilidad (positivo a favor de las blancas).
+    """
+    
+    def __init__(self):
+        if not NUMPY_DISPONIBLE:
+            raise ImportError("La evaluación por lotes necesita NumPy (pip install numpy)")
+    
+    def evaluar(self, codigos, jugador_turno, con_capturas=False):
+        """
+        Retorna un arreglo float64 con la utilidad de cada tablero del lote.
+        codigos es el arreglo int8 (N, casillas); jugador_turno es el jugador
+        que mueve en todos ellos. Con con_capturas=True retorna además un
+        arreglo bool que indica en qué tableros jugador_turno tiene capturas.
+        """
+        lote = len(codigos)
+        relleno = np.concatenate([codigos, np.full((lote, 1), CENTINELA, dtype=np.int8)], axis=1)
+        dueno = DUENOS[codigos]
+        
+        # Peones: un paso a una casilla vacía o un salto sobre una pieza rival, en sus direcciones
+        vecinas = relleno[:, VECINOS_INDICES]  # (N, casillas, direcciones)
+        libre = vecinas == 0
+        salto = (DUENOS[vecinas] + dueno[..., None] == 3) & (relleno[:, SALTOS_INDICES] == 0)
+        simples, capturas = [], []
+        for avances in AVANCES_PEON:  # Blancas y negras
+            direcciones = avances[codigos]
+            simples.append((libre & direcciones).sum(axis=(1, 2)))
+            capturas.append((salto & direcciones).sum(axis=(1, 2)))
+        
+        # Damas voladoras: solo se recorren los rayos de las casillas con dama
+        filas, casillas = np.nonzero(ES_DAMA[codigos])
+        if len(filas):
+            rayos = relleno[filas[:, None, None], RAYOS_INDICES[casillas]]  # (damas, direcciones, pasos)
+            vacia = rayos == 0
+            ocupadas = np.cumsum(~vacia, axis=-1, dtype=np.int8)  # Piezas encontradas hasta cada paso
+            libres = (ocupadas == 0).sum(axis=-1)  # Casillas vacías antes de la primera pieza
+            primera = np.take_along_axis(rayos, libres[..., None], axis=-1)[..., 0]
+            dueno_dama = dueno[filas, casillas]
+            rival = DUENOS[primera] + dueno_dama[:, None] == 3
+            aterrizajes = (((ocupadas == 1) & vacia).sum(axis=-1) * rival).sum(axis=-1)
+            libres = libres.sum(axis=-1)
+            for color in (0, 1):
+                propias = dueno_dama == color + 1
+                simples[color] = simples[color] + np.bincount(filas[propias], libres[propias], lote)
+                capturas[color] = capturas[color] + np.bincount(filas[propias], aterrizajes[propias], lote)
+        
+        # Las capturas son obligatorias: si hay alguna, solo cuentan ellas
+        movilidad = [np.where(capturas[color] > 0, capturas[color], simples[color]) for color in (0, 1)]
+        valores = (PESOS[codigos, np.arange(N_CASILLAS)].sum(axis=1)
+                   + (movilidad[0] - movilidad[1]) * VALOR_MOVILIDAD)
+        
+        # Fin de partida, con la misma precedencia que Tablero.analizar_nodo
+        turno = 0 if jugador_turno == JUGADOR_BLANCO else 1
+        sin_movimientos = -VALOR_GANADOR if jugador_turno == JUGADOR_BLANCO else VALOR_GANADOR
+        valores = np.where(movilidad[turno] == 0, sin_movimientos, valores)
+        valores = np.where((dueno == 2).any(axis=1), valores, VALOR_GANADOR)
+        valores = np.where((dueno == 1).any(axis=1), valores, -VALOR_GANADOR)
+        if con_capturas:
+            return valores, capturas[turno] > 0
+        return valores
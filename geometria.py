@@ -0,0 +1,68 @@
+# geometria.py
+"""
+Tablas de geometría del tablero, construidas una sola vez al importar el
+módulo para el TABLERO_DIM activo. Los generadores de movimientos recorren
+estas tablas en lugar de calcular desplazamientos y validar coordenadas.
+"""
+from configuracion import *
+
+
+DIRECCIONES_BLANCO = [(-1, -1), (-1, 1)]  # Peones blancos avanzan hacia arriba
+DIRECCIONES_NEGRO = [(1, -1), (1, 1)]     # Peones negros avanzan hacia abajo
+DIRECCIONES_DAMA = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+DIRECCIONES_PEON = {
+    JUGADOR_BLANCO: DIRECCIONES_BLANCO,
+    JUGADOR_NEGRO: DIRECCIONES_NEGRO,
+}
+
+PIEZAS_PROPIAS = {
+    JUGADOR_BLANCO: (JUGADOR_BLANCO, DAMA_BLANCA),
+    JUGADOR_NEGRO: (JUGADOR_NEGRO, DAMA_NEGRA),
+}
+
+PIEZAS_ENEMIGAS = {
+    JUGADOR_BLANCO: (JUGADOR_NEGRO, DAMA_NEGRA),
+    JUGADOR_NEGRO: (JUGADOR_BLANCO, DAMA_BLANCA),
+}
+
+
+def _dentro(fila, columna):
+    return 0 <= fila < TABLERO_DIM and 0 <= columna < TABLERO_DIM
+
+
+def _construir_rayo(fila, columna, direccion):
+    df, dc = direccion
+    rayo = []
+    f, c = fila + df, columna + dc
+    while _dentro(f, c):
+        rayo.append((f, c))
+        f, c = f + df, c + dc
+    return rayo
+
+
+# Casillas donde pueden estar las piezas
+CASILLAS_OSCURAS = [
+    (fila, columna)
+    for fila in range(TABLERO_DIM)
+    for columna in range(TABLERO_DIM)
+    if (fila + columna) % 2 != 0
+]
+
+# RAYOS[casilla][direccion]: casillas de la diagonal hasta el borde (damas voladoras)
+RAYOS = {
+    casilla: {direccion: _construir_rayo(*casilla, direccion) for direccion in DIRECCIONES_DAMA}
+    for casilla in CASILLAS_OSCURAS
+}
+
+# VECINOS[casilla][direccion]: casilla adyacente en esa dirección (solo si existe)
+VECINOS = {
+    casilla: {direccion: rayo[0] for direccion, rayo in rayos.items() if rayo}
+    for casilla, rayos in RAYOS.items()
+}
+
+# SALTOS[casilla][direccion]: (casilla saltada, casilla de aterrizaje) (solo si existen)
+SALTOS = {
+    casilla: {direccion: (rayo[0], rayo[1]) for direccion, rayo in rayos.items() if len(rayo) >= 2}
+    for casilla, rayos in RAYOS.items()
+}
@@ -0,0 +1,201 @@
+# libro_aperturas.py
+"""
+Libro de aperturas en un archivo binario ordenado.
+El constructor recorre todas las posiciones de las primeras jugadas desde
+la posición inicial, puntúa cada movimiento con una búsqueda Alfa-Beta
+profunda y guarda los mejores. En juego, LibroAperturas consulta el archivo
+a través de mmap con búsqueda binaria: no se carga nada al arrancar y las
+páginas las comparte el sistema operativo entre procesos.
+
+Formato: una cabecera (FIRMA, versión, número de registros) seguida de
+registros (clave, movimiento, valor) ordenados por clave; los movimientos
+de una misma clave van del mejor al peor para el jugador con el turno.
+La clave es la clave Zobrist con el turno y el valor es la utilidad de la
+búsqueda (positiva a favor de las blancas).
+
+Uso:
+    python libro_aperturas.py --plies 4 --profundidad 6
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from configuracion import *
+from tablero import crear_tablero
+from zobrist import clave_con_turno
+from transposicion import TablaTransposicion, _codificar_movimiento, _decodificar_movimiento
+from ordenamiento import OrdenadorMovimientos
+
+
+FIRMA = b"DAMASLIB"
+VERSION = 1
+CABECERA = struct.Struct("<8sII")  # Firma, versión, número de registros
+REGISTRO = struct.Struct("<QHf")  # Clave, movimiento codificado, valor
+
+
+class LibroAperturas:
+    """
+    Consulta de solo lectura de un libro de aperturas.
+    El archivo se abre con el primer acceso; si no existe o no es válido,
+    el libro se comporta como vacío.
+    """
+    
+    def __init__(self, ruta=LIBRO_APERTURAS_RUTA):
+        self.ruta = ruta
+        self.registros = 0
+        self._mapa = None
+        self._abierto = False
+    
+    def _abrir(self):
+        self._abierto = True
+        try:
+            with open(self.ruta, "rb") as archivo:
+                mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return  # Archivo inexistente o vacío
+        
+        if len(mapa) < CABECERA.size:
+            mapa.close()
+            return
+        firma, version, registros = CABECERA.unpack_from(mapa, 0)
+        if firma != FIRMA or version != VERSION or len(mapa) < CABECERA.size + registros * REGISTRO.size:
+            print(f"Advertencia: '{self.ruta}' no es un libro de aperturas válido; se ignora.")
+            mapa.close()
+            return
+        self._mapa = mapa
+        self.registros = registros
+    
+    def _clave_en(self, indice):
+        return REGISTRO.unpack_from(self._mapa, CABECERA.size + indice * REGISTRO.size)[0]
+    
+    def consultar(self, clave):
+        """Retorna la lista de (movimiento, valor) guardada para la clave, del mejor al peor."""
+        if not self._abierto:
+            self._abrir()
+        if self._mapa is None:
+            return []
+        
+        # Búsqueda binaria del primer registro con la clave
+        inferior, superior = 0, self.registros
+        while inferior < superior:
+            medio = (inferior + superior) // 2
+            if self._clave_en(medio) < clave:
+                inferior = medio + 1
+            else:
+                superior = medio
+        
+        resultado = []
+        while inferior < self.registros:
+            clave_registro, movimiento, valor = REGISTRO.unpack_from(
+                self._mapa, CABECERA.size + inferior * REGISTRO.size
+            )
+            if clave_registro != clave:
+                break
+            resultado.append((_decodificar_movimiento(movimiento), valor))
+            inferior += 1
+        return resultado
+    
+    def elegir(self, tablero, jugador):
+        """
+        Retorna el mejor movimiento del libro para el tablero, o None si la
+        posición no está. Se comprueba que sea legal por si dos posiciones
+        comparten clave.
+        """
+        jugadas = self.consultar(clave_con_turno(tablero.clave, jugador))
+        if not jugadas:
+            return None
+        movimiento = jugadas[0][0]
+        return movimiento if movimiento in tablero.movimientos_disponibles(jugador) else None
+    
+    def cerrar(self):
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self.registros = 0
+        self._abierto = False
+
+
+def posiciones_apertura(plies):
+    """
+    Retorna {clave: (tablero, jugador)} de todas las posiciones no finales
+    alcanzables desde la inicial en menos de plies jugadas.
+    """
+    posiciones = {}
+    frontera = [(crear_tablero(), JUGADOR_BLANCO)]
+    for _ in range(plies):
+        siguiente = []
+        for tablero, jugador in frontera:
+            clave = clave_con_turno(tablero.clave, jugador)
+            if clave in posiciones or tablero.es_final(jugador):
+                continue
+            posiciones[clave] = (tablero, jugador)
+            oponente = tablero.obtener_jugador_oponente(jugador)
+            siguiente.extend((tablero.aplicar_movimiento(movimiento), oponente)
+                             for movimiento in tablero.movimientos_disponibles(jugador))
+        frontera = siguiente
+    return posiciones
+
+
+def construir(ruta, plies=LIBRO_APERTURAS_PLIES, profundidad=LIBRO_APERTURAS_PROFUNDIDAD,
+              movimientos_por_posicion=LIBRO_APERTURAS_MOVIMIENTOS, progreso=None):
+    """
+    Busca cada movimiento de las posiciones de apertura a la profundidad
+    indicada y escribe el libro en ruta. Retorna el número de posiciones.
+    """
+    from algoritmos import AlgoritmoMinimaxAlfaBeta, ConfiguracionIA  # algoritmos importa este módulo
+    
+    # La tabla se conserva entre posiciones: las aperturas comparten muchas variantes
+    algoritmo = AlgoritmoMinimaxAlfaBeta(ConfiguracionIA(), hacer_deshacer=True,
+                                         tabla_transposicion=TablaTransposicion(),
+                                         ordenador=OrdenadorMovimientos())
+    posiciones = posiciones_apertura(plies)
+    registros = []
+    for numero, (clave, (tablero, jugador)) in enumerate(sorted(posiciones.items()), 1):
+        oponente = tablero.obtener_jugador_oponente(jugador)
+        puntuados = []
+        for movimiento in tablero.movimientos_disponibles(jugador):
+            algoritmo.reiniciar_busqueda()
+            valor, _ = algoritmo.buscar(tablero.aplicar_movimiento(movimiento), oponente, profundidad - 1)
+            puntuados.append((valor, movimiento))
+        
+        # Del mejor al peor para el jugador con el turno; a igual valor, orden estable
+        puntuados.sort(key=lambda par: (-par[0] if jugador == JUGADOR_BLANCO else par[0], par[1]))
+        registros.extend((clave, _codificar_movimiento(movimiento), valor)
+                         for valor, movimiento in puntuados[:movimientos_por_posicion])
+        if progreso is not None:
+            progreso(numero, len(posiciones))
+    
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(CABECERA.pack(FIRMA, VERSION, len(registros)))
+        for registro in registros:
+            archivo.write(REGISTRO.pack(*registro))
+    os.replace(temporal, ruta)  # Un lector nunca ve el archivo a medio escribir
+    return len(posiciones)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Construye el libro de aperturas.")
+    parser.add_argument("--salida", default=LIBRO_APERTURAS_RUTA, help="Archivo del libro")
+    parser.add_argument("--plies", type=int, default=LIBRO_APERTURAS_PLIES,
+                        help="Jugadas desde la posición inicial que cubre el libro")
+    parser.add_argument("--profundidad", type=int, default=LIBRO_APERTURAS_PROFUNDIDAD,
+                        help="Profundidad de la búsqueda de cada posición")
+    parser.add_argument("--movimientos", type=int, default=LIBRO_APERTURAS_MOVIMIENTOS,
+                        help="Movimientos guardados por posición")
+    args = parser.parse_args(argumentos)
+    
+    def progreso(numero, total):
+        print(f"\rPosición {numero}/{total}", end="", flush=True)
+    
+    inicio = time.perf_counter()
+    posiciones = construir(args.salida, args.plies, args.profundidad, args.movimientos, progreso)
+    print(f"\n{posiciones} posiciones guardadas en {args.salida} "
+          f"({os.path.getsize(args.salida):,} bytes, {time.perf_counter() - inicio:.1f} segundos)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
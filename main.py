@@ -1,14 +1,13 @@
 import pygame
 import sys
-import time
-import os
 from typing import Optional, Tuple, Set
 
 # Importar las clases del juego
 from configuracion import *
-from tablero import Tablero
+from tablero import crear_tablero
 from jugador import JugadorHumano, GestorMovimientos
-from algoritmos import JugadorIA
+from trabajador_ia import TrabajadorIA
+from registro_tiempos import RegistroTiempos
 
 
 class JuegoDamas:
@@ -60,12 +59,13 @@ class JuegoDamas:
     def _inicializar_estado(self):
         """Inicializa el estado del juego."""
         # Componentes principales del juego
-        self.tablero = Tablero()
+        self.tablero = crear_tablero()
         self.gestor_movimientos = GestorMovimientos()
         
         # Jugadores
         self.jugador_humano: Optional[JugadorHumano] = None
-        self.jugador_ia: Optional[JugadorIA] = None
+        self.trabajador_ia: Optional[TrabajadorIA] = None  # Busca en un proceso aparte
+        self.opciones_ia: dict = {}  # Argumentos de JugadorIA con los que se creó trabajador_ia
         
         # Estado del juego
         self.jugador_usuario: Optional[str] = None  # Color del jugador humano
@@ -86,21 +86,24 @@ class JuegoDamas:
         # Métricas de la IA
         self.tiempo_total_ia: float = 0.0
         self.cantidad_movimientos_ia: int = 0
-        self.tiempos_ia: list = []
+        self.duracion_total_ia_ns: int = 0
+        self.estadisticas_ultima_busqueda: Optional[dict] = None
         self.resumen_escrito: bool = False
     
     def _configurar_logging(self):
-        """Configura el sistema de logging de tiempos."""
-        if not os.path.exists("LogTime"):
-            os.makedirs("LogTime")
-        
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
-        self.nombre_archivo_log = f"LogTime/logtime_{timestamp}.txt"
-        
-        with open(self.nombre_archivo_log, "w", encoding="utf-8") as archivo:
-            archivo.write("=== LOG DE TIEMPOS DE LA IA - JUEGO DE DAMAS ===\n")
-            archivo.write(f"Inicio de sesión: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            archivo.write("="*50 + "\n\n")
+        """Configura el registro de tiempos; la escritura ocurre en segundo plano."""
+        self.registro_tiempos = RegistroTiempos()
+    
+    def _configuracion_partida(self) -> dict:
+        """
+        Configuración de la IA que acompaña a cada registro de la partida:
+        el algoritmo, el color y todas las opciones con que se creó el trabajador.
+        """
+        return {
+            "algoritmo": "alfa_beta" if self.modo_busqueda_alfa_beta else "minimax",
+            "color_ia": self.trabajador_ia.color,
+            **self.opciones_ia,
+        }
     
     def configurar_jugadores(self, color_usuario: str, usar_alfa_beta: bool, nivel: int):
         """
@@ -116,19 +119,31 @@ class JuegoDamas:
         
         # Crear jugador IA (color opuesto al humano)
         color_ia = JUGADOR_NEGRO if color_usuario == JUGADOR_BLANCO else JUGADOR_BLANCO
-        self.jugador_ia = JugadorIA(color_ia)
-        self.jugador_ia.establecer_nivel(nivel)
-        self.jugador_ia.cambiar_algoritmo(usar_alfa_beta=usar_alfa_beta)
+        self.opciones_ia = {
+            "nivel": nivel,
+            "usar_alfa_beta": usar_alfa_beta,
+            "meditar": MEDITAR_EN_TURNO_RIVAL,
+            "usar_libro": USAR_LIBRO_APERTURAS,
+            "usar_tablas_finales": USAR_TABLAS_FINALES,
+            "usar_quiescencia": USAR_QUIESCENCIA,
+            "usar_evaluacion_lotes": USAR_EVALUACION_LOTES,
+        }
+        self.trabajador_ia = TrabajadorIA(color_ia, **self.opciones_ia)
+        self.registro_tiempos.nueva_partida(self._configuracion_partida())
+        if self.jugador_activo == self.jugador_usuario:
+            self.trabajador_ia.meditar(self.tablero)
     
     def reiniciar_juego(self):
         """Reinicia completamente el juego."""
-        if self.cantidad_movimientos_ia > 0:
-            with open(self.nombre_archivo_log, "a", encoding="utf-8") as archivo:
-                archivo.write(f"\n--- NUEVA PARTIDA ---\n")
-                archivo.write(f"Inicio: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
+        self._cerrar_trabajador_ia()
         self._inicializar_estado()
     
+    def _cerrar_trabajador_ia(self):
+        """Cancela la búsqueda en curso y detiene el proceso de la IA."""
+        if self.trabajador_ia is not None:
+            self.trabajador_ia.cerrar()
+            self.trabajador_ia = None
+    
     def obtener_informacion_movimiento(self, tablero_antes: list, tablero_despues: list, movimiento: tuple) -> str:
         """
         Analiza un movimiento y retorna información descriptiva.
@@ -305,18 +320,27 @@ class JuegoDamas:
         self.pieza_seleccionada = None
         self.movimientos_posibles = set()
         self.jugador_activo = JUGADOR_NEGRO if self.jugador_activo == JUGADOR_BLANCO else JUGADOR_BLANCO
+        self._comprobar_fin_partida()
     
     def ejecutar_movimiento_ia(self):
-        """Ejecuta un movimiento de la IA."""
+        """
+        Avanza el turno de la IA sin bloquear el bucle principal: lanza la
+        búsqueda en el trabajador y, en los fotogramas siguientes, aplica el
+        movimiento cuando está listo.
+        """
         if self.jugador_activo == self.jugador_usuario or self.tablero.es_final(self.jugador_activo):
             return
         
-        # Medir tiempo de pensamiento
-        tiempo_inicio = time.time()
-        movimiento_ia = self.jugador_ia.obtener_movimiento(self.tablero)
-        tiempo_fin = time.time()
+        if not self.trabajador_ia.buscando():
+            self.trabajador_ia.iniciar_busqueda(self.tablero)
+            return
         
-        tiempo_movimiento = tiempo_fin - tiempo_inicio
+        resultado = self.trabajador_ia.obtener_resultado()
+        if resultado is None:
+            return
+        
+        # Tiempo de pensamiento y estadísticas medidos en el proceso de la IA
+        movimiento_ia, duracion_ns, estadisticas = resultado
         
         if movimiento_ia:
             # Guardar estado anterior
@@ -334,27 +358,42 @@ class JuegoDamas:
             self.ultimo_movimiento_fue_ia = True
             
             # Registrar tiempo
-            self._registrar_tiempo_ia(tiempo_movimiento)
+            self._registrar_tiempo_ia(duracion_ns, estadisticas)
             
             # Cambiar turno
             self.jugador_activo = JUGADOR_NEGRO if self.jugador_activo == JUGADOR_BLANCO else JUGADOR_BLANCO
+            self._comprobar_fin_partida()
+            
+            # Pensar durante el turno del humano
+            if not self.tablero.es_final(self.jugador_activo):
+                self.trabajador_ia.meditar(self.tablero)
         else:
             print(f"La IA ({self.jugador_activo}) no encontró movimientos válidos.")
     
-    def _registrar_tiempo_ia(self, tiempo: float):
-        """Registra el tiempo de pensamiento de la IA."""
-        self.tiempo_total_ia += tiempo
+    def _registrar_tiempo_ia(self, duracion_ns: int, estadisticas: dict):
+        """Registra el tiempo de pensamiento y las estadísticas de búsqueda de la IA."""
+        self.duracion_total_ia_ns += duracion_ns
+        self.tiempo_total_ia = self.duracion_total_ia_ns / 1e9
         self.cantidad_movimientos_ia += 1
-        self.tiempos_ia.append(tiempo)
-        
-        with open(self.nombre_archivo_log, "a", encoding="utf-8") as archivo:
-            if self.cantidad_movimientos_ia == 1:
-                algoritmo_texto = "Alfa-Beta" if self.modo_busqueda_alfa_beta else "Minimax"
-                color_ia = "Negras" if self.jugador_usuario == JUGADOR_BLANCO else "Blancas"
-                archivo.write(f"Configuración: {algoritmo_texto} | Nivel {self.nivel_ia_seleccionado} | IA juega con {color_ia}\n")
-                archivo.write("-" * 50 + "\n")
-            
-            archivo.write(f"Movimiento {self.cantidad_movimientos_ia}: {tiempo:.8f} segundos\n")
+        self.estadisticas_ultima_busqueda = estadisticas
+        self.registro_tiempos.registrar_movimiento(self.cantidad_movimientos_ia, self._configuracion_partida(),
+                                                   duracion_ns, estadisticas)
+    
+    def _comprobar_fin_partida(self):
+        """Registra el resumen de la partida la primera vez que llega a su fin."""
+        if self.resumen_escrito or not self.tablero.es_final(self.jugador_activo):
+            return
+        
+        ganador = self.tablero.determinar_ganador(self.jugador_activo)
+        self.registro_tiempos.registrar(
+            "resumen",
+            configuracion=self._configuracion_partida(),
+            ganador=ganador,
+            movimientos_ia=self.cantidad_movimientos_ia,
+            duracion_total_ns=self.duracion_total_ia_ns,
+        )
+        self.registro_tiempos.vaciar(espera=0)  # Pide el volcado sin esperar al disco
+        self.resumen_escrito = True
     
     def dibujar_pantalla_configuracion(self):
         """Dibuja la pantalla de configuración inicial."""
@@ -529,7 +568,8 @@ class JuegoDamas:
             titulo_rect = titulo_render.get_rect(center=(self.VENTANA_ANCHO / 2, 30))
             self.pantalla.blit(titulo_render, titulo_rect)
         else:
-            titulo = "IA pensando..."
+            puntos = (pygame.time.get_ticks() // 400) % 4
+            titulo = "IA pensando" + "." * puntos + " " * (3 - puntos)
             titulo_render = self.fuente_grande.render(titulo, True, self.COLOR_BLANCO)
             titulo_rect = titulo_render.get_rect(center=(self.VENTANA_ANCHO / 2, 30))
             self.pantalla.blit(titulo_render, titulo_rect)
@@ -538,6 +578,8 @@ class JuegoDamas:
         if self.modo_busqueda_alfa_beta is not None and self.nivel_ia_seleccionado is not None:
             modo_texto = "Alfa-Beta" if self.modo_busqueda_alfa_beta else "Minimax"
             info_completa = f"IA: {modo_texto} | Nivel {self.nivel_ia_seleccionado}"
+            if self.estadisticas_ultima_busqueda is not None:
+                info_completa += f" | {self.estadisticas_ultima_busqueda['nodos_por_segundo']:,.0f} nodos/s"
             modo_info_texto = self.fuente_pequena.render(info_completa, True, self.COLOR_BLANCO)
             modo_info_rect = modo_info_texto.get_rect(center=(self.VENTANA_ANCHO / 2, self.VENTANA_ALTO - 40))
             self.pantalla.blit(modo_info_texto, modo_info_rect)
@@ -578,10 +620,6 @@ class JuegoDamas:
             
             self.pantalla.blit(estadisticas_render, estadisticas_rect)
             self.pantalla.blit(tiempo_render, tiempo_rect)
-            
-            # Escribir resumen final
-            if not self.resumen_escrito:
-                self._escribir_resumen_final(titulo_juego, tiempo_promedio)
         
         # Botón para reiniciar
         boton_reiniciar = self._obtener_rect_boton_reiniciar()
@@ -594,17 +632,6 @@ class JuegoDamas:
         """Retorna el rectángulo del botón de reiniciar."""
         return pygame.Rect(self.VENTANA_ANCHO / 3, self.VENTANA_ALTO/2, self.VENTANA_ANCHO / 3, 50)
     
-    def _escribir_resumen_final(self, titulo_juego: str, tiempo_promedio: float):
-        """Escribe el resumen final de la partida."""
-        with open(self.nombre_archivo_log, "a", encoding="utf-8") as archivo:
-            archivo.write(f"\n--- RESUMEN DE LA PARTIDA ---\n")
-            archivo.write(f"Total de movimientos de IA: {self.cantidad_movimientos_ia}\n")
-            archivo.write(f"Tiempo total: {self.tiempo_total_ia:.8f} segundos\n")
-            archivo.write(f"Tiempo promedio: {tiempo_promedio:.8f} segundos\n")
-            archivo.write(f"Ganador: {titulo_juego}\n")
-            archivo.write(f"{'='*50}\n\n")
-        self.resumen_escrito = True
-    
     def ejecutar(self):
         """
         Bucle principal del juego.
@@ -616,6 +643,8 @@ class JuegoDamas:
             # Manejar eventos
             for evento in pygame.event.get():
                 if evento.type == pygame.QUIT:
+                    self._cerrar_trabajador_ia()
+                    self.registro_tiempos.cerrar()
                     pygame.quit()
                     sys.exit()
                 
@@ -0,0 +1,95 @@
+# ordenamiento.py
+"""
+Ordenamiento de movimientos para la poda Alfa-Beta.
+Cuanto antes se explora el mejor movimiento, más ramas se podan.
+"""
+from configuracion import *
+
+
+# Prioridades (menor valor = se explora antes)
+PRIORIDAD_TRANSPOSICION = 0
+PRIORIDAD_CORONACION = 1
+PRIORIDAD_ASESINO = 2
+PRIORIDAD_RESTO = 3
+
+ASESINOS_POR_PLY = 2
+
+
+class OrdenadorMovimientos:
+    """
+    Ordena los movimientos de cada nodo con, en este orden de prioridad:
+    el movimiento de la tabla de transposición (variante principal),
+    las coronaciones, los movimientos asesinos del ply y la heurística
+    de historia actualizada en cada corte.
+    
+    Las capturas no necesitan prioridad propia: son obligatorias, así que
+    cuando existen el generador solo devuelve capturas.
+    """
+    
+    def __init__(self):
+        self.asesinos = {}  # ply -> lista de movimientos que produjeron corte
+        self.historia = {}  # (jugador, movimiento) -> puntaje acumulado
+        self.cortes_por_profundidad = {}  # profundidad -> [cortes, cortes con el primer movimiento]
+    
+    def nueva_busqueda(self):
+        """
+        Prepara una nueva búsqueda desde la raíz: olvida los asesinos
+        (dependen del ply) y reduce a la mitad la historia acumulada.
+        """
+        self.asesinos = {}
+        self.historia = {clave: puntaje // 2 for clave, puntaje in self.historia.items() if puntaje > 1}
+    
+    def ordenar(self, tablero, movimientos, jugador, ply, movimiento_tabla=None):
+        """Retorna los movimientos como lista ordenada por prioridad."""
+        asesinos = self.asesinos.get(ply, ())
+        historia = self.historia
+        
+        def prioridad(movimiento):
+            if movimiento == movimiento_tabla:
+                return PRIORIDAD_TRANSPOSICION, 0
+            if self._es_coronacion(tablero, movimiento, jugador):
+                return PRIORIDAD_CORONACION, 0
+            if movimiento in asesinos:
+                return PRIORIDAD_ASESINO, 0
+            return PRIORIDAD_RESTO, -historia.get((jugador, movimiento), 0)
+        
+        return sorted(movimientos, key=prioridad)
+    
+    def _es_coronacion(self, tablero, movimiento, jugador):
+        (origen_f, origen_c), (destino_f, _) = movimiento
+        pieza = tablero.obtener_pieza(origen_f, origen_c)
+        if jugador == JUGADOR_BLANCO:
+            return pieza == JUGADOR_BLANCO and destino_f == 0
+        return pieza == JUGADOR_NEGRO and destino_f == TABLERO_DIM - 1
+    
+    def registrar_corte(self, movimiento, jugador, ply, profundidad, indice):
+        """
+        Actualiza asesinos, historia y estadísticas cuando un movimiento
+        produce un corte beta. indice es su posición en el orden explorado.
+        """
+        asesinos = self.asesinos.setdefault(ply, [])
+        if movimiento not in asesinos:
+            asesinos.insert(0, movimiento)
+            del asesinos[ASESINOS_POR_PLY:]
+        
+        clave = (jugador, movimiento)
+        self.historia[clave] = self.historia.get(clave, 0) + profundidad * profundidad
+        
+        contadores = self.cortes_por_profundidad.setdefault(profundidad, [0, 0])
+        contadores[0] += 1
+        if indice == 0:
+            contadores[1] += 1
+    
+    def obtener_estadisticas(self):
+        """
+        Retorna, por profundidad restante, cuántos cortes hubo y qué fracción
+        la produjo el primer movimiento explorado.
+        """
+        return {
+            profundidad: {
+                "cortes": cortes,
+                "cortes_primer_movimiento": primeros,
+                "tasa_primer_movimiento": primeros / cortes if cortes else 0.0,
+            }
+            for profundidad, (cortes, primeros) in sorted(self.cortes_por_profundidad.items())
+        }
@@ -0,0 +1,321 @@
+# paralelo.py
+"""
+Búsqueda paralela en la raíz: cada movimiento de la raíz se busca en un
+proceso distinto de un pool que se reutiliza entre jugadas. Los procesos
+comparten el mejor valor exacto encontrado hasta el momento para acotar
+la ventana alfa-beta de los que empiezan después.
+
+También ofrece una búsqueda Lazy SMP: todos los procesos buscan la misma
+raíz a profundidades escalonadas y comparten una tabla de transposición
+en memoria compartida, de modo que cada uno aprovecha lo que los demás ya
+han resuelto.
+"""
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker
+from configuracion import *
+from algoritmos import (AlgoritmoBusqueda, AlgoritmoMinimax, AlgoritmoMinimaxAlfaBeta, AlgoritmoPVS,
+                        BusquedaInterrumpida, ConfiguracionIA)
+from ordenamiento import OrdenadorMovimientos
+from tablas_finales import TablasFinales
+from transposicion import TablaTransposicionCompartida
+
+
+_pool = None
+_procesos_pool = None
+_mejor_compartido = None  # Mejor valor exacto de la raíz, desde el punto de vista del jugador raíz
+_detener_compartido = None  # Distinto de cero: los trabajadores Lazy SMP abandonan la búsqueda
+_tabla_compartida = None
+_bloqueo_busqueda = threading.Lock()  # Una búsqueda paralela a la vez por pool
+
+# Estado propio de cada proceso trabajador
+_mejor_trabajador = None
+_detener_trabajador = None
+_algoritmos_trabajador = {}
+
+
+def _inicializar_trabajador(mejor_compartido, detener_compartido):
+    global _mejor_trabajador, _detener_trabajador
+    _mejor_trabajador = mejor_compartido
+    _detener_trabajador = detener_compartido
+
+
+def _algoritmo_trabajador(usar_alfa_beta, hacer_deshacer):
+    """Reutiliza una instancia de algoritmo por configuración dentro del trabajador."""
+    clave = (usar_alfa_beta, hacer_deshacer)
+    if clave not in _algoritmos_trabajador:
+        clase = AlgoritmoMinimaxAlfaBeta if usar_alfa_beta else AlgoritmoMinimax
+        algoritmo = clase(ConfiguracionIA(), hacer_deshacer)
+        algoritmo.senal_parada = _detener_trabajador
+        _algoritmos_trabajador[clave] = algoritmo
+    return _algoritmos_trabajador[clave]
+
+
+def _buscar_movimiento_raiz(clase_tablero, datos, jugador, movimiento, profundidad,
+                            usar_alfa_beta, hacer_deshacer, compartir_ventana):
+    """
+    Busca el subárbol de un movimiento de la raíz.
+    Retorna (valor, exacto, contadores); si exacto es False el valor es una
+    cota que no supera al mejor valor compartido.
+    """
+    tablero = clase_tablero.desde_serializado(datos)
+    hijo = tablero.aplicar_movimiento(movimiento)
+    oponente = tablero.obtener_jugador_oponente(jugador)
+    signo = 1 if jugador == JUGADOR_BLANCO else -1
+    
+    algoritmo = _algoritmo_trabajador(usar_alfa_beta, hacer_deshacer)
+    algoritmo.reiniciar_busqueda()
+    
+    if not usar_alfa_beta:
+        valor, _ = algoritmo.buscar(hijo, oponente, profundidad - 1)
+        return valor, True, algoritmo._contadores()
+    
+    mejor = _mejor_trabajador.value if compartir_ventana else -math.inf
+    if jugador == JUGADOR_BLANCO:
+        valor, _ = algoritmo.buscar(hijo, oponente, profundidad - 1, alfa=mejor)
+    else:
+        valor, _ = algoritmo.buscar(hijo, oponente, profundidad - 1, beta=-mejor)
+    
+    exacto = signo * valor > mejor
+    if exacto and compartir_ventana:
+        with _mejor_trabajador.get_lock():
+            if signo * valor > _mejor_trabajador.value:
+                _mejor_trabajador.value = signo * valor
+    return valor, exacto, algoritmo._contadores()
+
+
+def _algoritmo_lazy_smp(nombre_tabla, max_entradas, hacer_deshacer, ordenar_movimientos, opciones):
+    """
+    Reutiliza, dentro del trabajador, un algoritmo conectado a la tabla
+    compartida; su ordenador conserva asesinos e historia entre búsquedas.
+    opciones es (usar_pvs, usar_tablas_finales, quiescencia, evaluacion_lotes).
+    """
+    clave = ("lazy_smp", nombre_tabla, hacer_deshacer, ordenar_movimientos, opciones)
+    if clave not in _algoritmos_trabajador:
+        usar_pvs, usar_tablas_finales, quiescencia, evaluacion_lotes = opciones
+        tabla = TablaTransposicionCompartida(max_entradas, nombre=nombre_tabla)
+        ordenador = OrdenadorMovimientos() if ordenar_movimientos else None
+        tablas_finales = TablasFinales() if usar_tablas_finales else None
+        clase = AlgoritmoPVS if usar_pvs else AlgoritmoMinimaxAlfaBeta
+        algoritmo = clase(ConfiguracionIA(), hacer_deshacer, tabla, ordenador, tablas_finales,
+                          quiescencia, evaluacion_lotes)
+        algoritmo.senal_parada = _detener_trabajador
+        _algoritmos_trabajador[clave] = algoritmo
+    return _algoritmos_trabajador[clave]
+
+
+def _buscar_lazy_smp(clase_tablero, datos, jugador, profundidad, nombre_tabla, max_entradas,
+                     hacer_deshacer, ordenar_movimientos, opciones, limite_tiempo):
+    """
+    Busca la raíz completa a la profundidad indicada sobre la tabla compartida.
+    Retorna ((profundidad, valor, mejor_movimiento), contadores); el primer elemento
+    es None si la búsqueda se abandonó por tiempo o por la señal de parada.
+    """
+    tablero = clase_tablero.desde_serializado(datos)
+    algoritmo = _algoritmo_lazy_smp(nombre_tabla, max_entradas, hacer_deshacer, ordenar_movimientos, opciones)
+    algoritmo.reiniciar_busqueda()
+    algoritmo.limite_tiempo = limite_tiempo
+    try:
+        valor, movimiento = algoritmo.buscar(tablero, jugador, profundidad)
+    except BusquedaInterrumpida:
+        return None, algoritmo._contadores()
+    finally:
+        algoritmo.limite_tiempo = None
+    return (profundidad, valor, movimiento), algoritmo._contadores()
+
+
+def obtener_pool(procesos=None):
+    """Retorna el pool de procesos, creándolo solo la primera vez o si cambia su tamaño."""
+    global _pool, _procesos_pool, _mejor_compartido, _detener_compartido
+    procesos = procesos or os.cpu_count() or 1
+    if _pool is None or _procesos_pool != procesos:
+        cerrar_pool()
+        # Los trabajadores deben compartir el rastreador de recursos del proceso principal;
+        # si arrancaran uno propio, al terminar borrarían la tabla compartida a la que se conectan
+        resource_tracker.ensure_running()
+        _mejor_compartido = multiprocessing.Value("d", -math.inf)
+        _detener_compartido = multiprocessing.Value("b", 0, lock=False)
+        _pool = ProcessPoolExecutor(max_workers=procesos,
+                                    initializer=_inicializar_trabajador,
+                                    initargs=(_mejor_compartido, _detener_compartido))
+        _procesos_pool = procesos
+    return _pool
+
+
+def obtener_tabla_compartida(max_entradas=TRANSPOSICION_MAX_ENTRADAS):
+    """Retorna la tabla de transposición compartida, creándola la primera vez o si cambia su tamaño."""
+    global _tabla_compartida
+    if _tabla_compartida is None or _tabla_compartida.max_entradas != max_entradas:
+        cerrar_tabla_compartida()
+        _tabla_compartida = TablaTransposicionCompartida(max_entradas)
+    return _tabla_compartida
+
+
+def cerrar_pool():
+    """Detiene los procesos trabajadores."""
+    global _pool, _procesos_pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
+        _procesos_pool = None
+
+
+def cerrar_tabla_compartida():
+    """Libera la memoria compartida de la tabla de transposición."""
+    global _tabla_compartida
+    if _tabla_compartida is not None:
+        _tabla_compartida.cerrar()
+        _tabla_compartida = None
+
+
+def _esperar_tareas(tareas, esperadas, algoritmo):
+    """
+    Espera a que terminen las tareas esperadas comprobando cada poco los
+    límites del algoritmo del proceso principal. Al terminar, o si estos lo
+    interrumpen, activa la señal de parada hasta que acaban todas las tareas.
+    """
+    try:
+        while wait(esperadas, timeout=INTERVALO_ESPERA_PARALELA).not_done:
+            algoritmo._verificar_tiempo()
+    finally:
+        _detener_compartido.value = 1
+        wait(tareas)
+        _detener_compartido.value = 0
+
+
+# atexit ejecuta en orden inverso: primero se detienen los trabajadores, luego se libera la tabla
+atexit.register(cerrar_tabla_compartida)
+atexit.register(cerrar_pool)
+
+
+class AlgoritmoParaleloRaiz(AlgoritmoBusqueda):
+    """
+    Reparte los movimientos de la raíz entre los procesos del pool.
+    Elige el mismo movimiento que la búsqueda serie a igual profundidad:
+    el primero, en el orden de generación, que alcanza el mejor valor.
+    Los trabajadores usan Minimax o Alfa-Beta simples a profundidad fija,
+    sin tabla de transposición, ordenador, quiescencia, tablas finales ni
+    evaluación por lotes; JugadorIA rechaza esas opciones con usar_paralelo.
+    """
+    
+    def __init__(self, configuracion_ia, usar_alfa_beta=True, hacer_deshacer=False,
+                 procesos=PROCESOS_PARALELOS):
+        super().__init__(configuracion_ia, hacer_deshacer)
+        self.usar_alfa_beta = usar_alfa_beta
+        self.procesos = procesos
+    
+    def buscar(self, tablero, jugador_actual, profundidad):
+        """Retorna (valor, mejor_movimiento) buscando a la profundidad indicada."""
+        self.nodos_visitados += 1
+        self._profundidad_raiz = profundidad
+        estado = tablero.analizar_nodo(jugador_actual)
+        if estado.ganador is not None or profundidad == 0:
+            return self._evaluar_hoja(tablero, jugador_actual, estado, profundidad), None
+        
+        # El mismo orden que la búsqueda serie: Alfa-Beta sin ordenador
+        # recorre generar_movimientos y Minimax los movimientos del estado
+        if self.usar_alfa_beta:
+            movimientos = list(tablero.generar_movimientos(jugador_actual))
+        else:
+            movimientos = list(estado.movimientos)
+        datos = tablero.serializar()
+        clase_tablero = type(tablero)
+        signo = 1 if jugador_actual == JUGADOR_BLANCO else -1
+        
+        with _bloqueo_busqueda:
+            pool = obtener_pool(self.procesos)
+            with _mejor_compartido.get_lock():
+                _mejor_compartido.value = -math.inf
+            
+            tareas = [
+                pool.submit(_buscar_movimiento_raiz, clase_tablero, datos, jugador_actual,
+                            movimiento, profundidad, self.usar_alfa_beta, self.hacer_deshacer, True)
+                for movimiento in movimientos
+            ]
+            _esperar_tareas(tareas, tareas, self)
+            resultados = [tarea.result() for tarea in tareas]
+            for _, _, contadores in resultados:
+                self._sumar_contadores(contadores, ply=1)
+            
+            mejor_valor = max(signo * valor for valor, exacto, _ in resultados if exacto)
+            
+            # Recorre en orden de generación: un movimiento anterior que solo
+            # tiene una cota igual al mejor valor se vuelve a buscar con ventana completa
+            for movimiento, (valor, exacto, _) in zip(movimientos, resultados):
+                if signo * valor != mejor_valor:
+                    continue
+                if not exacto:
+                    tarea = pool.submit(
+                        _buscar_movimiento_raiz, clase_tablero, datos, jugador_actual,
+                        movimiento, profundidad, self.usar_alfa_beta, self.hacer_deshacer, False
+                    )
+                    _esperar_tareas([tarea], [tarea], self)
+                    valor, _, contadores = tarea.result()
+                    self._sumar_contadores(contadores, ply=1)
+                    if signo * valor != mejor_valor:
+                        continue
+                return valor, movimiento
+
+
+class AlgoritmoLazySMP(AlgoritmoBusqueda):
+    """
+    Búsqueda Lazy SMP con Alfa-Beta: cada proceso del pool busca la raíz
+    completa, el principal a la profundidad pedida y los auxiliares
+    alternando esa profundidad y la siguiente. Solo se comunican a través
+    de la tabla de transposición compartida.
+    
+    Retorna el resultado más profundo completado antes de que termine el
+    principal (a igual profundidad, el del principal). Expone buscar() y
+    limite_tiempo como AlgoritmoMinimaxAlfaBeta, así que puede usarse dentro
+    de AlgoritmoProfundizacionIterativa.
+    
+    PVS, las tablas finales, la quiescencia y la evaluación por lotes se
+    aplican en la búsqueda de cada trabajador. La tabla de transposición es
+    siempre la compartida.
+    """
+    
+    def __init__(self, configuracion_ia, hacer_deshacer=False, ordenar_movimientos=False,
+                 procesos=PROCESOS_PARALELOS, max_entradas=TRANSPOSICION_MAX_ENTRADAS,
+                 usar_pvs=False, usar_tablas_finales=False, quiescencia=False, evaluacion_lotes=False):
+        super().__init__(configuracion_ia, hacer_deshacer, quiescencia)
+        self.ordenar_movimientos = ordenar_movimientos
+        self.opciones_trabajador = (usar_pvs, usar_tablas_finales, quiescencia, evaluacion_lotes)
+        self.procesos = procesos
+        self.max_entradas = max_entradas
+        self.profundidad_resultado = 0
+    
+    def buscar(self, tablero, jugador_actual, profundidad):
+        """
+        Retorna (valor, mejor_movimiento) buscando al menos a la profundidad indicada.
+        Lanza BusquedaInterrumpida si el principal no termina antes de limite_tiempo
+        o se activa senal_parada.
+        """
+        datos = tablero.serializar()
+        clase_tablero = type(tablero)
+        
+        with _bloqueo_busqueda:
+            pool = obtener_pool(self.procesos)
+            tabla = obtener_tabla_compartida(self.max_entradas)
+            
+            tareas = [
+                pool.submit(_buscar_lazy_smp, clase_tablero, datos, jugador_actual,
+                            profundidad + indice % 2, tabla.nombre, self.max_entradas,
+                            self.hacer_deshacer, self.ordenar_movimientos, self.opciones_trabajador,
+                            self.limite_tiempo)
+                for indice in range(_procesos_pool)
+            ]
+            _esperar_tareas(tareas, tareas[:1], self)
+            resultados = [tarea.result() for tarea in tareas]
+        
+        for _, contadores in resultados:
+            self._sumar_contadores(contadores)
+        if resultados[0][0] is None:
+            raise BusquedaInterrumpida()
+        
+        completados = [resultado for resultado, _ in resultados if resultado is not None]
+        self.profundidad_resultado, valor, movimiento = max(completados, key=lambda r: r[0])
+        return valor, movimiento
@@ -0,0 +1,147 @@
+# perft.py
+"""
+Perft: cuenta las hojas del árbol de movimientos legales hasta una
+profundidad dada. Verifica movimientos_disponibles y aplicar_movimiento
+(o hacer/deshacer_movimiento) contra conteos de referencia y mide la
+velocidad del motor de tablero sin la búsqueda ni la evaluación.
+
+Uso:
+    python perft.py --profundidad 6
+    python perft.py --posicion damas --profundidad 5 --dividir
+    python perft.py --motor bits --hacer-deshacer --verificar
+"""
+import argparse
+import sys
+import time
+from configuracion import *
+from tablero import Tablero
+from tablero_bits import TableroBits
+from tablero_compacto import TableroCompacto
+from posiciones import POSICIONES, crear_posicion
+
+
+MOTORES = {"listas": Tablero, "bits": TableroBits, "compacto": TableroCompacto}
+
+# Conteos de referencia: posición -> {profundidad: hojas}
+# Se obtuvieron con todos los motores y con aplicar_movimiento y hacer/deshacer_movimiento.
+# Siguen las reglas de este motor (una captura por movimiento), no las de otros programas.
+REFERENCIAS_PERFT = {
+    "inicial": {1: 7, 2: 49, 3: 302, 4: 1469, 5: 7361, 6: 36768, 7: 180018},
+    "medio_juego": {1: 2, 2: 3, 3: 11, 4: 31, 5: 162, 6: 845, 7: 4593, 8: 23102},
+    "capturas": {1: 3, 2: 9, 3: 18, 4: 39, 5: 177, 6: 652, 7: 4987, 8: 29674},
+    "damas": {1: 2, 2: 4, 3: 26, 4: 313, 5: 3068, 6: 35849},
+}
+
+
+def perft(tablero, jugador, profundidad, hacer_deshacer=False):
+    """Retorna el número de hojas a la profundidad indicada."""
+    if profundidad == 0:
+        return 1
+    
+    movimientos = tablero.movimientos_disponibles(jugador)
+    if profundidad == 1:
+        return len(movimientos)
+    
+    oponente = tablero.obtener_jugador_oponente(jugador)
+    hojas = 0
+    for movimiento in movimientos:
+        if hacer_deshacer:
+            tablero.hacer_movimiento(movimiento)
+            hojas += perft(tablero, oponente, profundidad - 1, True)
+            tablero.deshacer_movimiento()
+        else:
+            hojas += perft(tablero.aplicar_movimiento(movimiento), oponente, profundidad - 1)
+    return hojas
+
+
+def dividir(tablero, jugador, profundidad, hacer_deshacer=False):
+    """Retorna {movimiento: hojas} con el conteo del subárbol de cada movimiento de la raíz."""
+    oponente = tablero.obtener_jugador_oponente(jugador)
+    conteos = {}
+    for movimiento in sorted(tablero.movimientos_disponibles(jugador)):
+        if hacer_deshacer:
+            tablero.hacer_movimiento(movimiento)
+            conteos[movimiento] = perft(tablero, oponente, profundidad - 1, True)
+            tablero.deshacer_movimiento()
+        else:
+            conteos[movimiento] = perft(tablero.aplicar_movimiento(movimiento), oponente,
+                                        profundidad - 1)
+    return conteos
+
+
+def _medir(funcion, *argumentos):
+    """Retorna (resultado, segundos) de ejecutar la función."""
+    inicio = time.perf_counter()
+    resultado = funcion(*argumentos)
+    return resultado, time.perf_counter() - inicio
+
+
+def _velocidad(hojas, segundos):
+    return f"{hojas / segundos:,.0f} hojas/s" if segundos > 0 else "-"
+
+
+def verificar(clase_tablero, hacer_deshacer, profundidad_maxima=None):
+    """
+    Compara perft con REFERENCIAS_PERFT en todas las posiciones.
+    Retorna la lista de discrepancias (posición, profundidad, esperado, obtenido).
+    """
+    errores = []
+    for nombre, referencias in REFERENCIAS_PERFT.items():
+        for profundidad, esperado in sorted(referencias.items()):
+            if profundidad_maxima is not None and profundidad > profundidad_maxima:
+                continue
+            tablero, jugador = crear_posicion(nombre, clase_tablero)
+            obtenido, segundos = _medir(perft, tablero, jugador, profundidad, hacer_deshacer)
+            estado = "ok" if obtenido == esperado else f"ERROR (esperado {esperado})"
+            print(f"{nombre:<12} profundidad {profundidad}: {obtenido:>12,} {estado} | "
+                  f"{_velocidad(obtenido, segundos)}")
+            if obtenido != esperado:
+                errores.append((nombre, profundidad, esperado, obtenido))
+    return errores
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Perft del generador de movimientos.")
+    parser.add_argument("--posicion", choices=sorted(POSICIONES), default="inicial")
+    parser.add_argument("--profundidad", type=int, default=None,
+                        help="Por defecto 5; con --verificar, todas las profundidades de referencia")
+    parser.add_argument("--motor", choices=sorted(MOTORES), default=MOTOR_TABLERO)
+    parser.add_argument("--hacer-deshacer", action="store_true",
+                        help="Usar hacer/deshacer_movimiento en lugar de aplicar_movimiento")
+    parser.add_argument("--dividir", action="store_true", help="Desglosar el conteo por movimiento de la raíz")
+    parser.add_argument("--verificar", action="store_true",
+                        help="Comparar todas las posiciones con los conteos de referencia")
+    args = parser.parse_args(argumentos)
+    
+    if TABLERO_DIM != 8:
+        parser.error("Las posiciones de referencia están escritas para un tablero de 8x8")
+    clase_tablero = MOTORES[args.motor]
+    
+    if args.verificar:
+        errores = verificar(clase_tablero, args.hacer_deshacer, args.profundidad)
+        print("Perft correcto" if not errores else f"{len(errores)} conteos no coinciden")
+        return 1 if errores else 0
+    
+    if args.profundidad is None:
+        args.profundidad = 5
+    tablero, jugador = crear_posicion(args.posicion, clase_tablero)
+    if args.dividir:
+        conteos, segundos = _medir(dividir, tablero, jugador, args.profundidad, args.hacer_deshacer)
+        for movimiento, hojas in conteos.items():
+            print(f"{movimiento}: {hojas:,}")
+        hojas = sum(conteos.values())
+    else:
+        hojas, segundos = _medir(perft, tablero, jugador, args.profundidad, args.hacer_deshacer)
+    
+    print(f"{args.posicion} profundidad {args.profundidad}: {hojas:,} hojas en {segundos:.3f} s "
+          f"({_velocidad(hojas, segundos)})")
+    
+    esperado = REFERENCIAS_PERFT.get(args.posicion, {}).get(args.profundidad)
+    if esperado is not None and esperado != hojas:
+        print(f"ERROR: se esperaban {esperado:,} hojas")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# posiciones.py
+"""
+Posiciones de referencia para las herramientas de medición (perft, benchmarks).
+Cada posición se escribe fila a fila: "b"/"n" peones blancos/negros,
+"B"/"N" damas blancas/negras y "." casilla vacía. Solo las casillas oscuras
+pueden tener piezas.
+"""
+from configuracion import *
+from tablero import Tablero
+
+
+CARACTERES_PIEZA = {
+    ".": CELDA_VACIA,
+    "b": JUGADOR_BLANCO,
+    "n": JUGADOR_NEGRO,
+    "B": DAMA_BLANCA,
+    "N": DAMA_NEGRA,
+}
+
+# nombre -> (filas, jugador con el turno). Escritas para un tablero de 8x8.
+POSICIONES = {
+    "inicial": ((
+        ".n.n.n.n",
+        "n.n.n.n.",
+        ".n.n.n.n",
+        "........",
+        "........",
+        "b.b.b.b.",
+        ".b.b.b.b",
+        "b.b.b.b.",
+    ), JUGADOR_BLANCO),
+    "medio_juego": ((
+        ".n.n...n",
+        "n...n.n.",
+        ".n.....n",
+        "..n.n...",
+        "...b.b..",
+        "b.....b.",
+        ".b.b...b",
+        "b...b...",
+    ), JUGADOR_NEGRO),
+    "capturas": ((
+        "........",
+        "..n.n...",
+        ".....b..",
+        "..n.....",
+        ".b.b....",
+        "....n...",
+        ".b...b..",
+        "........",
+    ), JUGADOR_BLANCO),
+    "damas": ((
+        "...N....",
+        "........",
+        ".n...b..",
+        "........",
+        "...B....",
+        "..n.....",
+        ".......N",
+        "B.......",
+    ), JUGADOR_BLANCO),
+}
+
+
+def matriz_desde_filas(filas):
+    """Convierte las filas de texto en una matriz TABLERO_DIM x TABLERO_DIM."""
+    if len(filas) != TABLERO_DIM or any(len(fila) != TABLERO_DIM for fila in filas):
+        raise ValueError(f"La posición debe tener {TABLERO_DIM} filas de {TABLERO_DIM} casillas")
+    return [[CARACTERES_PIEZA[caracter] for caracter in fila] for fila in filas]
+
+
+def crear_posicion(nombre, clase_tablero=Tablero):
+    """Retorna (tablero, jugador) de una posición de referencia."""
+    filas, jugador = POSICIONES[nombre]
+    tablero = clase_tablero()
+    tablero.establecer_tablero(matriz_desde_filas(filas))
+    return tablero, jugador
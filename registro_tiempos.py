@@ -0,0 +1,146 @@
+# registro_tiempos.py
+"""
+Registro estructurado de los tiempos de la IA en formato JSON Lines.
+Cada línea es un objeto con el campo "tipo" ("sesion", "partida",
+"movimiento" o "resumen") y los datos del evento. La escritura la hace un
+hilo en segundo plano, de modo que el bucle de pygame nunca toca el disco;
+los registros se vuelcan al terminar cada partida y al salir.
+
+Al abrir una sesión se compacta el directorio: los archivos más antiguos
+se comprimen con gzip y los que exceden el máximo se eliminan.
+"""
+import atexit
+import gzip
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import weakref
+from configuracion import *
+
+
+_registros_activos = weakref.WeakSet()
+
+
+def compactar_directorio(directorio=DIRECTORIO_LOG_TIEMPOS, sin_comprimir=LOG_ARCHIVOS_SIN_COMPRIMIR,
+                         maximo=LOG_MAX_ARCHIVOS, excluir=()):
+    """
+    Comprime con gzip los logs de sesión salvo los sin_comprimir más recientes
+    y elimina los más antiguos hasta dejar como mucho maximo archivos.
+    Los logs de texto antiguos (.txt) reciben el mismo trato que los .jsonl.
+    Retorna (comprimidos, eliminados).
+    """
+    if not os.path.isdir(directorio):
+        return 0, 0
+    
+    excluir = {os.path.abspath(ruta) for ruta in excluir}
+    archivos = []
+    for nombre in os.listdir(directorio):
+        ruta = os.path.join(directorio, nombre)
+        if (nombre.startswith("logtime_") and nombre.endswith((".txt", ".jsonl", ".gz"))
+                and os.path.abspath(ruta) not in excluir):
+            archivos.append(ruta)
+    archivos.sort(key=os.path.getmtime, reverse=True)  # Más recientes primero
+    
+    comprimidos = eliminados = 0
+    for posicion, ruta in enumerate(archivos):
+        if posicion >= maximo:
+            os.remove(ruta)
+            eliminados += 1
+        elif posicion >= sin_comprimir and not ruta.endswith(".gz"):
+            with open(ruta, "rb") as origen, gzip.open(ruta + ".gz", "wb") as destino:
+                shutil.copyfileobj(origen, destino)
+            shutil.copystat(ruta, ruta + ".gz")  # Conserva la fecha para el orden
+            os.remove(ruta)
+            comprimidos += 1
+    return comprimidos, eliminados
+
+
+class RegistroTiempos:
+    """
+    Escritor de registros JSON Lines de una sesión de juego.
+    
+    registrar() solo encola el registro y retorna enseguida; un hilo lo
+    serializa y lo escribe. vaciar() espera a que todo lo encolado esté en
+    disco y cerrar() termina el hilo. Las duraciones se guardan en
+    nanosegundos medidos con time.perf_counter_ns().
+    """
+    
+    def __init__(self, directorio=DIRECTORIO_LOG_TIEMPOS, compactar=True):
+        os.makedirs(directorio, exist_ok=True)
+        marca = time.strftime("%Y%m%d_%H%M%S")
+        self.sesion = f"{marca}_{os.getpid()}"
+        self.ruta = os.path.join(directorio, f"logtime_{marca}.jsonl")
+        self.partida = 0
+        self._cola = queue.Queue()
+        self._hilo = threading.Thread(target=self._escribir, args=(directorio, compactar),
+                                      name="RegistroTiempos", daemon=True)
+        self._hilo.start()
+        _registros_activos.add(self)
+        self.registrar("sesion", inicio=time.strftime("%Y-%m-%d %H:%M:%S"))
+    
+    def _escribir(self, directorio, compactar):
+        """Bucle del hilo escritor: atiende registros y órdenes de volcado hasta recibir None."""
+        if compactar:
+            try:
+                compactar_directorio(directorio, excluir=[self.ruta])
+            except OSError as e:
+                print(f"Advertencia: no se pudo compactar {directorio} ({e})")
+        
+        with open(self.ruta, "a", encoding="utf-8") as archivo:
+            while True:
+                elemento = self._cola.get()
+                if elemento is None:
+                    self._cola.task_done()
+                    break
+                if isinstance(elemento, threading.Event):
+                    archivo.flush()
+                    elemento.set()
+                else:
+                    archivo.write(json.dumps(elemento, ensure_ascii=False) + "\n")
+                self._cola.task_done()
+    
+    def registrar(self, tipo, **datos):
+        """Encola un registro del tipo dado con la sesión y la partida actuales."""
+        registro = {"tipo": tipo, "sesion": self.sesion, "partida": self.partida, "fecha": time.time()}
+        registro.update(datos)
+        self._cola.put(registro)
+    
+    def nueva_partida(self, configuracion):
+        """Empieza una partida nueva y registra su configuración."""
+        self.partida += 1
+        self.registrar("partida", configuracion=configuracion)
+    
+    def registrar_movimiento(self, numero, configuracion, duracion_ns, estadisticas):
+        """Registra un movimiento de la IA con su duración y sus estadísticas de búsqueda."""
+        self.registrar("movimiento", movimiento=numero, configuracion=configuracion,
+                       duracion_ns=duracion_ns, estadisticas=estadisticas)
+    
+    def vaciar(self, espera=None):
+        """
+        Pide que los registros encolados lleguen al disco y espera hasta espera
+        segundos (None: sin límite; 0: no espera). Retorna si el volcado terminó.
+        """
+        if not self._hilo.is_alive():
+            return False
+        volcado = threading.Event()
+        self._cola.put(volcado)
+        return volcado.wait(espera)
+    
+    def cerrar(self, espera=2.0):
+        """Escribe lo pendiente y detiene el hilo escritor."""
+        if self._hilo.is_alive():
+            self._cola.put(None)
+            self._hilo.join(espera)
+        _registros_activos.discard(self)
+
+
+def cerrar_registros():
+    """Cierra todos los registros abiertos, volcando lo pendiente."""
+    for registro in list(_registros_activos):
+        registro.cerrar()
+
+
+atexit.register(cerrar_registros)
@@ -0,0 +1,345 @@
+# tablas_finales.py
+"""
+Tablas de finales de damas (solo reyes) resueltas por análisis retrógrado.
+Con reglas de capturas simples y damas voladoras, los finales de solo damas
+son cerrados: una captura lleva a un final con una pieza menos y nada
+vuelve a cambiar de tipo. Por eso se resuelven todos los de hasta
+max_piezas piezas, de menos a más piezas.
+
+Cada posición ocupa un byte con el resultado para el jugador con el turno:
+0 tablas (nadie puede forzar el final), 1-127 gana en ese número de
+jugadas, 128 + d pierde en d jugadas (las distancias se saturan en 127).
+
+Formato del archivo: una cabecera (FIRMA, versión, TABLERO_DIM, número de
+tramos), un directorio de tramos (damas blancas, damas negras, posición) y
+los datos de cada tramo: primero las posiciones con turno del blanco y
+luego las del negro. Dentro del tramo, las casillas de cada color se
+numeran por combinaciones (orden colex) sobre las casillas oscuras, en el
+mismo orden que Tablero.serializar().
+
+Uso:
+    python tablas_finales.py --piezas 4
+"""
+import argparse
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from configuracion import *
+from geometria import CASILLAS_OSCURAS, RAYOS
+from tablero import CODIGOS_PIEZA
+
+
+FIRMA = b"DAMASTBF"
+VERSION = 1
+CABECERA = struct.Struct("<8sIII")  # Firma, versión, TABLERO_DIM, número de tramos
+TRAMO = struct.Struct("<BBQ")  # Damas blancas, damas negras, posición de los datos
+
+TABLAS = 0
+DISTANCIA_MAXIMA = 127
+PIERDE = 128
+
+CASILLAS = len(CASILLAS_OSCURAS)
+_INDICE_CASILLA = {casilla: indice for indice, casilla in enumerate(CASILLAS_OSCURAS)}
+# RAYOS_INDICE[casilla]: las cuatro diagonales como listas de índices de casilla oscura
+RAYOS_INDICE = [
+    [[_INDICE_CASILLA[destino] for destino in rayo] for rayo in RAYOS[casilla].values() if rayo]
+    for casilla in CASILLAS_OSCURAS
+]
+CODIGO_DAMA_BLANCA = CODIGOS_PIEZA[DAMA_BLANCA]
+CODIGO_DAMA_NEGRA = CODIGOS_PIEZA[DAMA_NEGRA]
+
+
+def codificar(gana, distancia):
+    """Byte de resultado para el jugador con el turno."""
+    distancia = min(distancia, DISTANCIA_MAXIMA)
+    return distancia if gana else PIERDE + distancia
+
+
+def decodificar(valor):
+    """Retorna (resultado, distancia) con resultado 1 gana, -1 pierde o 0 tablas."""
+    if valor == TABLAS:
+        return 0, 0
+    if valor >= PIERDE:
+        return -1, valor - PIERDE
+    return 1, valor
+
+
+def _rango(casillas):
+    """Rango colex de una combinación ordenada de casillas."""
+    return sum(math.comb(casilla, posicion + 1) for posicion, casilla in enumerate(casillas))
+
+
+def _desde_rango(rango, cantidad):
+    """Combinación ordenada de cantidad casillas con el rango colex dado."""
+    casillas = []
+    for posicion in range(cantidad, 0, -1):
+        casilla = posicion - 1
+        while math.comb(casilla + 1, posicion) <= rango:
+            casilla += 1
+        casillas.append(casilla)
+        rango -= math.comb(casilla, posicion)
+    return casillas[::-1]
+
+
+class Tramo:
+    """
+    Posiciones con un número fijo de damas de cada color.
+    Convierte entre (blancas, negras, turno) y el índice dentro del tramo.
+    """
+    
+    def __init__(self, blancas, negras):
+        self.blancas = blancas
+        self.negras = negras
+        self.combinaciones_negras = math.comb(CASILLAS - blancas, negras)
+        self.posiciones = math.comb(CASILLAS, blancas) * self.combinaciones_negras  # Por turno
+        self.tamano = 2 * self.posiciones
+    
+    def indice(self, blancas, negras, turno_negro):
+        """blancas y negras son listas ordenadas de casillas; turno_negro 0 o 1."""
+        # Las negras se numeran sobre las casillas que dejan libres las blancas
+        relativas = [casilla - sum(1 for blanca in blancas if blanca < casilla) for casilla in negras]
+        indice = _rango(blancas) * self.combinaciones_negras + _rango(relativas)
+        return turno_negro * self.posiciones + indice
+    
+    def posicion(self, indice):
+        """Inversa de indice(): retorna (blancas, negras, turno_negro)."""
+        turno_negro, indice = divmod(indice, self.posiciones)
+        rango_blancas, rango_negras = divmod(indice, self.combinaciones_negras)
+        blancas = _desde_rango(rango_blancas, self.blancas)
+        libres = [casilla for casilla in range(CASILLAS) if casilla not in blancas]
+        negras = [libres[relativa] for relativa in _desde_rango(rango_negras, self.negras)]
+        return blancas, negras, turno_negro
+
+
+def _deslizamientos(propias, ocupadas):
+    """Genera (origen, destino) de los movimientos sin captura de las damas propias."""
+    for origen in propias:
+        for rayo in RAYOS_INDICE[origen]:
+            for destino in rayo:
+                if destino in ocupadas:
+                    break
+                yield origen, destino
+
+
+def _capturas(propias, rivales, ocupadas):
+    """Genera (origen, capturada, destino) de las capturas de las damas propias."""
+    for origen in propias:
+        for rayo in RAYOS_INDICE[origen]:
+            for distancia, casilla in enumerate(rayo):
+                if casilla not in ocupadas:
+                    continue
+                if casilla in rivales:
+                    for destino in rayo[distancia + 1:]:
+                        if destino in ocupadas:
+                            break
+                        yield origen, casilla, destino
+                break
+
+
+def _mover(casillas, origen, destino):
+    return sorted(destino if casilla == origen else casilla for casilla in casillas)
+
+
+def resolver_tramo(tramo, resueltos):
+    """
+    Resuelve un tramo por análisis retrógrado. resueltos es {(blancas, negras):
+    bytearray} con los tramos de menos piezas, a los que llevan las capturas.
+    Retorna el bytearray de resultados del tramo.
+    """
+    resultados = bytearray(tramo.tamano)
+    resuelto = bytearray(tramo.tamano)
+    pendientes = [0] * tramo.tamano  # Hijos sin resolver de las posiciones sin captura
+    cubetas = {}  # distancia -> índices resueltos con esa distancia, por propagar
+    
+    def fijar(indice, gana, distancia):
+        resultados[indice] = codificar(gana, distancia)
+        resuelto[indice] = 1
+        cubetas.setdefault(distancia, []).append(indice)
+    
+    for indice in range(tramo.tamano):
+        blancas, negras, turno_negro = tramo.posicion(indice)
+        propias, rivales = (negras, blancas) if turno_negro else (blancas, negras)
+        ocupadas = set(blancas) | set(negras)
+        
+        # Las capturas son obligatorias y llevan a tramos ya resueltos
+        hijos = []
+        for origen, capturada, destino in _capturas(propias, set(rivales), ocupadas):
+            nuevas_propias = _mover(propias, origen, destino)
+            nuevas_rivales = [casilla for casilla in rivales if casilla != capturada]
+            if not nuevas_rivales:
+                hijos.append((-1, 0))  # El rival se queda sin piezas
+                continue
+            hijo_blancas, hijo_negras = ((nuevas_rivales, nuevas_propias) if turno_negro
+                                         else (nuevas_propias, nuevas_rivales))
+            tramo_hijo = Tramo(len(hijo_blancas), len(hijo_negras))
+            valor = resueltos[(tramo_hijo.blancas, tramo_hijo.negras)][
+                tramo_hijo.indice(hijo_blancas, hijo_negras, 1 - turno_negro)]
+            hijos.append(decodificar(valor))
+        
+        if hijos:
+            derrotas_rival = [distancia for resultado, distancia in hijos if resultado == -1]
+            if derrotas_rival:
+                fijar(indice, True, min(derrotas_rival) + 1)
+            elif any(resultado == 0 for resultado, _ in hijos):
+                resuelto[indice] = 1  # Tablas: no se propaga
+            else:
+                fijar(indice, False, max(distancia for _, distancia in hijos) + 1)
+            continue
+        
+        pendientes[indice] = sum(1 for _ in _deslizamientos(propias, ocupadas))
+        if pendientes[indice] == 0:
+            fijar(indice, False, 0)  # Sin movimientos: pierde
+    
+    # Propagación por distancias crecientes: las predecesoras de una posición
+    # son los deslizamientos inversos del jugador que acaba de mover
+    distancia = 0
+    while cubetas:
+        for indice in cubetas.pop(distancia, []):
+            gana, _ = decodificar(resultados[indice])
+            blancas, negras, turno_negro = tramo.posicion(indice)
+            ocupadas = set(blancas) | set(negras)
+            anteriores = blancas if turno_negro else negras
+            for origen, destino in _deslizamientos(anteriores, ocupadas):
+                previas = _mover(anteriores, origen, destino)
+                previo = (tramo.indice(previas, negras, 0) if turno_negro
+                          else tramo.indice(blancas, previas, 1))
+                if resuelto[previo]:
+                    continue
+                if gana == -1:
+                    fijar(previo, True, distancia + 1)
+                else:
+                    pendientes[previo] -= 1
+                    if pendientes[previo] == 0:
+                        fijar(previo, False, distancia + 1)
+        distancia += 1
+    return resultados
+
+
+def tramos_hasta(max_piezas):
+    """(blancas, negras) de todos los tramos con ambos colores y hasta max_piezas piezas."""
+    return [(blancas, total - blancas)
+            for total in range(2, max_piezas + 1)
+            for blancas in range(1, total)]
+
+
+def construir(ruta, max_piezas=TABLAS_FINALES_MAX_PIEZAS, progreso=None):
+    """Resuelve todos los tramos hasta max_piezas piezas y los escribe en ruta."""
+    resueltos = {}
+    for blancas, negras in tramos_hasta(max_piezas):
+        inicio = time.perf_counter()
+        resueltos[(blancas, negras)] = resolver_tramo(Tramo(blancas, negras), resueltos)
+        if progreso is not None:
+            progreso(blancas, negras, resueltos[(blancas, negras)], time.perf_counter() - inicio)
+    
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(CABECERA.pack(FIRMA, VERSION, TABLERO_DIM, len(resueltos)))
+        posicion = CABECERA.size + len(resueltos) * TRAMO.size
+        for (blancas, negras), datos in resueltos.items():
+            archivo.write(TRAMO.pack(blancas, negras, posicion))
+            posicion += len(datos)
+        for datos in resueltos.values():
+            archivo.write(datos)
+    os.replace(temporal, ruta)
+    return resueltos
+
+
+class TablasFinales:
+    """
+    Consulta de solo lectura de las tablas de finales a través de mmap.
+    El archivo se abre con el primer acceso; si no existe, no es válido o
+    es de otro TABLERO_DIM, las tablas se comportan como vacías.
+    """
+    
+    def __init__(self, ruta=TABLAS_FINALES_RUTA):
+        self.ruta = ruta
+        self.max_piezas = 0
+        self._mapa = None
+        self._tramos = {}  # (blancas, negras) -> (Tramo, posición de los datos)
+        self._abierto = False
+    
+    def _abrir(self):
+        self._abierto = True
+        try:
+            with open(self.ruta, "rb") as archivo:
+                mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        
+        if len(mapa) >= CABECERA.size:
+            firma, version, dimension, cantidad = CABECERA.unpack_from(mapa, 0)
+            if firma == FIRMA and version == VERSION and dimension == TABLERO_DIM:
+                for numero in range(cantidad):
+                    blancas, negras, posicion = TRAMO.unpack_from(mapa, CABECERA.size + numero * TRAMO.size)
+                    self._tramos[(blancas, negras)] = (Tramo(blancas, negras), posicion)
+                    self.max_piezas = max(self.max_piezas, blancas + negras)
+                self._mapa = mapa
+                return
+        print(f"Advertencia: '{self.ruta}' no son tablas de finales válidas para este tablero; se ignoran.")
+        mapa.close()
+    
+    def disponible(self):
+        if not self._abierto:
+            self._abrir()
+        return self._mapa is not None
+    
+    def consultar(self, tablero, jugador):
+        """
+        Retorna (resultado, distancia) para el jugador con el turno (resultado
+        1 gana, -1 pierde, 0 tablas) o None si la posición no está en las tablas.
+        """
+        if not self.disponible():
+            return None
+        piezas_blancas, piezas_negras = tablero.contar_piezas()
+        entrada = self._tramos.get((piezas_blancas, piezas_negras))
+        if entrada is None:
+            return None
+        
+        blancas, negras = [], []
+        for casilla, codigo in enumerate(tablero.serializar()):
+            if codigo == CODIGO_DAMA_BLANCA:
+                blancas.append(casilla)
+            elif codigo == CODIGO_DAMA_NEGRA:
+                negras.append(casilla)
+        if len(blancas) != piezas_blancas or len(negras) != piezas_negras:
+            return None  # Quedan peones
+        
+        tramo, posicion = entrada
+        indice = tramo.indice(blancas, negras, 1 if jugador == JUGADOR_NEGRO else 0)
+        return decodificar(self._mapa[posicion + indice])
+    
+    def cerrar(self):
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._tramos = {}
+        self.max_piezas = 0
+        self._abierto = False
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Genera las tablas de finales de solo damas.")
+    parser.add_argument("--salida", default=TABLAS_FINALES_RUTA, help="Archivo de las tablas")
+    parser.add_argument("--piezas", type=int, default=TABLAS_FINALES_MAX_PIEZAS,
+                        help="Número máximo de piezas de las posiciones resueltas")
+    args = parser.parse_args(argumentos)
+    
+    def progreso(blancas, negras, datos, segundos):
+        ganadas = sum(1 for valor in datos if 0 < valor < PIERDE)
+        perdidas = sum(1 for valor in datos if valor >= PIERDE)
+        print(f"{blancas} blancas contra {negras} negras: {len(datos):,} posiciones | "
+              f"gana el turno {ganadas:,} | pierde {perdidas:,} | "
+              f"tablas {len(datos) - ganadas - perdidas:,} | {segundos:.1f} segundos", flush=True)
+    
+    inicio = time.perf_counter()
+    construir(args.salida, args.piezas, progreso)
+    print(f"Tablas guardadas en {args.salida} ({os.path.getsize(args.salida):,} bytes, "
+          f"{time.perf_counter() - inicio:.1f} segundos)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,40 @@
 Clase Tablero para manejar el estado del juego y las reglas de damas.
 """
 import copy
+from collections import namedtuple
 from configuracion import *
+from zobrist import calcular_clave, clave_pieza
+from geometria import (CASILLAS_OSCURAS, DIRECCIONES_PEON, PIEZAS_PROPIAS, PIEZAS_ENEMIGAS,
+                       RAYOS, SALTOS, VECINOS)
+
+
+# Resultado de analizar un nodo de búsqueda: se calcula una sola vez y lo
+# comparten la comprobación de fin de juego, el bucle de movimientos y el evaluador.
+EstadoNodo = namedtuple("EstadoNodo", ["movimientos", "piezas_blancas", "piezas_negras", "ganador"])
+
+
+def valor_posicional(pieza, fila, columna):
+    """
+    Valor de material y posición de una pieza en una casilla, tal como lo
+    usa la función de evaluación: avance para peones, centralidad para damas.
+    """
+    if pieza == JUGADOR_BLANCO:
+        return VALOR_PEON + (TABLERO_DIM - 1 - fila) * VALOR_AVANCE
+    if pieza == JUGADOR_NEGRO:
+        return VALOR_PEON + fila * VALOR_AVANCE
+    centro_dist = abs(fila - TABLERO_DIM//2) + abs(columna - TABLERO_DIM//2)
+    return VALOR_DAMA + (TABLERO_DIM - centro_dist) * VALOR_CENTRO
+
+
+VALORES_POSICIONALES = {
+    pieza: [[valor_posicional(pieza, f, c) for c in range(TABLERO_DIM)] for f in range(TABLERO_DIM)]
+    for pieza in (JUGADOR_BLANCO, JUGADOR_NEGRO, DAMA_BLANCA, DAMA_NEGRA)
+}
+
+
+# Forma serializada compacta: un byte por casilla oscura, en el orden de CASILLAS_OSCURAS.
+PIEZAS_POR_CODIGO = (CELDA_VACIA, JUGADOR_BLANCO, JUGADOR_NEGRO, DAMA_BLANCA, DAMA_NEGRA)
+CODIGOS_PIEZA = {pieza: codigo for codigo, pieza in enumerate(PIEZAS_POR_CODIGO)}
 
 
 class Tablero:
@@ -12,9 +45,14 @@ class Tablero:
     con el estado del juego, movimientos válidos y reglas.
     """
     
+    # Sin __dict__: en la búsqueda se crean muchos tableros
+    __slots__ = ("tablero", "pila_deshacer", "clave", "piezas_blancas", "piezas_negras",
+                 "puntaje_blanco", "puntaje_negro")
+    
     def __init__(self):
         """Inicializa un tablero vacío."""
         self.tablero = [[CELDA_VACIA for _ in range(TABLERO_DIM)] for _ in range(TABLERO_DIM)]
+        self.pila_deshacer = []
         self.inicializar_tablero()
     
     def inicializar_tablero(self):
@@ -29,6 +67,7 @@ class Tablero:
                         self.tablero[r][c] = JUGADOR_NEGRO
                     elif r >= (TABLERO_DIM // 2) + 1:  # Filas para jugador blanco
                         self.tablero[r][c] = JUGADOR_BLANCO
+        self._recalcular_totales()
     
     def obtener_tablero(self):
         """Retorna una copia del estado actual del tablero."""
@@ -37,6 +76,73 @@ class Tablero:
     def establecer_tablero(self, nuevo_tablero):
         """Establece un nuevo estado del tablero."""
         self.tablero = copy.deepcopy(nuevo_tablero)
+        self.pila_deshacer = []
+        self._recalcular_totales()
+    
+    def serializar(self):
+        """Retorna el estado como bytes: un código de pieza por casilla oscura."""
+        tablero = self.tablero
+        return bytes([CODIGOS_PIEZA[tablero[fila][columna]] for fila, columna in CASILLAS_OSCURAS])
+    
+    @classmethod
+    def desde_serializado(cls, datos):
+        """Crea un tablero a partir de los bytes producidos por serializar()."""
+        matriz = [[CELDA_VACIA for _ in range(TABLERO_DIM)] for _ in range(TABLERO_DIM)]
+        for (fila, columna), codigo in zip(CASILLAS_OSCURAS, datos):
+            matriz[fila][columna] = PIEZAS_POR_CODIGO[codigo]
+        tablero = cls()
+        tablero.establecer_tablero(matriz)
+        return tablero
+    
+    def copiar(self):
+        """Retorna una copia independiente del tablero, sin historial de deshacer."""
+        nuevo = Tablero.__new__(Tablero)
+        nuevo.tablero = [fila[:] for fila in self.tablero]
+        nuevo.pila_deshacer = []
+        nuevo.clave = self.clave
+        nuevo.piezas_blancas = self.piezas_blancas
+        nuevo.piezas_negras = self.piezas_negras
+        nuevo.puntaje_blanco = self.puntaje_blanco
+        nuevo.puntaje_negro = self.puntaje_negro
+        return nuevo
+    
+    def _recalcular_totales(self):
+        """
+        Recalcula desde cero la clave Zobrist, el número de piezas y el
+        puntaje de material y posición de cada color.
+        """
+        self.clave = calcular_clave(self.tablero)
+        self.piezas_blancas = 0
+        self.piezas_negras = 0
+        self.puntaje_blanco = 0
+        self.puntaje_negro = 0
+        for fila in range(TABLERO_DIM):
+            for columna in range(TABLERO_DIM):
+                pieza = self.tablero[fila][columna]
+                if pieza != CELDA_VACIA:
+                    self._sumar_pieza(pieza, fila, columna, 1)
+    
+    def _sumar_pieza(self, pieza, fila, columna, signo):
+        """Suma (signo=1) o resta (signo=-1) la contribución de una pieza a los totales."""
+        if pieza in [JUGADOR_BLANCO, DAMA_BLANCA]:
+            self.piezas_blancas += signo
+            self.puntaje_blanco += signo * VALORES_POSICIONALES[pieza][fila][columna]
+        else:
+            self.piezas_negras += signo
+            self.puntaje_negro += signo * VALORES_POSICIONALES[pieza][fila][columna]
+    
+    def _establecer_pieza(self, fila, columna, pieza):
+        """
+        Coloca una pieza (o CELDA_VACIA) y actualiza por diferencia la clave
+        Zobrist, el número de piezas y los puntajes.
+        """
+        anterior = self.tablero[fila][columna]
+        self.clave ^= clave_pieza(anterior, fila, columna) ^ clave_pieza(pieza, fila, columna)
+        if anterior != CELDA_VACIA:
+            self._sumar_pieza(anterior, fila, columna, -1)
+        if pieza != CELDA_VACIA:
+            self._sumar_pieza(pieza, fila, columna, 1)
+        self.tablero[fila][columna] = pieza
     
     def es_casilla_valida(self, fila, columna):
         """Verifica si una posición está dentro del tablero."""
@@ -77,63 +183,91 @@ class Tablero:
     def movimientos_disponibles(self, jugador):
         """
         Retorna todos los movimientos válidos para un jugador.
-        Las capturas son obligatorias cuando están disponibles.
+        Las capturas son obligatorias cuando están disponibles, así que los
+        movimientos normales solo se generan si no hay ninguna.
         """
+        propias = PIEZAS_PROPIAS[jugador]
+        piezas = [(fila, columna, self.tablero[fila][columna] in (DAMA_BLANCA, DAMA_NEGRA))
+                  for fila, columna in CASILLAS_OSCURAS if self.tablero[fila][columna] in propias]
+        
         movimientos_captura = set()
-        movimientos_normales = set()
+        for fila, columna, es_dama in piezas:
+            movimientos_captura.update(self._obtener_capturas(fila, columna, jugador, es_dama))
+        if movimientos_captura:
+            return movimientos_captura
         
-        for fila in range(TABLERO_DIM):
-            for columna in range(TABLERO_DIM):
-                if self.es_pieza_del_jugador(fila, columna, jugador):
-                    es_dama = self.es_dama(fila, columna)
-                    
-                    # Obtener capturas
-                    capturas = self._obtener_capturas(fila, columna, jugador, es_dama)
-                    movimientos_captura.update(capturas)
-                    
-                    # Obtener movimientos normales
-                    if es_dama:
-                        normales = self._obtener_movimientos_dama(fila, columna)
-                    else:
-                        normales = self._obtener_movimientos_peon(fila, columna, jugador)
-                    movimientos_normales.update(normales)
+        movimientos_normales = set()
+        for fila, columna, es_dama in piezas:
+            if es_dama:
+                movimientos_normales.update(self._obtener_movimientos_dama(fila, columna))
+            else:
+                movimientos_normales.update(self._obtener_movimientos_peon(fila, columna, jugador))
+        return movimientos_normales
+    
+    def generar_movimientos(self, jugador):
+        """
+        Genera los movimientos válidos de forma perezosa, pieza a pieza:
+        primero las capturas y, solo si no hubo ninguna, los movimientos
+        normales. Si quien consume deja de iterar (un corte alfa-beta), el
+        resto no se llega a generar. Entre un movimiento y el siguiente el
+        tablero tiene que estar como al empezar (hacer y deshacer lo cumplen).
+        """
+        propias = PIEZAS_PROPIAS[jugador]
+        hubo_captura = False
+        for fila, columna in CASILLAS_OSCURAS:
+            pieza = self.tablero[fila][columna]
+            if pieza in propias:
+                for captura in self._obtener_capturas(fila, columna, jugador, pieza in (DAMA_BLANCA, DAMA_NEGRA)):
+                    hubo_captura = True
+                    yield captura
+        if hubo_captura:
+            return
         
-        # Si hay capturas disponibles, solo devolver capturas (regla obligatoria)
-        return movimientos_captura if movimientos_captura else movimientos_normales
+        for fila, columna in CASILLAS_OSCURAS:
+            pieza = self.tablero[fila][columna]
+            if pieza in propias:
+                if pieza in (DAMA_BLANCA, DAMA_NEGRA):
+                    yield from self._obtener_movimientos_dama(fila, columna)
+                else:
+                    yield from self._obtener_movimientos_peon(fila, columna, jugador)
+    
+    def tiene_movimientos(self, jugador):
+        """Indica si el jugador tiene algún movimiento; se detiene en el primero que encuentra."""
+        propias = PIEZAS_PROPIAS[jugador]
+        for fila, columna in CASILLAS_OSCURAS:
+            pieza = self.tablero[fila][columna]
+            if pieza not in propias:
+                continue
+            es_dama = pieza in (DAMA_BLANCA, DAMA_NEGRA)
+            direcciones = VECINOS[(fila, columna)] if es_dama else DIRECCIONES_PEON[jugador]
+            for direccion in direcciones:
+                destino = VECINOS[(fila, columna)].get(direccion)
+                if destino is not None and self.tablero[destino[0]][destino[1]] == CELDA_VACIA:
+                    return True
+            if self._obtener_capturas(fila, columna, jugador, es_dama):
+                return True
+        return False
     
     def _obtener_movimientos_peon(self, fila, columna, jugador):
         """Obtiene movimientos normales para un peón."""
         movimientos = set()
+        vecinos = VECINOS[(fila, columna)]
         
-        # Direcciones de avance según el jugador
-        if jugador == JUGADOR_BLANCO:
-            direcciones = [(-1, -1), (-1, 1)]  # Hacia arriba
-        else:
-            direcciones = [(1, -1), (1, 1)]   # Hacia abajo
-        
-        for df, dc in direcciones:
-            nueva_fila, nueva_columna = fila + df, columna + dc
-            if (self.es_casilla_valida(nueva_fila, nueva_columna) and
-                self.obtener_pieza(nueva_fila, nueva_columna) == CELDA_VACIA):
-                movimientos.add(((fila, columna), (nueva_fila, nueva_columna)))
+        for direccion in DIRECCIONES_PEON[jugador]:
+            destino = vecinos.get(direccion)
+            if destino is not None and self.tablero[destino[0]][destino[1]] == CELDA_VACIA:
+                movimientos.add(((fila, columna), destino))
         
         return movimientos
     
     def _obtener_movimientos_dama(self, fila, columna):
         """Obtiene movimientos normales para una dama."""
         movimientos = set()
-        direcciones = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
         
-        for df, dc in direcciones:
-            for distancia in range(1, TABLERO_DIM):
-                nueva_fila = fila + df * distancia
-                nueva_columna = columna + dc * distancia
-                
-                if not self.es_casilla_valida(nueva_fila, nueva_columna):
-                    break
-                
-                if self.obtener_pieza(nueva_fila, nueva_columna) == CELDA_VACIA:
-                    movimientos.add(((fila, columna), (nueva_fila, nueva_columna)))
+        for rayo in RAYOS[(fila, columna)].values():
+            for destino in rayo:
+                if self.tablero[destino[0]][destino[1]] == CELDA_VACIA:
+                    movimientos.add(((fila, columna), destino))
                 else:
                     break  # Bloqueado por otra pieza
         
@@ -149,55 +283,36 @@ class Tablero:
     def _obtener_capturas_peon(self, fila, columna, jugador):
         """Obtiene capturas para un peón."""
         capturas = set()
+        saltos = SALTOS[(fila, columna)]
+        enemigas = PIEZAS_ENEMIGAS[jugador]
         
-        # Direcciones según el jugador
-        if jugador == JUGADOR_BLANCO:
-            direcciones = [(-1, -1), (-1, 1)]
-        else:
-            direcciones = [(1, -1), (1, 1)]
-        
-        for df, dc in direcciones:
-            fila_salto = fila + df
-            columna_salto = columna + dc
-            fila_destino = fila + 2 * df
-            columna_destino = columna + 2 * dc
-            
-            if (self.es_casilla_valida(fila_salto, columna_salto) and
-                self.es_casilla_valida(fila_destino, columna_destino) and
-                self.es_pieza_enemiga(fila_salto, columna_salto, jugador) and
-                self.obtener_pieza(fila_destino, columna_destino) == CELDA_VACIA):
-                capturas.add(((fila, columna), (fila_destino, columna_destino)))
+        for direccion in DIRECCIONES_PEON[jugador]:
+            salto = saltos.get(direccion)
+            if salto is None:
+                continue
+            (fila_salto, columna_salto), destino = salto
+            if (self.tablero[fila_salto][columna_salto] in enemigas and
+                self.tablero[destino[0]][destino[1]] == CELDA_VACIA):
+                capturas.add(((fila, columna), destino))
         
         return capturas
     
     def _obtener_capturas_dama(self, fila, columna, jugador):
         """Obtiene capturas para una dama."""
         capturas = set()
-        direcciones = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+        enemigas = PIEZAS_ENEMIGAS[jugador]
         
-        for df, dc in direcciones:
-            for distancia in range(1, TABLERO_DIM):
-                fila_salto = fila + df * distancia
-                columna_salto = columna + dc * distancia
-                
-                if not self.es_casilla_valida(fila_salto, columna_salto):
-                    break
-                
-                pieza_saltada = self.obtener_pieza(fila_salto, columna_salto)
+        for rayo in RAYOS[(fila, columna)].values():
+            for distancia, (fila_salto, columna_salto) in enumerate(rayo):
+                pieza_saltada = self.tablero[fila_salto][columna_salto]
                 
                 if pieza_saltada == CELDA_VACIA:
                     continue
-                elif self.es_pieza_enemiga(fila_salto, columna_salto, jugador):
+                elif pieza_saltada in enemigas:
                     # Buscar destinos válidos después de la captura
-                    for dist_destino in range(distancia + 1, TABLERO_DIM):
-                        fila_destino = fila + df * dist_destino
-                        columna_destino = columna + dc * dist_destino
-                        
-                        if not self.es_casilla_valida(fila_destino, columna_destino):
-                            break
-                        
-                        if (self.obtener_pieza(fila_destino, columna_destino) == CELDA_VACIA):
-                            capturas.add(((fila, columna), (fila_destino, columna_destino)))
+                    for destino in rayo[distancia + 1:]:
+                        if self.tablero[destino[0]][destino[1]] == CELDA_VACIA:
+                            capturas.add(((fila, columna), destino))
                         else:
                             break
                     break
@@ -206,16 +321,53 @@ class Tablero:
         
         return capturas
     
+    def es_captura(self, movimiento):
+        """
+        Indica si el movimiento, aún sin aplicar, salta alguna pieza. Como las
+        capturas son obligatorias, si un movimiento legal captura lo hacen todos.
+        """
+        (origen_f, origen_c), (destino_f, destino_c) = movimiento
+        df = 1 if destino_f > origen_f else -1
+        dc = 1 if destino_c > origen_c else -1
+        for paso in range(1, abs(destino_f - origen_f)):
+            if self.obtener_pieza(origen_f + paso * df, origen_c + paso * dc) != CELDA_VACIA:
+                return True
+        return False
+    
     def aplicar_movimiento(self, movimiento):
         """
         Aplica un movimiento al tablero y retorna un nuevo tablero.
         Maneja capturas, capturas múltiples y coronación.
         """
-        nuevo_tablero = Tablero()
-        nuevo_tablero.establecer_tablero(self.tablero)
+        nuevo_tablero = self.copiar()
+        nuevo_tablero._ejecutar_movimiento(movimiento)
+        return nuevo_tablero
+    
+    def hacer_movimiento(self, movimiento):
+        """
+        Aplica un movimiento sobre este mismo tablero.
+        Las piezas capturadas y la coronación se guardan en la pila de deshacer.
+        """
+        self.pila_deshacer.append(self._ejecutar_movimiento(movimiento))
+    
+    def deshacer_movimiento(self):
+        """Revierte el último movimiento hecho con hacer_movimiento."""
+        movimiento, pieza_movida, piezas_capturadas, _ = self.pila_deshacer.pop()
+        (origen_f, origen_c), (destino_f, destino_c) = movimiento
+        
+        self._establecer_pieza(destino_f, destino_c, CELDA_VACIA)
+        self._establecer_pieza(origen_f, origen_c, pieza_movida)
         
+        for cap_f, cap_c, pieza in piezas_capturadas:
+            self._establecer_pieza(cap_f, cap_c, pieza)
+    
+    def _ejecutar_movimiento(self, movimiento):
+        """
+        Modifica el tablero con el movimiento y retorna el registro para deshacerlo:
+        (movimiento, pieza_movida, piezas_capturadas, hubo_coronacion).
+        """
         (origen_f, origen_c), (destino_f, destino_c) = movimiento
-        pieza_movida = nuevo_tablero.obtener_pieza(origen_f, origen_c)
+        pieza_movida = self.tablero[origen_f][origen_c]
         
         # Determinar el jugador actual
         if pieza_movida in [JUGADOR_BLANCO, DAMA_BLANCA]:
@@ -227,26 +379,27 @@ class Tablero:
         diff_f = abs(origen_f - destino_f)
         diff_c = abs(origen_c - destino_c)
         
+        piezas_capturadas = []
         if diff_f > 1 or diff_c > 1:  # Es una captura
-            piezas_capturadas = self._encontrar_piezas_capturadas(
+            for cap_f, cap_c in self._encontrar_piezas_capturadas(
                 origen_f, origen_c, destino_f, destino_c, jugador_actual
-            )
-            
-            # Eliminar piezas capturadas
-            for cap_f, cap_c in piezas_capturadas:
-                nuevo_tablero.tablero[cap_f][cap_c] = CELDA_VACIA
-        
-        # Mover la pieza
-        nuevo_tablero.tablero[destino_f][destino_c] = pieza_movida
-        nuevo_tablero.tablero[origen_f][origen_c] = CELDA_VACIA
+            ):
+                piezas_capturadas.append((cap_f, cap_c, self.tablero[cap_f][cap_c]))
+                self._establecer_pieza(cap_f, cap_c, CELDA_VACIA)
         
         # Coronación
+        pieza_final = pieza_movida
         if (pieza_movida == JUGADOR_BLANCO and destino_f == 0):
-            nuevo_tablero.tablero[destino_f][destino_c] = DAMA_BLANCA
+            pieza_final = DAMA_BLANCA
         elif (pieza_movida == JUGADOR_NEGRO and destino_f == TABLERO_DIM - 1):
-            nuevo_tablero.tablero[destino_f][destino_c] = DAMA_NEGRA
+            pieza_final = DAMA_NEGRA
+        hubo_coronacion = pieza_final != pieza_movida
         
-        return nuevo_tablero
+        # Mover la pieza
+        self._establecer_pieza(destino_f, destino_c, pieza_final)
+        self._establecer_pieza(origen_f, origen_c, CELDA_VACIA)
+        
+        return movimiento, pieza_movida, piezas_capturadas, hubo_coronacion
     
     def _encontrar_piezas_capturadas(self, origen_f, origen_c, destino_f, destino_c, jugador):
         """Encuentra todas las piezas capturadas en un movimiento."""
@@ -272,19 +425,36 @@ class Tablero:
         
         return piezas_capturadas
     
+    def contar_piezas(self):
+        """Retorna (piezas_blancas, piezas_negras)."""
+        return self.piezas_blancas, self.piezas_negras
+    
+    def obtener_puntajes(self):
+        """Retorna el puntaje de material y posición (puntaje_blanco, puntaje_negro)."""
+        return self.puntaje_blanco, self.puntaje_negro
+    
+    def analizar_nodo(self, jugador_actual):
+        """
+        Calcula de una vez los movimientos legales, el número de piezas y el
+        ganador (si lo hay) para el jugador que tiene el turno.
+        """
+        piezas_blancas, piezas_negras = self.contar_piezas()
+        movimientos = self.movimientos_disponibles(jugador_actual)
+        
+        if piezas_blancas == 0:
+            ganador = JUGADOR_NEGRO
+        elif piezas_negras == 0:
+            ganador = JUGADOR_BLANCO
+        elif not movimientos:
+            ganador = self.obtener_jugador_oponente(jugador_actual)
+        else:
+            ganador = None
+        
+        return EstadoNodo(movimientos, piezas_blancas, piezas_negras, ganador)
+    
     def determinar_ganador(self, jugador_actual):
         """Determina si hay un ganador en el juego."""
-        # Contar piezas
-        piezas_blancas = 0
-        piezas_negras = 0
-        
-        for fila in range(TABLERO_DIM):
-            for columna in range(TABLERO_DIM):
-                pieza = self.obtener_pieza(fila, columna)
-                if pieza in [JUGADOR_BLANCO, DAMA_BLANCA]:
-                    piezas_blancas += 1
-                elif pieza in [JUGADOR_NEGRO, DAMA_NEGRA]:
-                    piezas_negras += 1
+        piezas_blancas, piezas_negras = self.contar_piezas()
         
         # Verificar si un jugador no tiene piezas
         if piezas_blancas == 0:
@@ -293,7 +463,7 @@ class Tablero:
             return JUGADOR_BLANCO
         
         # Verificar si el jugador actual no tiene movimientos
-        if not self.movimientos_disponibles(jugador_actual):
+        if not self.tiene_movimientos(jugador_actual):
             return JUGADOR_NEGRO if jugador_actual == JUGADOR_BLANCO else JUGADOR_BLANCO
         
         return None  # No hay ganador
@@ -305,3 +475,14 @@ class Tablero:
     def obtener_jugador_oponente(self, jugador):
         """Retorna el jugador opuesto."""
         return JUGADOR_NEGRO if jugador == JUGADOR_BLANCO else JUGADOR_BLANCO
+
+
+def crear_tablero():
+    """Crea un tablero inicial con el motor indicado en MOTOR_TABLERO."""
+    if MOTOR_TABLERO == "bits":
+        from tablero_bits import TableroBits
+        return TableroBits()
+    if MOTOR_TABLERO == "compacto":
+        from tablero_compacto import TableroCompacto
+        return TableroCompacto()
+    return Tablero()
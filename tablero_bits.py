@@ -0,0 +1,406 @@
+# tablero_bits.py
+"""
+Motor alternativo del tablero basado en bitboards.
+Las casillas oscuras se numeran de 0 a (TABLERO_DIM * TABLERO_DIM // 2) - 1
+y el estado se guarda como máscaras enteras (blancas, negras, damas).
+"""
+from configuracion import *
+from tablero import Tablero, VALORES_POSICIONALES, CODIGOS_PIEZA
+from geometria import DIRECCIONES_BLANCO, DIRECCIONES_NEGRO, DIRECCIONES_DAMA
+from zobrist import CLAVES_PIEZA
+
+
+MITAD = TABLERO_DIM // 2
+NUM_CASILLAS = TABLERO_DIM * MITAD
+TODAS = (1 << NUM_CASILLAS) - 1
+
+
+def indice_a_coordenada(indice):
+    """Convierte un índice de casilla oscura en (fila, columna)."""
+    fila, k = divmod(indice, MITAD)
+    return fila, 2 * k + 1 if fila % 2 == 0 else 2 * k
+
+
+def coordenada_a_indice(fila, columna):
+    """Convierte (fila, columna) de una casilla oscura en su índice."""
+    return fila * MITAD + columna // 2
+
+
+def _construir_mascara(condicion):
+    mascara = 0
+    for indice in range(NUM_CASILLAS):
+        if condicion(*indice_a_coordenada(indice)):
+            mascara |= 1 << indice
+    return mascara
+
+
+COORDENADAS = [indice_a_coordenada(i) for i in range(NUM_CASILLAS)]
+
+FILAS_PARES = _construir_mascara(lambda f, c: f % 2 == 0)
+FILAS_IMPARES = TODAS & ~FILAS_PARES
+BORDE_DERECHO = _construir_mascara(lambda f, c: c == TABLERO_DIM - 1)
+BORDE_IZQUIERDO = _construir_mascara(lambda f, c: c == 0)
+FILA_SUPERIOR = _construir_mascara(lambda f, c: f == 0)
+FILA_INFERIOR = _construir_mascara(lambda f, c: f == TABLERO_DIM - 1)
+
+# Para cada dirección (df, dc): (máscara, desplazamiento) de filas pares e impares.
+# Un desplazamiento positivo es hacia índices mayores (hacia abajo).
+DESPLAZAMIENTOS = {
+    (1, -1): ((FILAS_PARES, MITAD), (FILAS_IMPARES & ~BORDE_IZQUIERDO, MITAD - 1)),
+    (1, 1): ((FILAS_PARES & ~BORDE_DERECHO, MITAD + 1), (FILAS_IMPARES, MITAD)),
+    (-1, -1): ((FILAS_PARES, -MITAD), (FILAS_IMPARES & ~BORDE_IZQUIERDO, -(MITAD + 1))),
+    (-1, 1): ((FILAS_PARES & ~BORDE_DERECHO, -(MITAD - 1)), (FILAS_IMPARES, -MITAD)),
+}
+
+
+def desplazar(bits, direccion):
+    """Mueve todas las casillas de la máscara un paso en la dirección dada."""
+    (mascara_par, paso_par), (mascara_impar, paso_impar) = DESPLAZAMIENTOS[direccion]
+    pares = bits & mascara_par
+    impares = bits & mascara_impar
+    pares = pares << paso_par if paso_par > 0 else pares >> -paso_par
+    impares = impares << paso_impar if paso_impar > 0 else impares >> -paso_impar
+    return (pares | impares) & TODAS
+
+
+# Claves Zobrist y valores posicionales por índice de casilla, compatibles con los de Tablero
+CLAVES_INDICE = {
+    pieza: [CLAVES_PIEZA[pieza][fila][columna] for fila, columna in COORDENADAS]
+    for pieza in CLAVES_PIEZA
+}
+VALORES_INDICE = {
+    pieza: [VALORES_POSICIONALES[pieza][fila][columna] for fila, columna in COORDENADAS]
+    for pieza in VALORES_POSICIONALES
+}
+
+
+def contar_bits(bits):
+    """Cuenta las casillas ocupadas de una máscara."""
+    return bin(bits).count("1")
+
+
+def iterar_bits(bits):
+    """Genera cada bit encendido de la máscara como máscara individual."""
+    while bits:
+        bit = bits & -bits
+        yield bit
+        bits ^= bit
+
+
+def _opuesta(direccion):
+    return (-direccion[0], -direccion[1])
+
+
+class TableroBits(Tablero):
+    """
+    Tablero de damas representado con máscaras de bits.
+    Mantiene la misma interfaz pública que Tablero, por lo que los algoritmos
+    de búsqueda pueden usarlo sin cambios.
+    """
+    
+    __slots__ = ("blancas", "negras", "damas")
+    
+    def __init__(self):
+        """Inicializa el tablero con la disposición estándar."""
+        self.blancas = 0
+        self.negras = 0
+        self.damas = 0
+        self.pila_deshacer = []
+        self.inicializar_tablero()
+    
+    def inicializar_tablero(self):
+        """Coloca las piezas en las filas iniciales de cada jugador."""
+        self.blancas = 0
+        self.negras = 0
+        self.damas = 0
+        for indice, (fila, _) in enumerate(COORDENADAS):
+            if fila < (TABLERO_DIM // 2) - 1:
+                self.negras |= 1 << indice
+            elif fila >= (TABLERO_DIM // 2) + 1:
+                self.blancas |= 1 << indice
+        self._recalcular_totales()
+    
+    def copiar(self):
+        """Retorna una copia independiente del tablero."""
+        nuevo = TableroBits.__new__(TableroBits)
+        nuevo.blancas = self.blancas
+        nuevo.negras = self.negras
+        nuevo.damas = self.damas
+        nuevo.pila_deshacer = []
+        nuevo.clave = self.clave
+        nuevo.puntaje_blanco = self.puntaje_blanco
+        nuevo.puntaje_negro = self.puntaje_negro
+        return nuevo
+    
+    def _recalcular_totales(self):
+        """Calcula desde cero la clave Zobrist y los puntajes de las máscaras."""
+        self.clave = 0
+        self.puntaje_blanco = 0
+        self.puntaje_negro = 0
+        for indice in range(NUM_CASILLAS):
+            pieza = self._pieza_en_indice(indice)
+            if pieza == CELDA_VACIA:
+                continue
+            self.clave ^= CLAVES_INDICE[pieza][indice]
+            if pieza in [JUGADOR_BLANCO, DAMA_BLANCA]:
+                self.puntaje_blanco += VALORES_INDICE[pieza][indice]
+            else:
+                self.puntaje_negro += VALORES_INDICE[pieza][indice]
+    
+    def obtener_tablero(self):
+        """Retorna el estado como matriz TABLERO_DIM x TABLERO_DIM."""
+        tablero = [[CELDA_VACIA for _ in range(TABLERO_DIM)] for _ in range(TABLERO_DIM)]
+        for indice, (fila, columna) in enumerate(COORDENADAS):
+            tablero[fila][columna] = self._pieza_en_indice(indice)
+        return tablero
+    
+    def establecer_tablero(self, nuevo_tablero):
+        """Carga el estado desde una matriz TABLERO_DIM x TABLERO_DIM."""
+        self.blancas = 0
+        self.negras = 0
+        self.damas = 0
+        for indice, (fila, columna) in enumerate(COORDENADAS):
+            pieza = nuevo_tablero[fila][columna]
+            bit = 1 << indice
+            if pieza in [JUGADOR_BLANCO, DAMA_BLANCA]:
+                self.blancas |= bit
+            elif pieza in [JUGADOR_NEGRO, DAMA_NEGRA]:
+                self.negras |= bit
+            if pieza in [DAMA_BLANCA, DAMA_NEGRA]:
+                self.damas |= bit
+        self.pila_deshacer = []
+        self._recalcular_totales()
+    
+    def serializar(self):
+        """Retorna el estado como bytes: un código de pieza por casilla oscura, en orden de índice."""
+        return bytes([CODIGOS_PIEZA[self._pieza_en_indice(indice)] for indice in range(NUM_CASILLAS)])
+    
+    def _pieza_en_indice(self, indice):
+        bit = 1 << indice
+        if self.blancas & bit:
+            return DAMA_BLANCA if self.damas & bit else JUGADOR_BLANCO
+        if self.negras & bit:
+            return DAMA_NEGRA if self.damas & bit else JUGADOR_NEGRO
+        return CELDA_VACIA
+    
+    def obtener_pieza(self, fila, columna):
+        """Obtiene la pieza en una posición específica."""
+        if not self.es_casilla_valida(fila, columna) or not self.es_casilla_oscura(fila, columna):
+            return CELDA_VACIA
+        return self._pieza_en_indice(coordenada_a_indice(fila, columna))
+    
+    def _mascaras_jugador(self, jugador):
+        """Retorna (propias, enemigas) para el jugador."""
+        if jugador == JUGADOR_BLANCO:
+            return self.blancas, self.negras
+        return self.negras, self.blancas
+    
+    def movimientos_disponibles(self, jugador):
+        """
+        Retorna todos los movimientos válidos para un jugador.
+        Las capturas son obligatorias cuando están disponibles.
+        """
+        propias, enemigas = self._mascaras_jugador(jugador)
+        vacias = TODAS & ~(propias | enemigas)
+        peones = propias & ~self.damas
+        damas = propias & self.damas
+        direcciones_peon = DIRECCIONES_BLANCO if jugador == JUGADOR_BLANCO else DIRECCIONES_NEGRO
+        
+        capturas = self._capturas_peones(peones, enemigas, vacias, direcciones_peon)
+        capturas.update(self._capturas_damas(damas, enemigas, vacias))
+        if capturas:
+            return capturas
+        
+        movimientos = self._movimientos_peones(peones, vacias, direcciones_peon)
+        movimientos.update(self._movimientos_damas(damas, vacias))
+        return movimientos
+    
+    def generar_movimientos(self, jugador):
+        """
+        Versión perezosa de movimientos_disponibles: primero las capturas de
+        peones, luego las de damas y, solo si no hubo ninguna, los movimientos
+        normales. Cada grupo sale de las máscaras tomadas al empezar, que
+        vuelven a ser válidas tras deshacer cada movimiento.
+        """
+        propias, enemigas = self._mascaras_jugador(jugador)
+        vacias = TODAS & ~(propias | enemigas)
+        peones = propias & ~self.damas
+        damas = propias & self.damas
+        direcciones_peon = DIRECCIONES_BLANCO if jugador == JUGADOR_BLANCO else DIRECCIONES_NEGRO
+        
+        capturas = self._capturas_peones(peones, enemigas, vacias, direcciones_peon)
+        yield from capturas
+        capturas_damas = self._capturas_damas(damas, enemigas, vacias)
+        yield from capturas_damas
+        if capturas or capturas_damas:
+            return
+        
+        yield from self._movimientos_peones(peones, vacias, direcciones_peon)
+        yield from self._movimientos_damas(damas, vacias)
+    
+    def tiene_movimientos(self, jugador):
+        """
+        Indica si el jugador tiene algún movimiento, solo con operaciones de
+        máscaras: un paso a una casilla vacía o un salto sobre una pieza
+        enemiga adyacente. Basta para las damas, porque una dama sin casillas
+        vacías a su lado solo puede capturar piezas adyacentes.
+        """
+        propias, enemigas = self._mascaras_jugador(jugador)
+        vacias = TODAS & ~(propias | enemigas)
+        peones = propias & ~self.damas
+        damas = propias & self.damas
+        direcciones_peon = DIRECCIONES_BLANCO if jugador == JUGADOR_BLANCO else DIRECCIONES_NEGRO
+        
+        for direccion in DIRECCIONES_DAMA:
+            piezas = damas | peones if direccion in direcciones_peon else damas
+            if desplazar(piezas, direccion) & vacias:
+                return True
+            if desplazar(desplazar(piezas, direccion) & enemigas, direccion) & vacias:
+                return True
+        return False
+    
+    def _movimientos_peones(self, peones, vacias, direcciones):
+        movimientos = set()
+        for direccion in direcciones:
+            opuesta = _opuesta(direccion)
+            for destino in iterar_bits(desplazar(peones, direccion) & vacias):
+                origen = desplazar(destino, opuesta)
+                movimientos.add((COORDENADAS[origen.bit_length() - 1],
+                                 COORDENADAS[destino.bit_length() - 1]))
+        return movimientos
+    
+    def _capturas_peones(self, peones, enemigas, vacias, direcciones):
+        capturas = set()
+        for direccion in direcciones:
+            opuesta = _opuesta(direccion)
+            saltables = desplazar(peones, direccion) & enemigas
+            for destino in iterar_bits(desplazar(saltables, direccion) & vacias):
+                origen = desplazar(desplazar(destino, opuesta), opuesta)
+                capturas.add((COORDENADAS[origen.bit_length() - 1],
+                              COORDENADAS[destino.bit_length() - 1]))
+        return capturas
+    
+    def _movimientos_damas(self, damas, vacias):
+        movimientos = set()
+        for dama in iterar_bits(damas):
+            origen = COORDENADAS[dama.bit_length() - 1]
+            for direccion in DIRECCIONES_DAMA:
+                paso = desplazar(dama, direccion)
+                while paso & vacias:
+                    movimientos.add((origen, COORDENADAS[paso.bit_length() - 1]))
+                    paso = desplazar(paso, direccion)
+        return movimientos
+    
+    def _capturas_damas(self, damas, enemigas, vacias):
+        capturas = set()
+        for dama in iterar_bits(damas):
+            origen = COORDENADAS[dama.bit_length() - 1]
+            for direccion in DIRECCIONES_DAMA:
+                paso = desplazar(dama, direccion)
+                while paso & vacias:
+                    paso = desplazar(paso, direccion)
+                if not paso & enemigas:
+                    continue
+                destino = desplazar(paso, direccion)
+                while destino & vacias:
+                    capturas.add((origen, COORDENADAS[destino.bit_length() - 1]))
+                    destino = desplazar(destino, direccion)
+        return capturas
+    
+    def aplicar_movimiento(self, movimiento):
+        """
+        Aplica un movimiento al tablero y retorna un nuevo tablero.
+        Maneja capturas y coronación con operaciones sobre las máscaras.
+        """
+        nuevo_tablero = self.copiar()
+        nuevo_tablero._ejecutar_movimiento(movimiento)
+        return nuevo_tablero
+    
+    def hacer_movimiento(self, movimiento):
+        """
+        Aplica un movimiento sobre este mismo tablero.
+        Basta con guardar las tres máscaras, la clave y los puntajes para poder deshacerlo.
+        """
+        self.pila_deshacer.append((self.blancas, self.negras, self.damas, self.clave,
+                                   self.puntaje_blanco, self.puntaje_negro))
+        self._ejecutar_movimiento(movimiento)
+    
+    def deshacer_movimiento(self):
+        """Revierte el último movimiento hecho con hacer_movimiento."""
+        (self.blancas, self.negras, self.damas, self.clave,
+         self.puntaje_blanco, self.puntaje_negro) = self.pila_deshacer.pop()
+    
+    def _ejecutar_movimiento(self, movimiento):
+        """Modifica las máscaras, la clave Zobrist y los puntajes con el movimiento."""
+        (origen_f, origen_c), (destino_f, destino_c) = movimiento
+        indice_origen = coordenada_a_indice(origen_f, origen_c)
+        indice_destino = coordenada_a_indice(destino_f, destino_c)
+        bit_origen = 1 << indice_origen
+        bit_destino = 1 << indice_destino
+        es_blanca = bool(self.blancas & bit_origen)
+        es_dama = bool(self.damas & bit_origen)
+        pieza_movida = self._pieza_en_indice(indice_origen)
+        
+        # Eliminar piezas enemigas en el camino (capturas)
+        if abs(origen_f - destino_f) > 1 or abs(origen_c - destino_c) > 1:
+            direccion = (1 if destino_f > origen_f else -1, 1 if destino_c > origen_c else -1)
+            enemigas = self.negras if es_blanca else self.blancas
+            capturadas = 0
+            paso = desplazar(bit_origen, direccion)
+            while paso and paso != bit_destino:
+                capturadas |= paso & enemigas
+                paso = desplazar(paso, direccion)
+            valor_capturado = 0
+            for bit in iterar_bits(capturadas):
+                indice = bit.bit_length() - 1
+                pieza = self._pieza_en_indice(indice)
+                self.clave ^= CLAVES_INDICE[pieza][indice]
+                valor_capturado += VALORES_INDICE[pieza][indice]
+            if es_blanca:
+                self.puntaje_negro -= valor_capturado
+            else:
+                self.puntaje_blanco -= valor_capturado
+            if es_blanca:
+                self.negras &= ~capturadas
+            else:
+                self.blancas &= ~capturadas
+            self.damas &= ~capturadas
+        
+        # Mover la pieza
+        movimiento_bits = bit_origen | bit_destino
+        if es_blanca:
+            self.blancas ^= movimiento_bits
+        else:
+            self.negras ^= movimiento_bits
+        if es_dama:
+            self.damas ^= movimiento_bits
+        elif bit_destino & (FILA_SUPERIOR if es_blanca else FILA_INFERIOR):
+            self.damas |= bit_destino  # Coronación
+        
+        pieza_final = self._pieza_en_indice(indice_destino)
+        self.clave ^= CLAVES_INDICE[pieza_movida][indice_origen] ^ CLAVES_INDICE[pieza_final][indice_destino]
+        diferencia = VALORES_INDICE[pieza_final][indice_destino] - VALORES_INDICE[pieza_movida][indice_origen]
+        if es_blanca:
+            self.puntaje_blanco += diferencia
+        else:
+            self.puntaje_negro += diferencia
+    
+    def contar_piezas(self):
+        """Retorna (piezas_blancas, piezas_negras)."""
+        return contar_bits(self.blancas), contar_bits(self.negras)
+    
+    def obtener_puntajes(self):
+        """Retorna el puntaje de material y posición (puntaje_blanco, puntaje_negro)."""
+        return self.puntaje_blanco, self.puntaje_negro
+    
+    def determinar_ganador(self, jugador_actual):
+        """Determina si hay un ganador en el juego."""
+        if not self.blancas:
+            return JUGADOR_NEGRO
+        if not self.negras:
+            return JUGADOR_BLANCO
+        
+        if not self.tiene_movimientos(jugador_actual):
+            return JUGADOR_NEGRO if jugador_actual == JUGADOR_BLANCO else JUGADOR_BLANCO
+        
+        return None
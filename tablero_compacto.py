@@ -0,0 +1,388 @@
+# tablero_compacto.py
+"""
+Motor compacto del tablero.
+El estado es un bytearray con un código de pieza (CODIGOS_PIEZA) por
+casilla oscura, en el orden de CASILLAS_OSCURAS: el mismo formato que
+serializar(), así que serializar y desde_serializado se reducen a copiar
+los bytes. La clase usa __slots__, de modo que cada tablero ocupa unas
+pocas ranuras fijas en lugar de un __dict__ y ocho listas de filas.
+
+Las jugadas se identifican con un entero empaquetado (origen * N_CASILLAS
++ destino). Hacia fuera se siguen entregando las tuplas ((f, c), (f, c))
+que esperan la interfaz y main.py, pero son siempre las mismas tuplas
+precalculadas: generar movimientos no crea ninguna. La pila de deshacer
+guarda un solo entero por jugada.
+"""
+from configuracion import *
+from tablero import Tablero, CODIGOS_PIEZA, PIEZAS_POR_CODIGO, valor_posicional
+from geometria import CASILLAS_OSCURAS, DIRECCIONES_DAMA, DIRECCIONES_PEON, RAYOS
+from zobrist import CLAVES_PIEZA
+
+
+N_CASILLAS = len(CASILLAS_OSCURAS)
+INDICES = {casilla: indice for indice, casilla in enumerate(CASILLAS_OSCURAS)}
+
+VACIA = CODIGOS_PIEZA[CELDA_VACIA]
+BLANCO = CODIGOS_PIEZA[JUGADOR_BLANCO]
+NEGRO = CODIGOS_PIEZA[JUGADOR_NEGRO]
+
+# Por código de pieza: color dueño (VACIA, BLANCO o NEGRO) y si es dama
+DUENOS = tuple(VACIA if pieza == CELDA_VACIA else BLANCO if pieza in (JUGADOR_BLANCO, DAMA_BLANCA) else NEGRO
+               for pieza in PIEZAS_POR_CODIGO)
+ES_DAMA = tuple(pieza in (DAMA_BLANCA, DAMA_NEGRA) for pieza in PIEZAS_POR_CODIGO)
+RIVAL = {BLANCO: NEGRO, NEGRO: BLANCO}
+
+# Claves Zobrist y valores posicionales por código y casilla (cero para la casilla vacía)
+CLAVES_CODIGO = tuple(
+    tuple(0 if pieza == CELDA_VACIA else CLAVES_PIEZA[pieza][fila][columna] for fila, columna in CASILLAS_OSCURAS)
+    for pieza in PIEZAS_POR_CODIGO
+)
+VALORES_CODIGO = tuple(
+    tuple(0 if pieza == CELDA_VACIA else valor_posicional(pieza, fila, columna) for fila, columna in CASILLAS_OSCURAS)
+    for pieza in PIEZAS_POR_CODIGO
+)
+
+# CORONADA[codigo][casilla]: código de la pieza que queda al llegar a la casilla
+CORONADA = tuple(
+    tuple(CODIGOS_PIEZA[DAMA_BLANCA] if pieza == JUGADOR_BLANCO and fila == 0 else
+          CODIGOS_PIEZA[DAMA_NEGRA] if pieza == JUGADOR_NEGRO and fila == TABLERO_DIM - 1 else
+          codigo for fila, _ in CASILLAS_OSCURAS)
+    for codigo, pieza in enumerate(PIEZAS_POR_CODIGO)
+)
+
+
+def _movimientos():
+    """MOVIMIENTOS[empaquetado]: la tupla ((f, c), (f, c)) de cada par de casillas."""
+    return tuple((origen, destino) for origen in CASILLAS_OSCURAS for destino in CASILLAS_OSCURAS)
+
+
+MOVIMIENTOS = _movimientos()
+EMPAQUETADOS = {movimiento: empaquetado for empaquetado, movimiento in enumerate(MOVIMIENTOS)}
+
+
+def empaquetar_movimiento(movimiento):
+    """Convierte ((f, c), (f, c)) en el entero origen * N_CASILLAS + destino."""
+    return EMPAQUETADOS[movimiento]
+
+
+def desempaquetar_movimiento(empaquetado):
+    """Retorna la tupla ((f, c), (f, c)) de un movimiento empaquetado."""
+    return MOVIMIENTOS[empaquetado]
+
+
+def _jugada(origen, destino):
+    return destino, MOVIMIENTOS[origen * N_CASILLAS + destino]
+
+
+def _tablas_geometria():
+    """
+    Por casilla: RAYOS_JUGADAS[casilla] con cada rayo como tupla de
+    (destino, movimiento); y por código de pieza, PASOS[codigo][casilla]
+    con (destino, movimiento) y SALTOS[codigo][casilla] con (saltada,
+    destino, movimiento) en las direcciones en que la pieza da un paso
+    (todas para las damas).
+    """
+    rayos = tuple(
+        tuple(tuple(_jugada(origen, INDICES[casilla]) for casilla in RAYOS[coordenadas][direccion])
+              for direccion in DIRECCIONES_DAMA)
+        for origen, coordenadas in enumerate(CASILLAS_OSCURAS)
+    )
+    pasos, saltos = [], []
+    for pieza in PIEZAS_POR_CODIGO:
+        if pieza == CELDA_VACIA:
+            direcciones = []
+        elif pieza in (DAMA_BLANCA, DAMA_NEGRA):
+            direcciones = DIRECCIONES_DAMA
+        else:
+            direcciones = DIRECCIONES_PEON[pieza]
+        numeros = [DIRECCIONES_DAMA.index(direccion) for direccion in direcciones]
+        pasos.append(tuple(
+            tuple(rayos[origen][numero][0] for numero in numeros if rayos[origen][numero])
+            for origen in range(N_CASILLAS)
+        ))
+        saltos.append(tuple(
+            tuple((rayos[origen][numero][0][0],) + rayos[origen][numero][1]
+                  for numero in numeros if len(rayos[origen][numero]) >= 2)
+            for origen in range(N_CASILLAS)
+        ))
+    return rayos, tuple(pasos), tuple(saltos)
+
+
+RAYOS_JUGADAS, PASOS, SALTOS = _tablas_geometria()
+
+
+def _intermedias():
+    """INTERMEDIAS[empaquetado]: casillas que atraviesa el movimiento (vacío si no es diagonal)."""
+    intermedias = [()] * len(MOVIMIENTOS)
+    for origen, rayos in enumerate(RAYOS_JUGADAS):
+        for rayo in rayos:
+            for paso, (destino, _) in enumerate(rayo):
+                intermedias[origen * N_CASILLAS + destino] = tuple(casilla for casilla, _ in rayo[:paso])
+    return tuple(intermedias)
+
+
+INTERMEDIAS = _intermedias()
+
+# Registro de deshacer empaquetado: movimiento, pieza movida, casilla y pieza capturadas
+BITS_CODIGO = 3
+BITS_MOVIMIENTO = (N_CASILLAS * N_CASILLAS).bit_length()
+MASCARA_CODIGO = (1 << BITS_CODIGO) - 1
+MASCARA_MOVIMIENTO = (1 << BITS_MOVIMIENTO) - 1
+
+
+class TableroCompacto(Tablero):
+    """
+    Tablero de damas guardado como bytearray de códigos de pieza.
+    Mantiene la misma interfaz pública que Tablero; obtener_tablero() sigue
+    retornando la matriz de piezas que dibuja main.py.
+    """
+    
+    __slots__ = ("celdas",)
+    
+    def __init__(self):
+        """Inicializa el tablero con la disposición estándar."""
+        self.celdas = bytearray(N_CASILLAS)
+        self.pila_deshacer = []
+        self.inicializar_tablero()
+    
+    def inicializar_tablero(self):
+        """Coloca las piezas en las filas iniciales de cada jugador."""
+        for indice, (fila, _) in enumerate(CASILLAS_OSCURAS):
+            if fila < (TABLERO_DIM // 2) - 1:
+                self.celdas[indice] = NEGRO
+            elif fila >= (TABLERO_DIM // 2) + 1:
+                self.celdas[indice] = BLANCO
+            else:
+                self.celdas[indice] = VACIA
+        self._recalcular_totales()
+    
+    def obtener_tablero(self):
+        """Retorna el estado como matriz TABLERO_DIM x TABLERO_DIM."""
+        tablero = [[CELDA_VACIA for _ in range(TABLERO_DIM)] for _ in range(TABLERO_DIM)]
+        for (fila, columna), codigo in zip(CASILLAS_OSCURAS, self.celdas):
+            tablero[fila][columna] = PIEZAS_POR_CODIGO[codigo]
+        return tablero
+    
+    def establecer_tablero(self, nuevo_tablero):
+        """Carga el estado desde una matriz TABLERO_DIM x TABLERO_DIM."""
+        self.celdas = bytearray(CODIGOS_PIEZA[nuevo_tablero[fila][columna]] for fila, columna in CASILLAS_OSCURAS)
+        self.pila_deshacer = []
+        self._recalcular_totales()
+    
+    def serializar(self):
+        """Retorna el estado como bytes: un código de pieza por casilla oscura."""
+        return bytes(self.celdas)
+    
+    @classmethod
+    def desde_serializado(cls, datos):
+        """Crea un tablero a partir de los bytes producidos por serializar()."""
+        tablero = cls.__new__(cls)
+        tablero.celdas = bytearray(datos)
+        tablero.pila_deshacer = []
+        tablero._recalcular_totales()
+        return tablero
+    
+    def __reduce__(self):
+        # Al enviarlo entre procesos basta con los bytes; el resto se recalcula
+        return type(self).desde_serializado, (bytes(self.celdas),)
+    
+    def copiar(self):
+        """Retorna una copia independiente del tablero, sin historial de deshacer."""
+        nuevo = TableroCompacto.__new__(TableroCompacto)
+        nuevo.celdas = self.celdas[:]
+        nuevo.pila_deshacer = []
+        nuevo.clave = self.clave
+        nuevo.piezas_blancas = self.piezas_blancas
+        nuevo.piezas_negras = self.piezas_negras
+        nuevo.puntaje_blanco = self.puntaje_blanco
+        nuevo.puntaje_negro = self.puntaje_negro
+        return nuevo
+    
+    def _recalcular_totales(self):
+        """Calcula desde cero la clave Zobrist, el número de piezas y los puntajes."""
+        self.clave = 0
+        self.piezas_blancas = 0
+        self.piezas_negras = 0
+        self.puntaje_blanco = 0
+        self.puntaje_negro = 0
+        for indice, codigo in enumerate(self.celdas):
+            if codigo != VACIA:
+                self._poner(indice, VACIA, codigo)
+    
+    def _poner(self, indice, anterior, codigo):
+        """Cambia la pieza de una casilla y actualiza por diferencia la clave y los totales."""
+        self.celdas[indice] = codigo
+        self.clave ^= CLAVES_CODIGO[anterior][indice] ^ CLAVES_CODIGO[codigo][indice]
+        if anterior != VACIA:
+            if DUENOS[anterior] == BLANCO:
+                self.piezas_blancas -= 1
+                self.puntaje_blanco -= VALORES_CODIGO[anterior][indice]
+            else:
+                self.piezas_negras -= 1
+                self.puntaje_negro -= VALORES_CODIGO[anterior][indice]
+        if codigo != VACIA:
+            if DUENOS[codigo] == BLANCO:
+                self.piezas_blancas += 1
+                self.puntaje_blanco += VALORES_CODIGO[codigo][indice]
+            else:
+                self.piezas_negras += 1
+                self.puntaje_negro += VALORES_CODIGO[codigo][indice]
+    
+    def obtener_pieza(self, fila, columna):
+        """Obtiene la pieza en una posición específica."""
+        indice = INDICES.get((fila, columna))
+        return CELDA_VACIA if indice is None else PIEZAS_POR_CODIGO[self.celdas[indice]]
+    
+    def movimientos_disponibles(self, jugador):
+        """
+        Retorna todos los movimientos válidos para un jugador.
+        Las capturas son obligatorias cuando están disponibles.
+        """
+        color = CODIGOS_PIEZA[jugador]
+        celdas = self.celdas
+        piezas = [(indice, codigo) for indice, codigo in enumerate(celdas) if DUENOS[codigo] == color]
+        
+        capturas = set()
+        for indice, codigo in piezas:
+            capturas.update(self._capturas(indice, codigo, RIVAL[color]))
+        if capturas:
+            return capturas
+        
+        movimientos = set()
+        for indice, codigo in piezas:
+            movimientos.update(self._movimientos(indice, codigo))
+        return movimientos
+    
+    def generar_movimientos(self, jugador):
+        """
+        Versión perezosa de movimientos_disponibles, pieza a pieza: primero
+        las capturas y, solo si no hubo ninguna, los movimientos normales.
+        Entre un movimiento y el siguiente el tablero tiene que estar como al
+        empezar (hacer y deshacer lo cumplen).
+        """
+        color = CODIGOS_PIEZA[jugador]
+        rival = RIVAL[color]
+        celdas = self.celdas
+        hubo_captura = False
+        for indice in range(N_CASILLAS):
+            codigo = celdas[indice]
+            if DUENOS[codigo] == color:
+                for captura in self._capturas(indice, codigo, rival):
+                    hubo_captura = True
+                    yield captura
+        if hubo_captura:
+            return
+        
+        for indice in range(N_CASILLAS):
+            codigo = celdas[indice]
+            if DUENOS[codigo] == color:
+                yield from self._movimientos(indice, codigo)
+    
+    def tiene_movimientos(self, jugador):
+        """
+        Indica si el jugador tiene algún movimiento: un paso a una casilla
+        vacía o un salto sobre una pieza rival adyacente. Basta para las
+        damas, porque una dama sin casillas vacías a su lado solo puede
+        capturar piezas adyacentes.
+        """
+        color = CODIGOS_PIEZA[jugador]
+        rival = RIVAL[color]
+        celdas = self.celdas
+        for indice, codigo in enumerate(celdas):
+            if DUENOS[codigo] != color:
+                continue
+            for destino, _ in PASOS[codigo][indice]:
+                if celdas[destino] == VACIA:
+                    return True
+            for saltada, destino, _ in SALTOS[codigo][indice]:
+                if DUENOS[celdas[saltada]] == rival and celdas[destino] == VACIA:
+                    return True
+        return False
+    
+    def _movimientos(self, indice, codigo):
+        """Movimientos normales de la pieza de la casilla."""
+        celdas = self.celdas
+        if not ES_DAMA[codigo]:
+            return [movimiento for destino, movimiento in PASOS[codigo][indice] if celdas[destino] == VACIA]
+        
+        movimientos = []
+        for rayo in RAYOS_JUGADAS[indice]:
+            for destino, movimiento in rayo:
+                if celdas[destino] != VACIA:
+                    break  # Bloqueado por otra pieza
+                movimientos.append(movimiento)
+        return movimientos
+    
+    def _capturas(self, indice, codigo, rival):
+        """Capturas de la pieza de la casilla sobre piezas del color rival."""
+        celdas = self.celdas
+        if not ES_DAMA[codigo]:
+            return [movimiento for saltada, destino, movimiento in SALTOS[codigo][indice]
+                    if DUENOS[celdas[saltada]] == rival and celdas[destino] == VACIA]
+        
+        capturas = []
+        for rayo in RAYOS_JUGADAS[indice]:
+            for distancia, (casilla, _) in enumerate(rayo):
+                ocupante = celdas[casilla]
+                if ocupante == VACIA:
+                    continue
+                if DUENOS[ocupante] == rival:
+                    # Destinos válidos después de la pieza saltada
+                    for destino, movimiento in rayo[distancia + 1:]:
+                        if celdas[destino] != VACIA:
+                            break
+                        capturas.append(movimiento)
+                break
+        return capturas
+    
+    def es_captura(self, movimiento):
+        """
+        Indica si el movimiento, aún sin aplicar, salta alguna pieza. Como las
+        capturas son obligatorias, si un movimiento legal captura lo hacen todos.
+        """
+        celdas = self.celdas
+        return any(celdas[casilla] != VACIA for casilla in INTERMEDIAS[EMPAQUETADOS[movimiento]])
+    
+    def hacer_movimiento(self, movimiento):
+        """
+        Aplica un movimiento sobre este mismo tablero.
+        El registro para deshacerlo es un único entero.
+        """
+        self.pila_deshacer.append(self._ejecutar_movimiento(movimiento))
+    
+    def deshacer_movimiento(self):
+        """Revierte el último movimiento hecho con hacer_movimiento."""
+        registro = self.pila_deshacer.pop()
+        origen, destino = divmod(registro & MASCARA_MOVIMIENTO, N_CASILLAS)
+        registro >>= BITS_MOVIMIENTO
+        movida = registro & MASCARA_CODIGO
+        registro >>= BITS_CODIGO
+        capturada = registro & MASCARA_CODIGO
+        
+        self._poner(destino, self.celdas[destino], VACIA)
+        self._poner(origen, VACIA, movida)
+        if capturada != VACIA:
+            self._poner(registro >> BITS_CODIGO, VACIA, capturada)
+    
+    def _ejecutar_movimiento(self, movimiento):
+        """
+        Modifica el tablero con el movimiento y retorna el registro empaquetado
+        para deshacerlo: movimiento, pieza movida y, si la hubo, pieza capturada
+        y su casilla. Con estas reglas una captura salta exactamente una pieza.
+        """
+        empaquetado = EMPAQUETADOS[movimiento]
+        origen, destino = divmod(empaquetado, N_CASILLAS)
+        celdas = self.celdas
+        movida = celdas[origen]
+        
+        registro = 0
+        for casilla in INTERMEDIAS[empaquetado]:
+            capturada = celdas[casilla]
+            if capturada != VACIA:
+                self._poner(casilla, capturada, VACIA)
+                registro = (casilla << BITS_CODIGO) | capturada
+                break
+        
+        self._poner(origen, movida, VACIA)
+        self._poner(destino, VACIA, CORONADA[movida][destino])
+        return (((registro << BITS_CODIGO) | movida) << BITS_MOVIMIENTO) | empaquetado
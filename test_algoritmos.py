@@ -0,0 +1,69 @@
+# test_algoritmos.py
+"""
+Pruebas de los algoritmos de búsqueda en serie.
+
+Uso:
+    python -m pytest test_algoritmos.py
+"""
+import pytest
+import algoritmos
+from algoritmos import AlgoritmoMinimaxAlfaBeta, AlgoritmoPVS, ConfiguracionIA
+from posiciones import POSICIONES, crear_posicion
+from test_paralelo import posiciones_aleatorias
+
+
+def posiciones_de_prueba():
+    """Las posiciones de referencia más 30 alcanzadas con partidas aleatorias."""
+    return [crear_posicion(nombre) for nombre in sorted(POSICIONES)] + posiciones_aleatorias(30)
+
+
+@pytest.mark.parametrize("profundidad", [3, 5])
+def test_pvs_sin_reducciones_da_el_valor_de_alfa_beta(monkeypatch, profundidad):
+    """
+    Sin LMR, las ventanas nulas y de aspiración de PVS solo ahorran nodos:
+    el valor de la raíz es el de la poda Alfa-Beta a la misma profundidad.
+    """
+    monkeypatch.setattr(algoritmos, "PVS_MOVIMIENTOS_SIN_REDUCIR", 10 ** 6)
+    for tablero, jugador in posiciones_de_prueba():
+        valor, _ = AlgoritmoPVS(ConfiguracionIA()).buscar_iterativa(tablero, jugador, profundidad)
+        assert valor == AlgoritmoMinimaxAlfaBeta(ConfiguracionIA()).buscar(tablero, jugador, profundidad)[0]
+
+
+@pytest.mark.parametrize("limite", [0, 1, 2])
+def test_quiescencia_no_pasa_del_limite_de_profundidad(monkeypatch, limite):
+    """
+    Las capturas se siguen como mucho QUIESCENCIA_PROFUNDIDAD_MAXIMA plies
+    más allá del horizonte, y en alguna posición se llega a ese límite.
+    """
+    monkeypatch.setattr(algoritmos, "QUIESCENCIA_PROFUNDIDAD_MAXIMA", limite)
+    alcanzadas = []
+    for tablero, jugador in posiciones_de_prueba():
+        algoritmo = AlgoritmoMinimaxAlfaBeta(ConfiguracionIA(), quiescencia=True)
+        algoritmo.buscar(tablero, jugador, 2)
+        alcanzadas.append(algoritmo.profundidad_maxima)
+        if limite == 0:
+            assert algoritmo.nodos_quiescencia == 0
+    assert max(alcanzadas) == 2 + limite
+
+
+@pytest.mark.parametrize("presupuesto", [0, 20])
+def test_quiescencia_no_empieza_con_el_presupuesto_agotado(monkeypatch, presupuesto):
+    """
+    Gastados QUIESCENCIA_MAX_NODOS nodos, las hojas se evalúan sin abrir
+    otra quiescencia; solo terminan las capturas de las que ya estaban abiertas.
+    """
+    monkeypatch.setattr(algoritmos, "QUIESCENCIA_MAX_NODOS", presupuesto)
+    for tablero, jugador in posiciones_de_prueba():
+        algoritmo = AlgoritmoMinimaxAlfaBeta(ConfiguracionIA(), quiescencia=True)
+        gastados = []
+        quiescencia = algoritmo._quiescencia
+        
+        def registrar(*argumentos):
+            gastados.append(algoritmo.nodos_quiescencia)
+            return quiescencia(*argumentos)
+        
+        algoritmo._quiescencia = registrar
+        algoritmo.buscar(tablero, jugador, 2)
+        assert all(nodos < presupuesto for nodos in gastados)
+        if presupuesto == 0:
+            assert algoritmo.nodos_quiescencia == 0
@@ -0,0 +1,22 @@
+# test_autojuego.py
+"""
+Pruebas de la línea de órdenes de autojuego.
+
+Uso:
+    python -m pytest test_autojuego.py
+"""
+import pytest
+import autojuego
+
+
+@pytest.mark.parametrize("opciones, mensaje", [
+    ("usar_paralelo=True,usar_pvs=True", "usar_paralelo no admite usar_pvs"),
+    ("usar_lazy_smp=True,usar_alfa_beta=False", "Lazy SMP necesita Alfa-Beta"),
+    ("opcion_inexistente=1", "opcion_inexistente"),
+])
+def test_opciones_no_validas_son_un_error_de_la_linea_de_ordenes(opciones, mensaje, capsys):
+    """Se rechazan con el mensaje de argparse (código 2) antes de lanzar partidas."""
+    with pytest.raises(SystemExit) as salida:
+        autojuego.main(["--partidas", "2", "--a", opciones])
+    assert salida.value.code == 2
+    assert mensaje in capsys.readouterr().err
@@ -0,0 +1,56 @@
+# test_evaluacion_lotes.py
+"""
+Pruebas de la evaluación por lotes con NumPy.
+
+Uso:
+    python -m pytest test_evaluacion_lotes.py
+"""
+import random
+import pytest
+from algoritmos import EvaluadorTablero
+from configuracion import *
+from evaluacion_lotes import NUMPY_DISPONIBLE, EvaluadorLotes, codificar, codificar_hijos
+from tablero import Tablero
+
+pytestmark = pytest.mark.skipif(not NUMPY_DISPONIBLE, reason="La evaluación por lotes necesita NumPy")
+
+
+def tableros_de_partidas(partidas=40, semilla=5):
+    """Todos los tableros de varias partidas aleatorias, con damas y finales incluidos."""
+    generador = random.Random(semilla)
+    tableros = []
+    for _ in range(partidas):
+        tablero, jugador = Tablero(), JUGADOR_BLANCO
+        for _ in range(150):
+            tableros.append(tablero)
+            movimientos = sorted(tablero.movimientos_disponibles(jugador))
+            if not movimientos:
+                break
+            tablero = tablero.aplicar_movimiento(generador.choice(movimientos))
+            jugador = tablero.obtener_jugador_oponente(jugador)
+    return tableros
+
+
+@pytest.mark.parametrize("jugador", [JUGADOR_BLANCO, JUGADOR_NEGRO])
+def test_evaluar_da_la_utilidad_de_cada_tablero(jugador):
+    """Cada fila del lote vale lo mismo que calcular_utilidad, también en los finales de partida."""
+    tableros = tableros_de_partidas()
+    valores, capturas = EvaluadorLotes().evaluar(codificar([t.serializar() for t in tableros]), jugador,
+                                                 con_capturas=True)
+    for tablero, valor, captura in zip(tableros, valores, capturas):
+        assert valor == pytest.approx(EvaluadorTablero.calcular_utilidad(tablero, jugador))
+        movimientos = tablero.movimientos_disponibles(jugador)
+        assert captura == (bool(movimientos) and tablero.es_captura(next(iter(movimientos))))
+
+
+def test_codificar_hijos_equivale_a_aplicar_cada_movimiento():
+    """Los hijos codificados sin construirlos son los tableros que da aplicar_movimiento."""
+    generador = random.Random(3)
+    for tablero in tableros_de_partidas(partidas=10):
+        for jugador in (JUGADOR_BLANCO, JUGADOR_NEGRO):
+            movimientos = sorted(tablero.movimientos_disponibles(jugador))
+            if not movimientos:
+                continue
+            generador.shuffle(movimientos)
+            esperados = codificar([tablero.aplicar_movimiento(m).serializar() for m in movimientos])
+            assert (codificar_hijos(tablero.serializar(), movimientos) == esperados).all()
@@ -0,0 +1,129 @@
+# test_paralelo.py
+"""
+Pruebas de la búsqueda paralela.
+
+Uso:
+    python -m pytest test_paralelo.py
+"""
+import os
+import random
+import subprocess
+import sys
+import pytest
+import paralelo
+from algoritmos import AlgoritmoMinimax, AlgoritmoMinimaxAlfaBeta, AlgoritmoPVS, ConfiguracionIA, JugadorIA
+from configuracion import *
+from paralelo import AlgoritmoParaleloRaiz, cerrar_pool
+from posiciones import crear_posicion
+from tablero import Tablero
+from transposicion import TablaTransposicionCompartida
+
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+# La búsqueda en la raíz crea los trabajadores antes que la tabla compartida
+# de Lazy SMP; tras cerrar el pool, la tabla tiene que seguir existiendo
+ESCENARIO_RASTREADOR = """
+import time
+from multiprocessing import shared_memory
+import paralelo
+from algoritmos import ConfiguracionIA
+from configuracion import JUGADOR_BLANCO
+from tablero import Tablero
+
+paralelo.AlgoritmoParaleloRaiz(ConfiguracionIA(), procesos=2).buscar(Tablero(), JUGADOR_BLANCO, 2)
+paralelo.AlgoritmoLazySMP(ConfiguracionIA(), procesos=2).buscar(Tablero(), JUGADOR_BLANCO, 3)
+nombre = paralelo._tabla_compartida.nombre
+paralelo.cerrar_pool()
+time.sleep(1)  # El rastreador de un trabajador limpia al notar que este terminó
+try:
+    shared_memory.SharedMemory(name=nombre).close()
+    print("viva")
+except FileNotFoundError:
+    print("borrada")
+"""
+
+
+def test_tabla_compartida_sobrevive_a_los_trabajadores():
+    """
+    Los trabajadores creados antes que la tabla compartida no la borran al
+    terminar. Corre en un proceso nuevo porque el rastreador de recursos es
+    uno por proceso y otra prueba podría haberlo arrancado ya.
+    """
+    resultado = subprocess.run([sys.executable, "-c", ESCENARIO_RASTREADOR], cwd=DIRECTORIO,
+                               capture_output=True, text=True, timeout=300)
+    assert resultado.stdout.strip() == "viva", resultado.stderr
+
+
+def posiciones_aleatorias(cantidad, semilla=7):
+    """Posiciones no finales alcanzadas con partidas aleatorias de longitud variable."""
+    generador = random.Random(semilla)
+    posiciones = []
+    while len(posiciones) < cantidad:
+        tablero, jugador = Tablero(), JUGADOR_BLANCO
+        for _ in range(generador.randrange(4, 40)):
+            movimientos = sorted(tablero.movimientos_disponibles(jugador))
+            if not movimientos:
+                break
+            tablero = tablero.aplicar_movimiento(generador.choice(movimientos))
+            jugador = tablero.obtener_jugador_oponente(jugador)
+        if not tablero.es_final(jugador):
+            posiciones.append((tablero, jugador))
+    return posiciones
+
+
+@pytest.mark.parametrize("usar_alfa_beta, clase_serie, profundidad", [
+    (True, AlgoritmoMinimaxAlfaBeta, 4),
+    (False, AlgoritmoMinimax, 3),
+])
+def test_paralelo_raiz_elige_el_movimiento_de_la_busqueda_serie(usar_alfa_beta, clase_serie, profundidad):
+    """
+    A igual profundidad, la búsqueda en la raíz retorna el mismo valor y el
+    mismo movimiento que la serie, también cuando varios empatan en valor.
+    """
+    paralelo = AlgoritmoParaleloRaiz(ConfiguracionIA(), usar_alfa_beta, procesos=2)
+    try:
+        for tablero, jugador in posiciones_aleatorias(30):
+            serie = clase_serie(ConfiguracionIA()).buscar(tablero, jugador, profundidad)
+            assert paralelo.buscar(tablero, jugador, profundidad) == serie
+    finally:
+        cerrar_pool()
+
+
+def test_lazy_smp_crea_en_el_trabajador_el_algoritmo_pedido(monkeypatch):
+    """PVS, quiescencia y evaluación por lotes llegan al algoritmo de cada trabajador."""
+    monkeypatch.setattr(paralelo, "_algoritmos_trabajador", {})
+    tabla = TablaTransposicionCompartida(1024)
+    try:
+        algoritmo = paralelo._algoritmo_lazy_smp(tabla.nombre, 1024, False, True, (True, False, True, False))
+        assert isinstance(algoritmo, AlgoritmoPVS)
+        assert algoritmo.quiescencia
+        assert algoritmo.tabla_transposicion.nombre == tabla.nombre
+        algoritmo.tabla_transposicion.cerrar()
+    finally:
+        tabla.cerrar()
+
+
+def test_lazy_smp_busca_con_quiescencia():
+    """Con usar_quiescencia, los trabajadores Lazy SMP resuelven las capturas del horizonte."""
+    tablero, jugador = crear_posicion("capturas")
+    ia = JugadorIA(jugador, nivel=2, usar_lazy_smp=True, usar_quiescencia=True, procesos=2)
+    try:
+        movimiento, estadisticas = ia.obtener_movimiento_con_estadisticas(tablero)
+    finally:
+        cerrar_pool()
+    assert movimiento in tablero.movimientos_disponibles(jugador)
+    assert estadisticas.nodos_quiescencia > 0
+
+
+def test_lazy_smp_rechaza_minimax():
+    with pytest.raises(ValueError):
+        JugadorIA(JUGADOR_BLANCO, usar_lazy_smp=True, usar_alfa_beta=False)
+
+
+@pytest.mark.parametrize("opcion", ["profundizacion_iterativa", "usar_transposicion", "ordenar_movimientos",
+                                    "usar_pvs", "usar_quiescencia", "usar_tablas_finales",
+                                    "usar_evaluacion_lotes"])
+def test_paralelo_raiz_rechaza_opciones_que_no_aplica(opcion):
+    with pytest.raises(ValueError, match=opcion):
+        JugadorIA(JUGADOR_BLANCO, usar_paralelo=True, **{opcion: True})
@@ -0,0 +1,62 @@
+# test_tablero.py
+"""
+Pruebas de los motores de tablero: cada uno tiene que comportarse como
+Tablero y dar los conteos de referencia de perft.
+
+Uso:
+    python -m pytest test_tablero.py
+"""
+import random
+import pytest
+from configuracion import *
+from perft import MOTORES, verificar
+from tablero import Tablero
+
+
+PLIES_POR_PARTIDA = 120  # Sin regla de tablas, dos damas podrían moverse para siempre
+
+
+def estado(tablero, jugador):
+    """Todo lo que la búsqueda y la interfaz leen de un tablero."""
+    return (tablero.obtener_tablero(), tablero.clave, tablero.contar_piezas(), tablero.obtener_puntajes(),
+            tablero.movimientos_disponibles(jugador), set(tablero.generar_movimientos(jugador)),
+            tablero.tiene_movimientos(jugador), tablero.determinar_ganador(jugador), tablero.serializar())
+
+
+@pytest.mark.parametrize("motor", ["bits", "compacto"])
+def test_motor_equivale_a_tablero_en_partidas_aleatorias(motor):
+    """
+    Jugando las mismas partidas aleatorias, el motor genera los mismos
+    movimientos y llega a los mismos estados que Tablero, con
+    aplicar_movimiento y con hacer/deshacer_movimiento.
+    """
+    generador = random.Random(11)
+    for _ in range(20):
+        referencia, tablero, jugador = Tablero(), MOTORES[motor](), JUGADOR_BLANCO
+        for _ in range(PLIES_POR_PARTIDA):
+            assert estado(tablero, jugador) == estado(referencia, jugador)
+            movimientos = sorted(referencia.movimientos_disponibles(jugador))
+            if not movimientos:
+                break
+            
+            oponente = referencia.obtener_jugador_oponente(jugador)
+            antes = estado(tablero, jugador)
+            for movimiento in movimientos:
+                esperado = estado(referencia.aplicar_movimiento(movimiento), oponente)
+                assert estado(tablero.aplicar_movimiento(movimiento), oponente) == esperado
+                tablero.hacer_movimiento(movimiento)
+                assert estado(tablero, oponente) == esperado
+                tablero.deshacer_movimiento()
+                assert estado(tablero, jugador) == antes
+            
+            movimiento = generador.choice(movimientos)
+            referencia = referencia.aplicar_movimiento(movimiento)
+            tablero.hacer_movimiento(movimiento)
+            jugador = oponente
+
+
+@pytest.mark.parametrize("motor", sorted(MOTORES))
+@pytest.mark.parametrize("hacer_deshacer", [False, True])
+def test_perft_coincide_con_las_referencias(motor, hacer_deshacer):
+    """perft.py --verificar pasa con todos los motores, hasta profundidad 5 para que la prueba sea rápida."""
+    assert verificar(MOTORES[motor], hacer_deshacer, profundidad_maxima=5) == []
@@ -0,0 +1,163 @@
+# trabajador_ia.py
+"""
+Búsqueda de la IA en un proceso aparte, para que el bucle de pygame siga
+procesando eventos y dibujando mientras el motor piensa.
+El proceso conserva su JugadorIA (tabla de transposición, ordenador)
+entre jugadas; la interfaz le envía tableros y consulta sin bloquear.
+Con meditar=True aprovecha además el turno del rival.
+"""
+import atexit
+import multiprocessing
+import time
+import weakref
+from configuracion import *
+from algoritmos import BusquedaInterrumpida, JugadorIA
+
+
+_trabajadores_activos = weakref.WeakSet()
+
+
+class _SenalCancelacion:
+    """Señal de parada de una búsqueda: se activa cuando deja de ser la vigente."""
+    
+    def __init__(self, vigente, identificador):
+        self.vigente = vigente
+        self.identificador = identificador
+    
+    @property
+    def value(self):
+        return self.vigente.value != self.identificador
+
+
+def _bucle_trabajador(conexion, conexion_padre, vigente, color, opciones):
+    """
+    Atiende pedidos (orden, identificador, clase_tablero, datos) hasta recibir
+    None. La orden "buscar" responde con el movimiento; "meditar" no responde.
+    """
+    conexion_padre.close()  # Así recv() ve EOFError si el proceso principal muere
+    jugador = JugadorIA(color, **opciones)
+    while True:
+        try:
+            pedido = conexion.recv()
+        except EOFError:
+            break
+        if pedido is None:
+            break
+        
+        orden, identificador, clase_tablero, datos = pedido
+        if vigente.value != identificador:
+            continue  # Cancelado antes de empezar
+        
+        jugador.establecer_senal_parada(_SenalCancelacion(vigente, identificador))
+        tablero = clase_tablero.desde_serializado(datos)
+        if orden == "meditar":
+            jugador.meditar(tablero)
+            continue
+        
+        inicio = time.perf_counter_ns()
+        try:
+            movimiento, estadisticas = jugador.obtener_movimiento_con_estadisticas(tablero)
+        except BusquedaInterrumpida:
+            continue
+        conexion.send((identificador, movimiento, time.perf_counter_ns() - inicio,
+                       estadisticas.como_diccionario()))
+    conexion.close()
+
+
+class TrabajadorIA:
+    """
+    Ejecuta las búsquedas de un JugadorIA(color, **opciones) en un proceso propio.
+    
+    iniciar_busqueda() envía el tablero y retorna enseguida; obtener_resultado()
+    se llama en cada fotograma y retorna (movimiento, duracion_ns, estadisticas)
+    cuando la búsqueda termina. meditar() pone al proceso a pensar durante el turno
+    del rival hasta el siguiente pedido. cancelar() descarta la búsqueda en
+    curso y cerrar() detiene el proceso.
+    """
+    
+    def __init__(self, color, **opciones):
+        self.color = color
+        self.meditar_activo = opciones.get("meditar", False)
+        self._vigente = multiprocessing.Value("q", 0, lock=False)  # Identificador del pedido válido
+        self._ultimo_identificador = 0
+        self._pendiente = 0  # Identificador de la búsqueda cuyo resultado se espera
+        self._conexion, conexion_hijo = multiprocessing.Pipe()
+        self._proceso = multiprocessing.Process(
+            target=_bucle_trabajador,
+            args=(conexion_hijo, self._conexion, self._vigente, color, opciones),
+            name=f"TrabajadorIA-{color}"
+        )
+        self._proceso.start()
+        conexion_hijo.close()
+        _trabajadores_activos.add(self)
+    
+    def buscando(self):
+        """Indica si hay una búsqueda en curso cuyo resultado aún no se ha recogido."""
+        return self._pendiente != 0
+    
+    def _enviar(self, orden, tablero):
+        """Envía un pedido que reemplaza al anterior y retorna su identificador."""
+        self._ultimo_identificador += 1
+        self._vigente.value = self._ultimo_identificador
+        self._conexion.send((orden, self._ultimo_identificador, type(tablero), tablero.serializar()))
+        return self._ultimo_identificador
+    
+    def iniciar_busqueda(self, tablero):
+        """Empieza a buscar el movimiento para el tablero, cancelando el pedido anterior."""
+        self._pendiente = self._enviar("buscar", tablero)
+    
+    def meditar(self, tablero):
+        """
+        Busca las respuestas a las jugadas del rival en el tablero dado, hasta
+        el siguiente pedido. No hace nada si el jugador no tiene meditar=True.
+        """
+        if self.meditar_activo:
+            self._pendiente = 0
+            self._enviar("meditar", tablero)
+    
+    def obtener_resultado(self):
+        """
+        Retorna (movimiento, duracion_ns, estadisticas) si la búsqueda vigente
+        terminó, o None si sigue en curso; duracion_ns se mide con
+        perf_counter_ns y estadisticas es el diccionario de
+        EstadisticasBusqueda. Descarta los resultados de búsquedas canceladas.
+        """
+        while self._conexion.poll():
+            identificador, movimiento, duracion_ns, estadisticas = self._conexion.recv()
+            if identificador == self._pendiente:
+                self._pendiente = 0
+                return movimiento, duracion_ns, estadisticas
+        return None
+    
+    def cancelar(self):
+        """Aborta el pedido en curso; el resultado de una búsqueda, si llega, se descarta."""
+        self._vigente.value = 0
+        self._pendiente = 0
+    
+    def cerrar(self, espera=1.0):
+        """Cancela la búsqueda y detiene el proceso; lo termina si no responde a tiempo."""
+        if self._proceso is None:
+            return
+        self.cancelar()
+        try:
+            self._conexion.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self._proceso.join(espera)
+        if self._proceso.is_alive():
+            self._proceso.terminate()
+            self._proceso.join()
+        self._conexion.close()
+        self._proceso = None
+        _trabajadores_activos.discard(self)
+
+
+def cerrar_trabajadores():
+    """Detiene todos los trabajadores que sigan abiertos."""
+    for trabajador in list(_trabajadores_activos):
+        trabajador.cerrar()
+
+
+# Se registra después de importar multiprocessing, así que se ejecuta antes
+# de que este espere a los procesos hijos al salir
+atexit.register(cerrar_trabajadores)
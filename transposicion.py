@@ -0,0 +1,203 @@
+# transposicion.py
+"""
+Tabla de transposición acotada para la búsqueda Alfa-Beta.
+Guarda, por clave Zobrist, la profundidad buscada, el tipo de cota,
+el valor y el mejor movimiento de cada posición.
+TablaTransposicionCompartida guarda lo mismo en memoria compartida entre procesos.
+"""
+import struct
+from collections import namedtuple
+from multiprocessing import shared_memory
+from configuracion import *
+
+
+# Tipos de cota almacenados
+EXACTA = 0
+COTA_INFERIOR = 1  # El valor real es >= valor (corte beta)
+COTA_SUPERIOR = 2  # El valor real es <= valor (ningún movimiento superó alfa)
+
+EntradaTransposicion = namedtuple(
+    "EntradaTransposicion", ["clave", "profundidad", "tipo", "valor", "mejor_movimiento"]
+)
+
+# Registro de la tabla compartida: (clave ^ datos, datos), dos enteros de 64 bits.
+# Los datos empaquetan valor (float32), profundidad, tipo y movimiento (4 bits por coordenada).
+REGISTRO = struct.Struct("<QQ")
+DATOS = struct.Struct("<fbBH")
+SIN_MOVIMIENTO = 0xFFFF
+
+
+class TablaTransposicion:
+    """
+    Tabla de tamaño fijo indexada por clave % max_entradas.
+    
+    Políticas de reemplazo cuando la casilla está ocupada por otra posición:
+    - "profundidad": solo se reemplaza si la nueva búsqueda es igual o más profunda.
+    - "siempre": siempre se reemplaza con la entrada más reciente.
+    """
+    
+    POLITICAS = ("profundidad", "siempre")
+    
+    def __init__(self, max_entradas=TRANSPOSICION_MAX_ENTRADAS, politica=TRANSPOSICION_POLITICA):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política de reemplazo desconocida: {politica}")
+        self.max_entradas = max_entradas
+        self.politica = politica
+        self.entradas = [None] * max_entradas
+        self.reiniciar_contadores()
+    
+    def reiniciar_contadores(self):
+        """Pone a cero los contadores de uso."""
+        self.consultas = 0
+        self.aciertos = 0
+        self.cortes = 0
+        self.almacenamientos = 0
+        self.sobrescrituras = 0
+        self.descartes = 0
+    
+    def limpiar(self):
+        """Vacía la tabla y reinicia los contadores."""
+        self.entradas = [None] * self.max_entradas
+        self.reiniciar_contadores()
+    
+    def consultar(self, clave):
+        """Retorna la entrada de la posición o None si no está en la tabla."""
+        self.consultas += 1
+        entrada = self.entradas[clave % self.max_entradas]
+        if entrada is not None and entrada.clave == clave:
+            self.aciertos += 1
+            return entrada
+        return None
+    
+    def registrar_corte(self):
+        """Cuenta una consulta cuyo valor permitió terminar el nodo."""
+        self.cortes += 1
+    
+    def almacenar(self, clave, profundidad, tipo, valor, mejor_movimiento):
+        """Guarda el resultado de un nodo aplicando la política de reemplazo."""
+        indice = clave % self.max_entradas
+        existente = self.entradas[indice]
+        
+        if existente is not None and existente.clave != clave:
+            if self.politica == "profundidad" and existente.profundidad > profundidad:
+                self.descartes += 1
+                return
+            self.sobrescrituras += 1
+        
+        self.entradas[indice] = EntradaTransposicion(clave, profundidad, tipo, valor, mejor_movimiento)
+        self.almacenamientos += 1
+    
+    def ocupacion(self):
+        """Retorna la fracción de casillas ocupadas."""
+        return sum(1 for entrada in self.entradas if entrada is not None) / self.max_entradas
+    
+    def obtener_estadisticas(self):
+        """Retorna los contadores de uso para dimensionar la tabla."""
+        return {
+            "max_entradas": self.max_entradas,
+            "politica": self.politica,
+            "consultas": self.consultas,
+            "aciertos": self.aciertos,
+            "cortes": self.cortes,
+            "almacenamientos": self.almacenamientos,
+            "sobrescrituras": self.sobrescrituras,
+            "descartes": self.descartes,
+            "ocupacion": self.ocupacion(),
+        }
+
+
+def _codificar_movimiento(movimiento):
+    if movimiento is None:
+        return SIN_MOVIMIENTO
+    (origen_f, origen_c), (destino_f, destino_c) = movimiento
+    return (origen_f << 12) | (origen_c << 8) | (destino_f << 4) | destino_c
+
+
+def _decodificar_movimiento(codigo):
+    if codigo == SIN_MOVIMIENTO:
+        return None
+    return ((codigo >> 12, (codigo >> 8) & 0xF), ((codigo >> 4) & 0xF, codigo & 0xF))
+
+
+class TablaTransposicionCompartida(TablaTransposicion):
+    """
+    Tabla de transposición en un bloque de multiprocessing.shared_memory,
+    para que varios procesos busquen sobre la misma tabla (Lazy SMP).
+    
+    No usa cerrojos: cada registro guarda la clave combinada por XOR con
+    sus datos, así que una escritura concurrente a medias no coincide con
+    ninguna clave y se lee como casilla vacía. Los contadores son propios
+    de cada proceso.
+    
+    Sin nombre crea el bloque; con el nombre de uno existente se conecta a él.
+    """
+    
+    def __init__(self, max_entradas=TRANSPOSICION_MAX_ENTRADAS, politica=TRANSPOSICION_POLITICA,
+                 nombre=None):
+        if politica not in self.POLITICAS:
+            raise ValueError(f"Política de reemplazo desconocida: {politica}")
+        if TABLERO_DIM > 16:
+            raise ValueError("La tabla compartida codifica cada coordenada en 4 bits")
+        self.max_entradas = max_entradas
+        self.politica = politica
+        self.propietaria = nombre is None
+        if self.propietaria:
+            self.memoria = shared_memory.SharedMemory(create=True, size=max_entradas * REGISTRO.size)
+            self.memoria.buf[:] = bytes(len(self.memoria.buf))
+        else:
+            self.memoria = shared_memory.SharedMemory(name=nombre)
+        self.nombre = self.memoria.name
+        self.reiniciar_contadores()
+    
+    def limpiar(self):
+        """Vacía la tabla (para todos los procesos) y reinicia los contadores."""
+        self.memoria.buf[:] = bytes(len(self.memoria.buf))
+        self.reiniciar_contadores()
+    
+    def _leer(self, indice):
+        """Retorna (clave, datos) del registro, o None si está vacío o a medio escribir."""
+        clave_mezclada, datos = REGISTRO.unpack_from(self.memoria.buf, indice * REGISTRO.size)
+        if datos == 0:  # Ningún resultado real se empaqueta como cero: su movimiento nunca es 0
+            return None
+        return clave_mezclada ^ datos, datos
+    
+    def consultar(self, clave):
+        """Retorna la entrada de la posición o None si no está en la tabla."""
+        self.consultas += 1
+        registro = self._leer(clave % self.max_entradas)
+        if registro is None or registro[0] != clave:
+            return None
+        
+        self.aciertos += 1
+        valor, profundidad, tipo, movimiento = DATOS.unpack(registro[1].to_bytes(8, "little"))
+        return EntradaTransposicion(clave, profundidad, tipo, valor, _decodificar_movimiento(movimiento))
+    
+    def almacenar(self, clave, profundidad, tipo, valor, mejor_movimiento):
+        """Guarda el resultado de un nodo aplicando la política de reemplazo."""
+        indice = clave % self.max_entradas
+        existente = self._leer(indice)
+        
+        if existente is not None and existente[0] != clave:
+            if self.politica == "profundidad":
+                profundidad_existente = DATOS.unpack(existente[1].to_bytes(8, "little"))[1]
+                if profundidad_existente > profundidad:
+                    self.descartes += 1
+                    return
+            self.sobrescrituras += 1
+        
+        datos = int.from_bytes(
+            DATOS.pack(valor, profundidad, tipo, _codificar_movimiento(mejor_movimiento)), "little"
+        )
+        REGISTRO.pack_into(self.memoria.buf, indice * REGISTRO.size, clave ^ datos, datos)
+        self.almacenamientos += 1
+    
+    def ocupacion(self):
+        """Retorna la fracción de casillas ocupadas."""
+        ocupadas = sum(1 for _, datos in REGISTRO.iter_unpack(self.memoria.buf) if datos != 0)
+        return ocupadas / self.max_entradas
+    
+    def cerrar(self):
+        """Se desconecta del bloque; la tabla que lo creó además lo libera."""
+        self.memoria.close()
+        if self.propietaria:
+            self.memoria.unlink()
@@ -0,0 +1,43 @@
+# zobrist.py
+"""
+Claves Zobrist para identificar posiciones del tablero.
+Las tablas se generan con una semilla fija para que las claves sean
+estables entre ejecuciones y entre los distintos motores de tablero.
+"""
+import random
+from configuracion import *
+
+
+_generador = random.Random(0x5EED_DA3A5)
+
+# Un número aleatorio de 64 bits por pieza y casilla
+CLAVES_PIEZA = {
+    pieza: [[_generador.getrandbits(64) for _ in range(TABLERO_DIM)] for _ in range(TABLERO_DIM)]
+    for pieza in (JUGADOR_BLANCO, JUGADOR_NEGRO, DAMA_BLANCA, DAMA_NEGRA)
+}
+
+# Se combina con la clave del tablero cuando le toca mover al negro
+CLAVE_TURNO_NEGRO = _generador.getrandbits(64)
+
+
+def clave_pieza(pieza, fila, columna):
+    """Retorna la clave de una pieza en una casilla (0 para casilla vacía)."""
+    if pieza == CELDA_VACIA:
+        return 0
+    return CLAVES_PIEZA[pieza][fila][columna]
+
+
+def calcular_clave(matriz):
+    """Calcula desde cero la clave de una matriz TABLERO_DIM x TABLERO_DIM."""
+    clave = 0
+    for fila in range(TABLERO_DIM):
+        for columna in range(TABLERO_DIM):
+            pieza = matriz[fila][columna]
+            if pieza != CELDA_VACIA:
+                clave ^= CLAVES_PIEZA[pieza][fila][columna]
+    return clave
+
+
+def clave_con_turno(clave, jugador):
+    """Combina la clave de la posición con el jugador que tiene el turno."""
+    return clave ^ CLAVE_TURNO_NEGRO if jugador == JUGADOR_NEGRO else clave